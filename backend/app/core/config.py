@@ -4,6 +4,7 @@ from functools import lru_cache
 from pydantic import Field, BaseModel, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -32,18 +33,88 @@ class Settings(BaseSettings):
     MEDIA_ROOT: str = Field('media', validation_alias='MEDIA_ROOT')   # project root(pland/) 기준
     MEDIA_URL: str = Field('/media', validation_alias='MEDIA_URL')
     MAX_UPLOAD_MB: int = Field(5, validation_alias='MAX_UPLOAD_MB')
+    MAX_IMAGE_PIXELS: int = Field(40_000_000, validation_alias='MAX_IMAGE_PIXELS')  # 업로드 이미지 가로x세로 상한 (헤더에서 바로 거부)
+    UPLOAD_BATCH_MAX_FILES: int = Field(10, validation_alias='UPLOAD_BATCH_MAX_FILES')        # 일괄 업로드 1회 최대 파일 수
+    UPLOAD_BATCH_CONCURRENCY: int = Field(4, validation_alias='UPLOAD_BATCH_CONCURRENCY')     # 일괄 업로드 동시 저장 수
+    UPLOAD_SESSION_TTL_SECONDS: int = Field(60 * 60 * 24, validation_alias='UPLOAD_SESSION_TTL_SECONDS')  # 재개 가능 업로드 세션 유지 시간
+    MEDIA_BACKEND: str = Field('local', validation_alias='MEDIA_BACKEND')             # local | s3 (S3 호환: AWS S3, MinIO 등)
+    MEDIA_PRESIGN_EXPIRES: int = Field(900, validation_alias='MEDIA_PRESIGN_EXPIRES')  # 직접 업로드(presigned PUT) URL 유효 시간(초)
+    S3_ENDPOINT_URL: str = Field('', validation_alias='S3_ENDPOINT_URL')  # 비우면 AWS (https://s3.<region>.amazonaws.com)
+    S3_BUCKET: str = Field('', validation_alias='S3_BUCKET')
+    S3_REGION: str = Field('us-east-1', validation_alias='S3_REGION')
+    S3_ACCESS_KEY: str = Field('', validation_alias='S3_ACCESS_KEY')
+    S3_SECRET_KEY: SecretStr = Field(SecretStr(''), validation_alias='S3_SECRET_KEY')
+    S3_PUBLIC_URL: str = Field('', validation_alias='S3_PUBLIC_URL')  # 이미지 url 기준 주소 (CDN 등), 비우면 <endpoint>/<bucket>
 
-    #DB
-    DB_HOST: str = Field(..., validation_alias='DB_HOST')
+    #DB (엔진은 lifespan 에서 생성 → import 시점에는 접속 정보 없어도 됨)
+    # DATABASE_URL 이 있으면 우선 사용 (예: sqlite+aiosqlite:///./pland.db → MySQL 없이 로컬 실행/벤치마크)
+    DATABASE_URL: Optional[str] = Field(None, validation_alias='DATABASE_URL')
+    DB_CREATE_ALL: bool = Field(False, validation_alias='DB_CREATE_ALL')  # 시작 시 테이블 생성 (SQLite/테스트용)
+    DB_HOST: Optional[str] = Field(None, validation_alias='DB_HOST')
     DB_PORT: int = Field(3306, validation_alias='DB_PORT')
-    DB_USER: str = Field(..., validation_alias='DB_USER')
-    DB_PASSWORD: SecretStr = Field(..., validation_alias='DB_PASSWORD')
-    DB_NAME: str = Field(..., validation_alias='DB_NAME')
+    DB_USER: Optional[str] = Field(None, validation_alias='DB_USER')
+    DB_PASSWORD: SecretStr = Field(SecretStr(''), validation_alias='DB_PASSWORD')
+    DB_NAME: Optional[str] = Field(None, validation_alias='DB_NAME')
 
     DB_POOL_SIZE: int = Field(20, validation_alias='DB_POOL_SIZE')
     DB_MAX_OVERFLOW: int = Field(0, validation_alias='DB_MAX_OVERFLOW')
+    DB_POOL_WARMUP: int = Field(5, validation_alias='DB_POOL_WARMUP')  # 시작 시 엔진별로 미리 열어둘 커넥션 수
     SQL_ECHO: bool = Field(False, validation_alias='SQL_ECHO')
 
+    # Read replica (콤마 구분 "host" 또는 "host:port" 목록, 비우면 primary만 사용)
+    DB_REPLICA_HOSTS: str = Field('', validation_alias='DB_REPLICA_HOSTS')
+    DB_REPLICA_STICKY_SECONDS: float = Field(5.0, validation_alias='DB_REPLICA_STICKY_SECONDS')  # 쓰기 직후 primary 고정 시간
+    DB_REPLICA_RETRY_SECONDS: float = Field(30.0, validation_alias='DB_REPLICA_RETRY_SECONDS')   # 장애 replica 재시도 간격
+
+    # 읽기 전용 세션 (get_read_db) - 트랜잭션 없이 조회
+    DB_READ_ISOLATION_LEVEL: str = Field('AUTOCOMMIT', validation_alias='DB_READ_ISOLATION_LEVEL')  # 또는 READ COMMITTED
+    DB_READ_POOL_SIZE: int = Field(10, validation_alias='DB_READ_POOL_SIZE')  # primary 읽기 전용 풀 크기
+
+    # 쿼리 추적 (N+1 감지 / 느린 쿼리 로그) - 나열된 ENV 에서만 동작
+    DB_QUERY_TRACKER_ENVS: str = Field('development,staging,testing', validation_alias='DB_QUERY_TRACKER_ENVS')
+    DB_NPLUSONE_THRESHOLD: int = Field(5, validation_alias='DB_NPLUSONE_THRESHOLD')  # 요청 당 같은 모양 쿼리 허용 횟수
+    DB_SLOW_QUERY_MS: float = Field(200.0, validation_alias='DB_SLOW_QUERY_MS')      # 0이면 느린 쿼리 로그 끔
+    DB_QUERY_STRICT: bool = Field(False, validation_alias='DB_QUERY_STRICT')         # True면 N+1 감지 시 예외(테스트용)
+
+    # ML 추론 (모델 경로는 ML_MODELS_DIR 기준 상대 경로)
+    ML_MODELS_DIR: str = Field('models', validation_alias='ML_MODELS_DIR')  # project root(pland/) 기준
+    ML_BATCH_MAX_SIZE: int = Field(16, validation_alias='ML_BATCH_MAX_SIZE')          # 마이크로배치 최대 크기
+    ML_BATCH_MAX_WAIT_MS: float = Field(10.0, validation_alias='ML_BATCH_MAX_WAIT_MS')  # 첫 요청 후 배치 모으는 최대 대기
+    ML_QUEUE_MAX: int = Field(256, validation_alias='ML_QUEUE_MAX')                    # 대기열 초과 시 503
+    ML_INTRA_OP_THREADS: int = Field(0, validation_alias='ML_INTRA_OP_THREADS')        # 0이면 런타임 기본값
+    ML_WARMUP_MODELS: str = Field('', validation_alias='ML_WARMUP_MODELS')  # 시작 시 미리 로드할 모델 (예: species,pest)
+    ML_CACHE_MAX_ENTRIES: int = Field(10000, validation_alias='ML_CACHE_MAX_ENTRIES')  # 추론 결과 캐시 (이미지 해시 + 모델 버전)
+    ML_CACHE_MAX_MB: int = Field(64, validation_alias='ML_CACHE_MAX_MB')
+    ML_CACHE_DIR: str = Field('', validation_alias='ML_CACHE_DIR')  # 디스크 캐시 폴더 (비우면 메모리만)
+    ML_CACHE_DISK_MB: int = Field(512, validation_alias='ML_CACHE_DISK_MB')  # 디스크 캐시 상한 (넘으면 오래된 파일부터 삭제, 0 이면 무제한)
+    ML_ADMIN_TOKEN: str = Field('', validation_alias='ML_ADMIN_TOKEN')      # 모델 교체 API 토큰 (비우면 비활성)
+    METRICS_TOKEN: str = Field('', validation_alias='METRICS_TOKEN')        # /metrics API 토큰 (X-Metrics-Token, 비우면 비활성)
+    SPECIES_MODEL: str = Field('classifier/species.onnx', validation_alias='SPECIES_MODEL')  # .onnx 또는 .npz
+    SPECIES_LABELS: str = Field('classifier/species_labels.txt', validation_alias='SPECIES_LABELS')
+    SPECIES_INPUT_SIZE: int = Field(224, validation_alias='SPECIES_INPUT_SIZE')
+    SPECIES_TOP_K: int = Field(3, validation_alias='SPECIES_TOP_K')
+    PEST_MODEL: str = Field('detector/pest.onnx', validation_alias='PEST_MODEL')          # .onnx 또는 .npz
+    PEST_LABELS: str = Field('detector/pest_labels.txt', validation_alias='PEST_LABELS')  # 클래스 순서대로 PestWiki.pest_id
+    PEST_INPUT_SIZE: int = Field(640, validation_alias='PEST_INPUT_SIZE')
+    PEST_SCORE_THRESHOLD: float = Field(0.5, validation_alias='PEST_SCORE_THRESHOLD')
+    PEST_WORKERS: int = Field(0, validation_alias='PEST_WORKERS')                         # 0이면 CPU 코어 수
+    PEST_JOB_TTL_SECONDS: int = Field(3600, validation_alias='PEST_JOB_TTL_SECONDS')      # 완료 job 보관 시간
+    LLM_MODEL: str = Field('', validation_alias='LLM_MODEL')                              # .gguf (비우면 로컬 대체 모델)
+    LLM_MAX_TOKENS: int = Field(512, validation_alias='LLM_MAX_TOKENS')
+    LLM_CONTEXT_TOKENS: int = Field(4096, validation_alias='LLM_CONTEXT_TOKENS')
+    LLM_MAX_CONCURRENT: int = Field(2, validation_alias='LLM_MAX_CONCURRENT')             # 동시에 생성하는 답변 수
+    LLM_QUEUE_MAX: int = Field(16, validation_alias='LLM_QUEUE_MAX')                      # 생성 대기열 초과 시 503
+    LLM_STANDIN_TOKEN_MS: float = Field(20.0, validation_alias='LLM_STANDIN_TOKEN_MS')    # 대체 모델 토큰 간 지연
+    RETRIEVAL_TOP_K: int = Field(3, validation_alias='RETRIEVAL_TOP_K')                   # 답변 근거로 붙일 위키 문서 수
+    RETRIEVAL_DIM: int = Field(1024, validation_alias='RETRIEVAL_DIM')                    # 해시 벡터 차원 (코사인 검색)
+    PLANT_CONTENT_ENABLED: bool = Field(True, validation_alias='PLANT_CONTENT_ENABLED')   # Diary.plant_content 백그라운드 생성
+    PLANT_CONTENT_BATCH_SIZE: int = Field(8, validation_alias='PLANT_CONTENT_BATCH_SIZE')
+    PLANT_CONTENT_MAX_TOKENS: int = Field(200, validation_alias='PLANT_CONTENT_MAX_TOKENS')
+    PLANT_CONTENT_MAX_ATTEMPTS: int = Field(5, validation_alias='PLANT_CONTENT_MAX_ATTEMPTS')
+    PLANT_CONTENT_RETRY_SECONDS: float = Field(30.0, validation_alias='PLANT_CONTENT_RETRY_SECONDS')  # 재시도 간격 (지수 백오프 시작값)
+    PLANT_CONTENT_LEASE_SECONDS: float = Field(300.0, validation_alias='PLANT_CONTENT_LEASE_SECONDS')  # 선점 후 완료 못 하면 재선점
+    PLANT_CONTENT_POLL_SECONDS: float = Field(30.0, validation_alias='PLANT_CONTENT_POLL_SECONDS')    # 새 job 알림이 없을 때 확인 주기
+
     @property
     def ROOT_DIR(self) -> Path:
         # .../pland/backend/app/config.py -> parents[2] == project root "pland"
@@ -2,47 +2,318 @@
 
 from __future__ import annotations
 
-from typing import AsyncGenerator
+import asyncio
+import hashlib
+import itertools
+import logging
+import time
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Set, Tuple
 from urllib.parse import quote_plus
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, configure_mappers
 from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
 
 from backend.app.core.config import settings
+from backend.app.core import query_tracker
+from backend.app.core.db_metrics import instrument_engine, mark_bind_requested
+
+logger = logging.getLogger(__name__)
 
 # MySQL 연결 URL 생성
-def _make_mysql_async_url() -> str:
+def _make_mysql_async_url(host: Optional[str] = None, port: Optional[int] = None) -> str:
     # url 인코딩
-    user = quote_plus(settings.DB_USER)
+    user = quote_plus(settings.DB_USER or "")
     pwd = quote_plus(settings.DB_PASSWORD.get_secret_value())
-    host = settings.DB_HOST
-    port = settings.DB_PORT
+    host = host or settings.DB_HOST
+    port = port or settings.DB_PORT
     db = settings.DB_NAME
     # utf8mb4 설정 + SQLAlchemy 2.0 방식 url
     return f"mysql+aiomysql://{user}:{pwd}@{host}:{port}/{db}?charset=utf8mb4"
 
-# SQLAlchemy 비동기 엔진 생성
-engine = create_async_engine(
-    _make_mysql_async_url(),
-    echo=settings.SQL_ECHO,
-    pool_pre_ping=True,  # 커넥션 풀 유효성 검사(커넥션이 끊어졌을 때 재연결)
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    future=True,
-)
 
-# 세션 팩토리 (요청 당 1세션)
+def _database_url() -> str:
+    return settings.DATABASE_URL or _make_mysql_async_url()
+
+
+def is_sqlite() -> bool:
+    return make_url(_database_url()).get_backend_name() == "sqlite"
+
+
+def _enable_sqlite_fk(dbapi_conn, conn_record) -> None:
+    # SQLite 는 커넥션마다 FK 제약(ON DELETE CASCADE 등)을 켜줘야 함
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _create_engine(url: str, label: str, **overrides) -> AsyncEngine:
+    options = dict(
+        echo=settings.SQL_ECHO,
+        pool_pre_ping=True,  # 커넥션 풀 유효성 검사(커넥션이 끊어졌을 때 재연결)
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        future=True,
+    )
+    options.update(overrides)
+    sqlite = make_url(url).get_backend_name() == "sqlite"
+    if sqlite:
+        # SQLite 는 드라이버 기본 풀 사용 (in-memory 는 StaticPool: 풀 크기 옵션 불가)
+        for key in ("pool_pre_ping", "pool_size", "max_overflow", "pool_reset_on_return", "isolation_level"):
+            options.pop(key, None)
+    new_engine = create_async_engine(url, **options)
+    if sqlite:
+        event.listen(new_engine.sync_engine, "connect", _enable_sqlite_fk)
+    instrument_engine(new_engine, label)  # 풀/쿼리 계측 리스너
+    return new_engine
+
+
+def _parse_replica_hosts(raw: str) -> List[Tuple[str, int]]:
+    """ "db-r1:3306, db-r2" -> [("db-r1", 3306), ("db-r2", DB_PORT)] """
+    hosts: List[Tuple[str, int]] = []
+    for part in (raw or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        host, _, port = part.partition(":")
+        hosts.append((host, int(port) if port else settings.DB_PORT))
+    return hosts
+
+
+def _read_only_options(pool_size: int) -> dict:
+    """
+    읽기 전용 풀 옵션: 커넥션을 처음부터 가벼운 격리수준(기본 AUTOCOMMIT)으로 열어
+    체크아웃마다 격리수준을 바꾸지 않고, AUTOCOMMIT 이면 반납 시 ROLLBACK 도 생략.
+    """
+    isolation = settings.DB_READ_ISOLATION_LEVEL
+    return {
+        "isolation_level": isolation,
+        "pool_size": pool_size,
+        "pool_reset_on_return": None if isolation.upper() == "AUTOCOMMIT" else "rollback",
+    }
+
+
+# 엔진은 import 시점이 아니라 init_engines() (앱 lifespan 또는 첫 세션 사용 시) 에서 생성
+engine: Optional[AsyncEngine] = None          # primary: 모든 쓰기
+read_engine: Optional[AsyncEngine] = None     # primary 읽기 전용 (replica 미설정/장애/쓰기 직후 조회용)
+replica_engines: List[AsyncEngine] = []       # 읽기 전용 replica (설정이 없으면 빈 리스트 → read_engine 사용)
+
+
+def db_configured() -> bool:
+    return bool(settings.DATABASE_URL or (settings.DB_HOST and settings.DB_USER and settings.DB_NAME))
+
+
+def init_engines() -> AsyncEngine:
+    """엔진 생성 (최초 1회, 이후 호출은 기존 primary 반환)"""
+    global engine, read_engine
+    if engine is not None:
+        return engine
+    if not db_configured():
+        raise RuntimeError("database is not configured (DATABASE_URL or DB_HOST / DB_USER / DB_NAME)")
+
+    primary_url = _database_url()
+    if is_sqlite():
+        # SQLite: 단일 파일/메모리 DB → 읽기도 같은 엔진 사용 (replica 설정 무시)
+        engine = _create_engine(primary_url, "primary")
+        read_engine = engine
+        return engine
+
+    read_engine = _create_engine(primary_url, "primary-read", **_read_only_options(settings.DB_READ_POOL_SIZE))
+    replica_engines[:] = [
+        _create_engine(_make_mysql_async_url(host, port), f"replica-{i}", **_read_only_options(settings.DB_POOL_SIZE))
+        for i, (host, port) in enumerate(_parse_replica_hosts(settings.DB_REPLICA_HOSTS))
+    ]
+    for idx, replica in enumerate(replica_engines):
+        _watch_replica(idx, replica)
+    _replica_down_until.clear()
+    engine = _create_engine(primary_url, "primary")
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    return engine if engine is not None else init_engines()
+
+
+def get_read_engine() -> AsyncEngine:
+    get_engine()
+    return read_engine  # type: ignore[return-value]
+
+
+async def dispose_engines() -> None:
+    global engine, read_engine
+    targets = list({id(e): e for e in (engine, read_engine, *replica_engines) if e is not None}.values())
+    engine, read_engine = None, None
+    replica_engines.clear()
+    await asyncio.gather(*(e.dispose() for e in targets))
+
+
+# -----------------------
+# Replica 선택 / 장애 감지
+# -----------------------
+_replica_rr = itertools.count()
+_replica_down_until: Dict[int, float] = {}  # replica index -> 재시도 가능 시각(monotonic)
+
+
+def _pick_replica() -> Optional[AsyncEngine]:
+    """라운드로빈으로 정상 replica 선택. 모두 장애면 None(→ primary 사용)."""
+    n = len(replica_engines)
+    if n == 0:
+        return None
+    now = time.monotonic()
+    start = next(_replica_rr)
+    for i in range(n):
+        idx = (start + i) % n
+        if _replica_down_until.get(idx, 0.0) <= now:
+            return replica_engines[idx]
+    return None
+
+
+def _mark_replica_down(idx: int) -> None:
+    _replica_down_until[idx] = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+
+
+def _watch_replica(idx: int, replica: AsyncEngine) -> None:
+    @event.listens_for(replica.sync_engine, "handle_error")
+    def _on_error(context) -> None:
+        # 접속 실패(connection 없음) 또는 끊김 → 일정 시간 primary로 우회
+        if context.connection is None or context.is_disconnect:
+            _mark_replica_down(idx)
+
+
+
+# -----------------------
+# Read-your-writes 고정(sticky)
+# -----------------------
+_LAST_WRITE_AT: Dict[str, float] = {}  # sticky key -> 마지막 쓰기 시각(monotonic)
+_STICKY_MAX_KEYS = 10_000
+
+
+def _sticky_key(request: Request) -> Optional[str]:
+    """같은 사용자 세션 식별용 키 (Authorization 헤더 해시). 인증 없으면 None."""
+    auth = request.headers.get("authorization")
+    if not auth:
+        return None
+    return hashlib.sha256(auth.encode("utf-8")).hexdigest()
+
+
+def _remember_write(key: Optional[str]) -> None:
+    if key is None or not replica_engines:
+        return
+    now = time.monotonic()
+    if len(_LAST_WRITE_AT) >= _STICKY_MAX_KEYS:
+        # 고정 시간이 지난 키 정리
+        expired = now - settings.DB_REPLICA_STICKY_SECONDS
+        for k in [k for k, t in _LAST_WRITE_AT.items() if t < expired]:
+            _LAST_WRITE_AT.pop(k, None)
+    _LAST_WRITE_AT[key] = now
+
+
+def _is_sticky(key: Optional[str]) -> bool:
+    if key is None:
+        return False
+    wrote_at = _LAST_WRITE_AT.get(key)
+    return wrote_at is not None and time.monotonic() - wrote_at < settings.DB_REPLICA_STICKY_SECONDS
+
+
+# -----------------------
+# 세션
+# -----------------------
+class ReadOnlySessionError(RuntimeError):
+    """읽기 전용 세션(get_read_db)에서 쓰기를 시도한 경우"""
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용 세션(info["read_only"])은 선택된 replica 또는 primary 읽기 전용 풀로,
+    일반 세션은 primary로 보냄.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        mark_bind_requested()
+        if self.info.get("read_only"):
+            replica: Optional[AsyncEngine] = self.info.get("replica")
+            return (replica or get_read_engine()).sync_engine
+        return get_engine().sync_engine
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _guard_read_only_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get("read_only"):
+        raise ReadOnlySessionError("read-only session cannot flush; use get_db for writes")
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush_write(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_dml_write(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        if orm_execute_state.session.info.get("read_only"):
+            raise ReadOnlySessionError("read-only session cannot write; use get_db for writes")
+        orm_execute_state.session.info["wrote"] = True
+
+
+# -----------------------
+# 커밋 후 변경 알림 (인메모리 인덱스 갱신용)
+# -----------------------
+ChangedRows = Set[Tuple[str, int]]
+_commit_hooks: List[Callable[[ChangedRows], None]] = []
+
+
+def track_change(db: AsyncSession, table: str, idx: int) -> None:
+    """crud 쓰기 함수에서 호출. 커밋되면 on_commit 훅에 (테이블명, idx) 전달, 롤백되면 버림."""
+    db.info.setdefault("changed_rows", set()).add((table, idx))
+
+
+def on_commit(hook: Callable[[ChangedRows], None]) -> None:
+    if hook not in _commit_hooks:
+        _commit_hooks.append(hook)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _notify_commit(session: Session) -> None:
+    changed = session.info.pop("changed_rows", None)
+    if not changed:
+        return
+    for hook in list(_commit_hooks):
+        try:
+            hook(changed)
+        except Exception:
+            logger.exception("commit hook failed")
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop("changed_rows", None)
+
+
+# 세션 팩토리 (요청 당 1세션, 바인드는 RoutingSession.get_bind 에서 결정)
 AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    autoflush=False,
+    autocommit=False,
+)
+
+# 읽기 전용 세션 팩토리 (commit/flush 없음)
+ReadSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
     class_=AsyncSession,
     autoflush=False,
     autocommit=False,
+    info={"read_only": True},
 )
 
 
@@ -51,15 +322,84 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+def import_models() -> None:
+    """모든 모델을 Base.metadata 에 등록 (models 패키지가 core.database 를 import 하므로 지연 import)"""
+    import backend.app.db.models  # noqa: F401
+
+
+async def create_all() -> None:
+    """모든 테이블 생성 (SQLite 로컬 실행/벤치마크/테스트용, 이미 있으면 건너뜀)"""
+    import_models()
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
         FastAPI 의존성(Dependency) 주입용 세션 생성기.
-        요청 당 1세션이 생성되어 반환됨.
+        요청 당 1세션이 생성되어 반환됨. (primary 사용)
     """
-    async with AsyncSessionLocal() as session:
-        try:
+    with query_tracker.track(request):
+        async with AsyncSessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+    if session.info.get("wrote"):
+        # 이후 같은 사용자의 읽기는 잠시 primary로 (replica 복제 지연 대비)
+        _remember_write(_sticky_key(request))
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+        조회 전용 엔드포인트(대시보드/위키/목록)용 세션 생성기.
+        - replica가 설정되어 있으면 replica에서 읽고, 없거나 장애이거나
+          같은 사용자가 방금 쓰기를 했다면 primary 읽기 전용 풀에서 읽음.
+        - replica 를 고르면 먼저 커넥션을 확보해 보고, 접속 실패 시 그 요청부터 primary 로 전환
+          (장애 후 첫 조회도 500 없이 응답). primary 읽기는 첫 쿼리 실행 시점에만 체크아웃.
+        - 읽기 전용 격리수준(기본 AUTOCOMMIT) → BEGIN/COMMIT 왕복 없음, commit/flush 생략.
+        - 쓰기 시도 시 ReadOnlySessionError.
+    """
+    replica = None if _is_sticky(_sticky_key(request)) else _pick_replica()
+    with query_tracker.track(request):
+        async with ReadSessionLocal() as session:
+            session.info["replica"] = replica
+            if replica is not None:
+                try:
+                    await session.connection()  # pool_pre_ping 포함 → 죽은 replica 는 여기서 드러남
+                except (DBAPIError, OSError) as e:
+                    logger.warning("replica unavailable, reading from primary: %s", e)
+                    await session.rollback()
+                    _mark_replica_down(replica_engines.index(replica))
+                    session.info["replica"] = None
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
\ No newline at end of file
+
+
+# -----------------------
+# 시작 시 워밍업
+# -----------------------
+async def _warm_pool(target: AsyncEngine, connections: int) -> None:
+    """커넥션 n개를 동시에 열었다가 반납 → 풀에 유지되어 첫 요청이 접속 비용을 내지 않음"""
+    results = await asyncio.gather(*(target.connect() for _ in range(connections)), return_exceptions=True)
+    opened = [r for r in results if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in opened))
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+
+
+async def warm_up() -> None:
+    """
+        lifespan 시작 단계에서 호출.
+        엔진 생성 → 엔진별 DB_POOL_WARMUP 개 커넥션 선개방 → ORM 매퍼 구성(첫 쿼리 비용 선지불).
+    """
+    init_engines()
+    targets = list({id(e): e for e in (engine, read_engine, *replica_engines) if e is not None}.values())
+    for target in targets:
+        size = target.sync_engine.pool.size() if hasattr(target.sync_engine.pool, "size") else 1
+        await _warm_pool(target, max(0, min(settings.DB_POOL_WARMUP, size)))
+    import_models()
+    configure_mappers()
+    logger.info("database warm-up done (%d engines)", len(targets))
@@ -0,0 +1,166 @@
+# DB 커넥션 풀 / 쿼리 계측 (sqlalchemy.event 기반)
+
+from __future__ import annotations
+
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.app.core import query_tracker
+from backend.app.utils.metrics import COUNT_BUCKETS, HistogramFamily
+
+# -----------------------
+# 메트릭 저장소
+# -----------------------
+POOL_WAIT_MS = HistogramFamily()                      # engine label -> 커넥션 획득 대기(ms)
+STATEMENT_MS = HistogramFamily(max_labels=500)        # 정규화 SQL -> 실행 시간(ms)
+REQUEST_QUERIES = HistogramFamily(COUNT_BUCKETS)      # route -> 요청 당 쿼리 수
+REQUEST_DB_MS = HistogramFamily()                     # route -> 요청 당 DB 시간 합(ms)
+
+_ENGINES: Dict[str, AsyncEngine] = {}
+_POOL_COUNTERS: Dict[str, Dict[str, int]] = {}        # engine label -> connect/close/invalidate/checkout/checkin
+
+
+@dataclass
+class RequestDBStats:
+    """요청 1건 동안의 DB 사용량"""
+    queries: int = 0
+    db_ms: float = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("db_request_stats", default=None)
+_bind_requested_at: ContextVar[Optional[float]] = ContextVar("db_bind_requested_at", default=None)
+
+
+def current_request_stats() -> Optional[RequestDBStats]:
+    return _request_stats.get()
+
+
+def mark_bind_requested() -> None:
+    """세션이 커넥션을 요청하기 직전 호출 (RoutingSession.get_bind) → checkout 까지의 대기시간 측정 기준"""
+    _bind_requested_at.set(time.perf_counter())
+
+
+# -----------------------
+# SQL 정규화
+# -----------------------
+_WS_RE = re.compile(r"\s+")
+_STR_RE = re.compile(r"'(?:[^']|'')*'")
+_NUM_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_LIST_RE = re.compile(r"\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*\)")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """리터럴/IN 목록 길이를 지워 같은 모양의 쿼리를 하나로 묶음"""
+    s = _WS_RE.sub(" ", statement).strip()
+    s = _STR_RE.sub("?", s)
+    s = _NUM_RE.sub("?", s)
+    s = _PARAM_LIST_RE.sub("(?, ...)", s)
+    return s
+
+
+# -----------------------
+# 이벤트 리스너
+# -----------------------
+def instrument_engine(engine: AsyncEngine, label: str) -> None:
+    """엔진(풀 포함)에 계측 리스너 부착. 엔진 생성 직후 1회 호출."""
+    if _ENGINES.get(label) is engine:
+        return
+    _ENGINES[label] = engine
+    counters = _POOL_COUNTERS.setdefault(
+        label, {"connect": 0, "close": 0, "invalidate": 0, "checkout": 0, "checkin": 0}
+    )
+    sync_engine = engine.sync_engine
+    pool_wait = POOL_WAIT_MS.labels(label)
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_conn, conn_record) -> None:
+        counters["connect"] += 1
+
+    @event.listens_for(sync_engine, "close")
+    def _on_close(dbapi_conn, conn_record) -> None:
+        counters["close"] += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_conn, conn_record, exception) -> None:
+        counters["invalidate"] += 1
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_conn, conn_record, conn_proxy) -> None:
+        counters["checkout"] += 1
+        started = _bind_requested_at.get()
+        if started is not None:
+            pool_wait.observe((time.perf_counter() - started) * 1000.0)
+            _bind_requested_at.set(None)
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_conn, conn_record) -> None:
+        counters["checkin"] += 1
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        # 커넥션 획득 없이 실행되는 경우 대기 기준 시각 폐기
+        _bind_requested_at.set(None)
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000.0
+        shape = normalize_sql(statement)
+        STATEMENT_MS.observe(shape, elapsed_ms)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_ms += elapsed_ms
+        query_tracker.observe(shape, elapsed_ms)
+
+
+# -----------------------
+# 요청 단위 집계 미들웨어
+# -----------------------
+def register_db_metrics(app: FastAPI) -> None:
+    @app.middleware("http")
+    async def db_request_stats(request: Request, call_next):
+        stats = RequestDBStats()
+        token = _request_stats.set(stats)
+        try:
+            response = await call_next(request)
+        finally:
+            _request_stats.reset(token)
+        route = request.scope.get("route")
+        label = getattr(route, "path", None) or request.url.path
+        REQUEST_QUERIES.observe(label, stats.queries)
+        REQUEST_DB_MS.observe(label, stats.db_ms)
+        response.headers["X-DB-Query-Count"] = str(stats.queries)
+        return response
+
+
+def _pool_status(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.sync_engine.pool
+    out: Dict[str, Any] = {"class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        fn = getattr(pool, name, None)
+        if callable(fn):
+            out[name] = fn()
+    return out
+
+
+def snapshot() -> Dict[str, Any]:
+    return {
+        "pools": {
+            label: {**_pool_status(e), "events": dict(_POOL_COUNTERS.get(label, {}))}
+            for label, e in _ENGINES.items()
+        },
+        "pool_wait_ms": POOL_WAIT_MS.snapshot(),
+        "statements_ms": STATEMENT_MS.snapshot(),
+        "request_queries": REQUEST_QUERIES.snapshot(),
+        "request_db_ms": REQUEST_DB_MS.snapshot(),
+    }
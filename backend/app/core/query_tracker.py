@@ -0,0 +1,87 @@
+# 요청 단위 쿼리 추적기 (N+1 감지 + 느린 쿼리 로그, 개발/스테이징 전용)
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Set
+
+from fastapi import Request
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class NPlusOneError(RuntimeError):
+    """strict 모드에서 같은 모양의 쿼리가 임계치를 넘으면 발생 (테스트 실패용)"""
+
+
+class QueryTracker:
+    """
+    한 요청 동안 실행된 쿼리를 정규화된 모양(shape)별로 세어
+    임계치(DB_NPLUSONE_THRESHOLD)를 넘는 반복을 N+1 의심으로 보고함.
+    """
+
+    def __init__(self, route: str, *, threshold: int, slow_ms: float, strict: bool):
+        self.route = route
+        self.threshold = threshold
+        self.slow_ms = slow_ms
+        self.strict = strict
+        self.shapes: Counter[str] = Counter()
+        self.flagged: Set[str] = set()
+
+    def record(self, shape: str, elapsed_ms: float) -> None:
+        self.shapes[shape] += 1
+        if self.slow_ms and elapsed_ms > self.slow_ms:
+            logger.warning("slow query %.1fms route=%s sql=%s", elapsed_ms, self.route, shape)
+
+        count = self.shapes[shape]
+        if count > self.threshold and shape not in self.flagged:
+            self.flagged.add(shape)
+            message = f"possible N+1: {count} x same query in route={self.route} sql={shape}"
+            if self.strict:
+                raise NPlusOneError(message)
+            logger.warning(message)
+
+
+_current: ContextVar[Optional[QueryTracker]] = ContextVar("query_tracker", default=None)
+
+
+def enabled() -> bool:
+    envs = {e.strip() for e in settings.DB_QUERY_TRACKER_ENVS.split(",") if e.strip()}
+    return settings.ENV in envs
+
+
+def observe(shape: str, elapsed_ms: float) -> None:
+    """db_metrics 의 after_cursor_execute 에서 호출"""
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.record(shape, elapsed_ms)
+
+
+@contextmanager
+def track(request: Request) -> Iterator[Optional[QueryTracker]]:
+    """
+    get_db / get_read_db 세션 수명 동안 추적기 활성화.
+    같은 요청에서 세션이 여러 개면 먼저 만든 추적기를 공유함.
+    """
+    existing = _current.get()
+    if existing is not None or not enabled():
+        yield existing
+        return
+
+    route = request.scope.get("route")
+    tracker = QueryTracker(
+        f"{request.method} {getattr(route, 'path', None) or request.url.path}",
+        threshold=settings.DB_NPLUSONE_THRESHOLD,
+        slow_ms=settings.DB_SLOW_QUERY_MS,
+        strict=settings.DB_QUERY_STRICT,
+    )
+    token = _current.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current.reset(token)
@@ -1,11 +1,13 @@
 from __future__ import annotations
+from datetime import datetime, timezone
 from typing import Optional, Sequence
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import Row, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db.models.diary import Diary
+from backend.app.db.crud import plant_content_job
+from backend.app.db.models.diary import Diary
 
 
 async def get(db: AsyncSession, diary_id: int) -> Optional[Diary]:
@@ -41,6 +43,9 @@ async def create(
     )
     db.add(d)
     await db.flush()
+    if plant_content is None:
+        # 식물 시점 글은 백그라운드에서 생성 (같은 트랜잭션에 job 등록 → 작성 응답은 INSERT 2건으로 끝)
+        await plant_content_job.enqueue(db, d.diary_id, now=datetime.now(timezone.utc).replace(tzinfo=None))
     return d
 
 
@@ -77,3 +82,44 @@ async def list_by_user_cursor(
     return rows
 
 
+# 피드용 컬럼 (DiaryOut 필드와 동일한 이름, images 관계는 제외)
+ROW_COLUMNS = (
+    Diary.diary_id,
+    Diary.user_id,
+    Diary.user_title,
+    Diary.img_url,
+    Diary.user_content,
+    Diary.hashtag,
+    Diary.plant_content,
+    Diary.weather,
+    Diary.created_at,
+)
+
+
+async def list_rows_by_user_cursor(
+    db: AsyncSession,
+    *,
+    user_id: str,
+    limit: int,
+    last_diary_id: int | None,
+) -> Sequence[Row]:
+    """
+    다이어리 피드용 Core Row 목록 (DiaryOut.from_rows 용).
+    selectinload(images) 없이 대표 이미지(img_url)만 포함.
+    """
+    stmt = (
+        select(*ROW_COLUMNS)
+        .where(Diary.user_id == user_id)
+        .order_by(Diary.diary_id.desc())
+        .limit(limit + 1)
+    )
+    if last_diary_id is not None:
+        stmt = stmt.where(Diary.diary_id < last_diary_id)
+    return (await db.execute(stmt)).all()
+
+
+async def list_rows_by_ids(db: AsyncSession, diary_ids: Sequence[int]) -> Sequence[Row]:
+    """diary_id 목록으로 Core Row 조회 (plant_content 배치 생성용)"""
+    if not diary_ids:
+        return []
+    return (await db.execute(select(*ROW_COLUMNS).where(Diary.diary_id.in_(list(diary_ids))))).all()
@@ -2,10 +2,10 @@ from __future__ import annotations
 from typing import Optional, Sequence
 from datetime import datetime
 
-from sqlalchemy import select, delete, and_
+from sqlalchemy import Row, select, delete, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.humid_info import HumidInfo
+from backend.app.db.models.humid_info import HumidInfo
 
 
 async def get_one(db: AsyncSession, plant_id: int, humid_date: datetime) -> Optional[HumidInfo]:
@@ -58,6 +58,29 @@ async def list_by_plant_cursor(
     return rows
 
 
+# 목록용 컬럼 (HumidInfoOut 필드와 동일한 이름)
+ROW_COLUMNS = (HumidInfo.plant_id, HumidInfo.humid_date, HumidInfo.humidity)
+
+
+async def list_rows_by_plant_cursor(
+    db: AsyncSession,
+    *,
+    plant_id: int,
+    limit: int,
+    last_time: datetime | None,
+) -> Sequence[Row]:
+    """list_by_plant_cursor 와 같은 조건, ORM 엔티티 대신 Core Row 반환 (HumidInfoOut.from_rows 용)"""
+    stmt = (
+        select(*ROW_COLUMNS)
+        .where(HumidInfo.plant_id == plant_id)
+        .order_by(HumidInfo.humid_date.desc())
+        .limit(limit + 1)
+    )
+    if last_time is not None:
+        stmt = stmt.where(HumidInfo.humid_date < last_time)
+    return (await db.execute(stmt)).all()
+
+
 async def delete_one(db: AsyncSession, plant_id: int, humid_date: datetime) -> int:
     res = await db.execute(
         delete(HumidInfo).where(
@@ -5,7 +5,7 @@ from sqlalchemy import select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db.models.img_address import ImgAddress
+from backend.app.db.models.img_address import ImgAddress
 
 
 async def add_image_url(
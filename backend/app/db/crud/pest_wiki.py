@@ -1,10 +1,11 @@
 from __future__ import annotations
 from typing import Optional, Sequence
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import Row, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.pest_wiki import PestWiki
+from backend.app.core.database import track_change
+from backend.app.db.models.pest_wiki import PestWiki
 
 
 async def get(db: AsyncSession, idx: int) -> Optional[PestWiki]:
@@ -17,21 +18,32 @@ async def get_by_pest_id(db: AsyncSession, pest_id: int) -> Optional[PestWiki]:
     return res.scalar_one_or_none()
 
 
+async def list_by_pest_ids(db: AsyncSession, pest_ids: Sequence[int]) -> Sequence[PestWiki]:
+    """여러 병해충을 한 번에 조회 (진단 결과 → 위키 매핑용)"""
+    if not pest_ids:
+        return []
+    res = await db.execute(select(PestWiki).where(PestWiki.pest_id.in_(list(pest_ids))))
+    return res.scalars().all()
+
+
 async def create(db: AsyncSession, **fields) -> PestWiki:
     row = PestWiki(**fields)
     db.add(row)
     await db.flush()
+    track_change(db, "pest_wiki", row.idx)
     return row
 
 
 async def patch(db: AsyncSession, idx: int, **fields) -> Optional[PestWiki]:
     if fields:
         await db.execute(update(PestWiki).where(PestWiki.idx == idx).values(**fields))
+        track_change(db, "pest_wiki", idx)
     return await get(db, idx)
 
 
 async def delete_one(db: AsyncSession, idx: int) -> int:
     res = await db.execute(delete(PestWiki).where(PestWiki.idx == idx))
+    track_change(db, "pest_wiki", idx)
     return res.rowcount or 0
 
 
@@ -46,3 +58,32 @@ async def list_by_cursor(
         stmt = stmt.where(PestWiki.idx < last_idx)
     rows = (await db.execute(stmt)).scalars().all()
     return rows
+
+
+# 목록용 컬럼 (PestWikiOut 필드와 동일한 이름)
+ROW_COLUMNS = (
+    PestWiki.idx,
+    PestWiki.pest_id,
+    PestWiki.cause,
+    PestWiki.cure,
+)
+
+
+async def list_rows_by_cursor(
+    db: AsyncSession,
+    *,
+    limit: int,
+    last_idx: int | None,
+) -> Sequence[Row]:
+    """list_by_cursor 와 같은 조건, Core Row 반환 (PestWikiOut.from_rows 용)"""
+    stmt = select(*ROW_COLUMNS).order_by(PestWiki.idx.desc()).limit(limit + 1)
+    if last_idx is not None:
+        stmt = stmt.where(PestWiki.idx < last_idx)
+    return (await db.execute(stmt)).all()
+
+
+async def list_rows_by_ids(db: AsyncSession, ids: Sequence[int]) -> Sequence[Row]:
+    """idx 목록으로 Core Row 조회 (검색 인덱스 증분 갱신용)"""
+    if not ids:
+        return []
+    return (await db.execute(select(*ROW_COLUMNS).where(PestWiki.idx.in_(list(ids))))).all()
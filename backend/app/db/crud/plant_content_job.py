@@ -0,0 +1,73 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Sequence
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.database import track_change
+from backend.app.db.models.plant_content_job import PlantContentJob
+
+
+async def enqueue(db: AsyncSession, diary_id: int, *, now: datetime) -> PlantContentJob:
+    job = PlantContentJob(diary_id=diary_id, status="pending", attempts=0, next_run_at=now, created_at=now)
+    db.add(job)
+    await db.flush()
+    track_change(db, "plant_content_job", job.idx)  # 커밋 후 워커 깨우기
+    return job
+
+
+async def claim_due(db: AsyncSession, *, now: datetime, limit: int, lease_seconds: float) -> Sequence[PlantContentJob]:
+    """
+    실행할 job 을 최대 limit 개 가져와 running 으로 표시 (lease 만료 시 다른 워커가 다시 가져감).
+    SKIP LOCKED: 여러 프로세스가 동시에 가져가도 같은 job 을 중복 처리하지 않음 (SQLite 는 무시).
+    반환 객체의 status/attempts/next_run_at 은 갱신된 값 (ORM update 가 세션 객체에 반영).
+    """
+    stmt = (
+        select(PlantContentJob)
+        .where(PlantContentJob.next_run_at <= now)
+        .order_by(PlantContentJob.next_run_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    jobs = (await db.execute(stmt)).scalars().all()
+    if jobs:
+        await db.execute(
+            update(PlantContentJob)
+            .where(PlantContentJob.idx.in_([j.idx for j in jobs]))
+            .values(
+                status="running",
+                attempts=PlantContentJob.attempts + 1,
+                next_run_at=now + timedelta(seconds=lease_seconds),
+            )
+        )
+    return jobs
+
+
+async def delete_done(db: AsyncSession, idxs: Sequence[int]) -> int:
+    if not idxs:
+        return 0
+    res = await db.execute(delete(PlantContentJob).where(PlantContentJob.idx.in_(list(idxs))))
+    return res.rowcount or 0
+
+
+async def mark_retry(
+    db: AsyncSession,
+    idx: int,
+    *,
+    error: str,
+    attempts: int,
+    next_run_at: datetime | None,
+) -> None:
+    """next_run_at=None 이면 재시도 횟수 초과 → failed (대기열에서 제외, 기록은 남김)"""
+    await db.execute(
+        update(PlantContentJob)
+        .where(PlantContentJob.idx == idx)
+        .values(
+            status="pending" if next_run_at is not None else "failed",
+            attempts=attempts,
+            next_run_at=next_run_at,
+            last_error=error[:500],
+        )
+    )
+
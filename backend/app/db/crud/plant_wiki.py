@@ -1,10 +1,11 @@
 from __future__ import annotations
 from typing import Optional, Sequence
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import Row, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.plant_wiki import PlantWiki
+from backend.app.core.database import track_change
+from backend.app.db.models.plant_wiki import PlantWiki
 
 
 async def get(db: AsyncSession, idx: int) -> Optional[PlantWiki]:
@@ -17,21 +18,32 @@ async def get_by_species(db: AsyncSession, species: str) -> Optional[PlantWiki]:
     return res.scalar_one_or_none()
 
 
+async def list_by_species(db: AsyncSession, species: Sequence[str]) -> Sequence[PlantWiki]:
+    """여러 종을 한 번에 조회 (분류 결과 top-k → 위키 매핑용)"""
+    if not species:
+        return []
+    res = await db.execute(select(PlantWiki).where(PlantWiki.species.in_(list(species))))
+    return res.scalars().all()
+
+
 async def create(db: AsyncSession, **fields) -> PlantWiki:
     row = PlantWiki(**fields)
     db.add(row)
     await db.flush()
+    track_change(db, "plant_wiki", row.idx)
     return row
 
 
 async def patch(db: AsyncSession, idx: int, **fields) -> Optional[PlantWiki]:
     if fields:
         await db.execute(update(PlantWiki).where(PlantWiki.idx == idx).values(**fields))
+        track_change(db, "plant_wiki", idx)
     return await get(db, idx)
 
 
 async def delete_one(db: AsyncSession, idx: int) -> int:
     res = await db.execute(delete(PlantWiki).where(PlantWiki.idx == idx))
+    track_change(db, "plant_wiki", idx)
     return res.rowcount or 0
 
 
@@ -46,3 +58,36 @@ async def list_by_cursor(
         stmt = stmt.where(PlantWiki.idx < last_idx)
     rows = (await db.execute(stmt)).scalars().all()
     return rows
+
+
+# 목록용 컬럼 (PlantWikiOut 필드와 동일한 이름)
+ROW_COLUMNS = (
+    PlantWiki.idx,
+    PlantWiki.species,
+    PlantWiki.wiki_img,
+    PlantWiki.sunlight,
+    PlantWiki.watering,
+    PlantWiki.flowering,
+    PlantWiki.fertilizer,
+    PlantWiki.toxic,
+)
+
+
+async def list_rows_by_cursor(
+    db: AsyncSession,
+    *,
+    limit: int,
+    last_idx: int | None,
+) -> Sequence[Row]:
+    """list_by_cursor 와 같은 조건, Core Row 반환 (PlantWikiOut.from_rows 용)"""
+    stmt = select(*ROW_COLUMNS).order_by(PlantWiki.idx.desc()).limit(limit + 1)
+    if last_idx is not None:
+        stmt = stmt.where(PlantWiki.idx < last_idx)
+    return (await db.execute(stmt)).all()
+
+
+async def list_rows_by_ids(db: AsyncSession, ids: Sequence[int]) -> Sequence[Row]:
+    """idx 목록으로 Core Row 조회 (검색 인덱스 증분 갱신용)"""
+    if not ids:
+        return []
+    return (await db.execute(select(*ROW_COLUMNS).where(PlantWiki.idx.in_(list(ids))))).all()
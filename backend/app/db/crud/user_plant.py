@@ -1,10 +1,10 @@
 from __future__ import annotations
-from typing import Optional, Sequence
+from typing import Mapping, Optional, Sequence
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import bindparam, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.user_plant import UserPlant
+from backend.app.db.models.user_plant import UserPlant
 
 
 async def get_by_idx(db: AsyncSession, idx: int) -> Optional[UserPlant]:
@@ -68,3 +68,15 @@ async def patch(db: AsyncSession, idx: int, **fields) -> Optional[UserPlant]:
 async def delete_one(db: AsyncSession, idx: int) -> int:
     res = await db.execute(delete(UserPlant).where(UserPlant.idx == idx))
     return res.rowcount or 0
+
+
+async def bulk_set_species(db: AsyncSession, species_by_plant_id: Mapping[int, str]) -> int:
+    """plant_id → species 일괄 갱신 (executemany 1회, 배치 재분류용)"""
+    if not species_by_plant_id:
+        return 0
+    table = UserPlant.__table__
+    stmt = update(table).where(table.c.plant_id == bindparam("b_plant_id")).values(species=bindparam("b_species"))
+    res = await db.execute(
+        stmt, [{"b_plant_id": pid, "b_species": sp} for pid, sp in species_by_plant_id.items()]
+    )
+    return res.rowcount or 0
@@ -0,0 +1,14 @@
+# 모든 모델을 import 해서 Base.metadata / 매퍼 레지스트리에 등록
+# (모델 간 관계는 문자열로 선언되어 있으므로 전부 로드된 뒤에 해석됨)
+from .user import User
+from .diary import Diary
+from .img_address import ImgAddress
+from .user_plant import UserPlant
+from .humid_info import HumidInfo
+from .plant_wiki import PlantWiki
+from .pest_wiki import PestWiki
+from .plant_content_job import PlantContentJob
+
+__all__ = [
+    "User", "Diary", "ImgAddress", "UserPlant", "HumidInfo", "PlantWiki", "PestWiki", "PlantContentJob",
+]
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from sqlalchemy import String, DateTime, func, ForeignKey, Text
+from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
-from backend.app.db.models.user import User
-from backend.app.db.models.img_address import ImgAddress
+from backend.app.core.database import Base
+
+if TYPE_CHECKING:  # 순환 import 방지 (관계는 문자열로 해석됨)
+    from backend.app.db.models.user import User
+    from backend.app.db.models.img_address import ImgAddress
 
 class Diary(Base):
     __tablename__ = "diary"
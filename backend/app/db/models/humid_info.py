@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime
 from sqlalchemy import Float, DateTime, ForeignKey
+from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from backend.app.core.database import Base
 
-from backend.app.db.models.user_plant import UserPlant
+if TYPE_CHECKING:  # 순환 import 방지 (관계는 문자열로 해석됨)
+    from backend.app.db.models.user_plant import UserPlant
 
 
 class HumidInfo(Base):
@@ -14,12 +16,13 @@ class HumidInfo(Base):
 
     plant_id: Mapped[int] = mapped_column(
         ForeignKey("user_plant.plant_id", ondelete="CASCADE", onupdate="CASCADE"),
-        primary_key=True,   # FK이자 PK로 사용 
+        primary_key=True,   # FK이자 복합 PK (plant_id, humid_date)
         nullable=False,
     )
 
     humidity: Mapped[float] = mapped_column(Float, nullable=False)
-    humid_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # 식물 당 측정값이 여러 개이므로 측정 시각까지 PK에 포함 (crud 의 get_one/dedup 기준과 동일)
+    humid_date: Mapped[datetime] = mapped_column(DateTime, primary_key=True, nullable=False)
 
     # 관계 (user_plant 모델과 연결)
     plant: Mapped["UserPlant"] = relationship(back_populates="humid_infos")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime
+from sqlalchemy import String, Integer, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.core.database import Base
+
+
+class PlantContentJob(Base):
+    """Diary.plant_content 생성 대기열 (다이어리 작성과 같은 트랜잭션에서 등록 → 재시작해도 유지)"""
+
+    __tablename__ = "plant_content_job"
+
+    idx: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    diary_id: Mapped[int] = mapped_column(
+        ForeignKey("diary.diary_id", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="pending")  # pending | running | failed
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 다음 실행 시각 (running 은 lease 만료 시각, failed 는 NULL → 대기열에서 제외)
+    next_run_at: Mapped[datetime | None] = mapped_column(DateTime, index=True)
+    last_error: Mapped[str | None] = mapped_column(String(500))
+    created_at: Mapped[datetime | None] = mapped_column(DateTime)
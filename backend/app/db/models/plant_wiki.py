@@ -3,7 +3,7 @@ from __future__ import annotations
 from sqlalchemy import String, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.database import Base
+from backend.app.core.database import Base
 
 
 class PlantWiki(Base):
@@ -11,7 +11,7 @@ class PlantWiki(Base):
 
     idx: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
-    species: Mapped[str] = mapped_column(String(100), nullable=False)
+    species: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     wiki_img: Mapped[str] = mapped_column(String(300), nullable=False)
 
     sunlight: Mapped[str | None] = mapped_column(String(10))
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from sqlalchemy import String, DateTime, Integer, ForeignKey
+from typing import TYPE_CHECKING
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from backend.app.core.database import Base
 
-from backend.app.db.models.humid_info import HumidInfo
-from backend.app.db.models.user import User
+if TYPE_CHECKING:  # 순환 import 방지 (관계는 문자열로 해석됨)
+    from backend.app.db.models.humid_info import HumidInfo
+    from backend.app.db.models.user import User
 
 
 class UserPlant(Base):
@@ -0,0 +1,133 @@
+# crud 함수별 SQLite 실행계획(EXPLAIN QUERY PLAN) 점검 도구
+#
+# 사용법 (프로젝트 루트에서):
+#   python -m backend.app.db.query_plans
+# DATABASE_URL 이 SQLite 가 아니면 in-memory SQLite 로 실행함.
+# 인덱스 없이 테이블 전체를 훑는(SCAN) 쿼리가 있으면 종료 코드 1.
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core import database
+from backend.app.core.config import settings
+from backend.app.db.crud import diary, humid_info, img_address, pest_wiki, plant_content_job, plant_wiki, user, user_plant
+
+CrudCase = Tuple[str, Callable[[AsyncSession], Awaitable[Any]]]
+
+_T0 = datetime(2025, 1, 1)
+
+# (이름, 실행 함수) - 모든 crud 조회/쓰기 함수를 한 번씩 실행
+CASES: List[CrudCase] = [
+    ("user.get_by_idx", lambda db: user.get_by_idx(db, 1)),
+    ("user.get_by_user_id", lambda db: user.get_by_user_id(db, "u1")),
+    ("user.get_by_email", lambda db: user.get_by_email(db, "u1@example.com")),
+    ("user.list_by_cursor", lambda db: user.list_by_cursor(db, limit=20, last_idx=10)),
+    ("user.patch", lambda db: user.patch(db, 1, nickname="n1")),
+    ("user_plant.get_by_idx", lambda db: user_plant.get_by_idx(db, 1)),
+    ("user_plant.get_by_plant_id", lambda db: user_plant.get_by_plant_id(db, 1)),
+    ("user_plant.list_by_user_cursor", lambda db: user_plant.list_by_user_cursor(db, user_id="u1", limit=20, last_idx=10)),
+    ("user_plant.patch", lambda db: user_plant.patch(db, 1, plant_name="p1")),
+    ("user_plant.bulk_set_species", lambda db: user_plant.bulk_set_species(db, {1: "monstera", 2: "pothos"})),
+    ("humid_info.get_one", lambda db: humid_info.get_one(db, 1, _T0)),
+    ("humid_info.create", lambda db: humid_info.create(db, plant_id=1, humid_date=_T0, humidity=50.0)),
+    ("humid_info.list_by_plant_cursor", lambda db: humid_info.list_by_plant_cursor(db, plant_id=1, limit=20, last_time=_T0)),
+    ("humid_info.list_rows_by_plant_cursor", lambda db: humid_info.list_rows_by_plant_cursor(db, plant_id=1, limit=20, last_time=_T0)),
+    ("diary.get", lambda db: diary.get(db, 1)),
+    ("diary.list_by_user_cursor", lambda db: diary.list_by_user_cursor(db, user_id="u1", limit=20, last_diary_id=10)),
+    ("diary.list_rows_by_user_cursor", lambda db: diary.list_rows_by_user_cursor(db, user_id="u1", limit=20, last_diary_id=10)),
+    ("diary.patch", lambda db: diary.patch(db, 1, user_title="t1")),
+    ("diary.list_rows_by_ids", lambda db: diary.list_rows_by_ids(db, [1, 2])),
+    ("plant_content_job.claim_due", lambda db: plant_content_job.claim_due(db, now=_T0, limit=8, lease_seconds=60)),
+    ("plant_content_job.mark_retry", lambda db: plant_content_job.mark_retry(db, 1, error="e", attempts=1, next_run_at=_T0)),
+    ("plant_content_job.delete_done", lambda db: plant_content_job.delete_done(db, [1])),
+    ("img_address.list_images", lambda db: img_address.list_images(db, 1)),
+    ("plant_wiki.get", lambda db: plant_wiki.get(db, 1)),
+    ("plant_wiki.get_by_species", lambda db: plant_wiki.get_by_species(db, "monstera")),
+    ("plant_wiki.list_by_species", lambda db: plant_wiki.list_by_species(db, ["monstera", "pothos"])),
+    ("plant_wiki.list_by_cursor", lambda db: plant_wiki.list_by_cursor(db, limit=20, last_idx=10)),
+    ("plant_wiki.list_rows_by_cursor", lambda db: plant_wiki.list_rows_by_cursor(db, limit=20, last_idx=10)),
+    ("plant_wiki.list_rows_by_ids", lambda db: plant_wiki.list_rows_by_ids(db, [1, 2])),
+    ("pest_wiki.get", lambda db: pest_wiki.get(db, 1)),
+    ("pest_wiki.get_by_pest_id", lambda db: pest_wiki.get_by_pest_id(db, 1)),
+    ("pest_wiki.list_by_pest_ids", lambda db: pest_wiki.list_by_pest_ids(db, [1, 2])),
+    ("pest_wiki.list_by_cursor", lambda db: pest_wiki.list_by_cursor(db, limit=20, last_idx=10)),
+    ("pest_wiki.list_rows_by_cursor", lambda db: pest_wiki.list_rows_by_cursor(db, limit=20, last_idx=10)),
+    ("pest_wiki.list_rows_by_ids", lambda db: pest_wiki.list_rows_by_ids(db, [1, 2])),
+]
+
+
+async def _seed(db: AsyncSession) -> None:
+    await user.create(db, user_id="u1", hashed_pw="x", email="u1@example.com", hp="010-0000-0001", nickname="n")
+    await user_plant.create(db, user_id="u1", plant_id=1, plant_name="p")
+    d = await diary.create(db, user_id="u1", user_title="t")
+    await img_address.add_image_url(db, diary_id=d.diary_id, img_url="/media/x.jpg")
+    await plant_wiki.create(db, species="monstera", wiki_img="/media/w.jpg")
+    await pest_wiki.create(db, pest_id=1, cause="c", cure="c")
+
+
+async def explain_all() -> List[Tuple[str, str, List[str]]]:
+    """[(crud 이름, SQL, 실행계획 줄 목록)]"""
+    await database.create_all()
+    sync_engine = database.get_engine().sync_engine
+    captured: List[Tuple[str, Any]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        # executemany 는 첫 번째 파라미터 묶음으로 실행계획 확인
+        captured.append((statement, parameters[0] if executemany else parameters))
+
+    report: List[Tuple[str, str, List[str]]] = []
+    async with database.AsyncSessionLocal() as db:
+        await _seed(db)
+        await db.flush()
+        event.listen(sync_engine, "before_cursor_execute", _capture)
+        try:
+            for name, run in CASES:
+                captured.clear()
+                await run(db)
+                statements = list(captured)
+                for statement, params in statements:
+                    if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                        continue
+                    conn = await db.connection()
+                    rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params)).all()
+                    report.append((name, statement, [str(r[-1]) for r in rows]))
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _capture)
+        await db.rollback()
+    return report
+
+
+def _is_full_scan(detail: str) -> bool:
+    # "SCAN users" 는 전체 스캔, "SCAN users USING INDEX ..." 는 인덱스 순회
+    return detail.startswith("SCAN ") and "USING" not in detail
+
+
+async def main() -> int:
+    if not settings.DATABASE_URL or not settings.DATABASE_URL.startswith("sqlite"):
+        settings.DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+    try:
+        report = await explain_all()
+    finally:
+        await database.dispose_engines()
+
+    full_scans = 0
+    for name, statement, plan in report:
+        flagged = [p for p in plan if _is_full_scan(p)]
+        full_scans += len(flagged)
+        print(f"{'!!' if flagged else 'ok'} {name}")
+        print("   " + " ".join(statement.split()))
+        for line in plan:
+            print(f"     - {line}")
+    print(f"\n{len(report)} statements, {full_scans} full table scans")
+    return 1 if full_scans else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Generic, TypeVar, Optional
+from typing import Any, Generic, Iterable, Mapping, TypeVar, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 T = TypeVar("T")
+S = TypeVar("S", bound="OrmBase")
 
 class OrmBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)  # SQLAlchemy ORM ↔ Pydantic
 
+    # ---- Core Row / RowMapping 빠른 경로 (crud.list_rows_* 결과용) ----
+    # DB 컬럼 값은 이미 타입이 맞으므로 검증/속성 반사 없이 바로 생성 (model_construct)
+    @classmethod
+    def from_row(cls: type[S], row: Any, **extra: Any) -> S:
+        data: Mapping[str, Any] = getattr(row, "_mapping", row)
+        return cls.model_construct(**data, **extra)
+
+    @classmethod
+    def from_rows(cls: type[S], rows: Iterable[Any]) -> list[S]:
+        construct = cls.model_construct
+        return [construct(**getattr(r, "_mapping", r)) for r in rows]
+
 def utcnow() -> datetime:
     # 응답에 넣을 때 기본값으로 활용 가능
     return datetime.now(tz=timezone.utc)
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import logging
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from backend.app.core.config import settings
+from backend.app.core import database
+from backend.app.ml import pest_diagnosis, species_classification
+from backend.app.ml.registry import registry as model_registry
+from backend.app.services import plant_content_service
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 try:
     from .core.config import get_settings  # type: ignore
@@ -17,22 +24,82 @@ from backend.app.routers.dashboard import router as dashboard_router
 from backend.app.routers.auth import router as auth_router
 from backend.app.routers.plants import router as plants_router
 from backend.app.routers.images import router as images_router
+from backend.app.routers.media import router as media_router
+from backend.app.routers.metrics import router as metrics_router
+from backend.app.routers.species import router as species_router
+from backend.app.routers.diagnosis import router as diagnosis_router
+from backend.app.routers.models import router as models_router
+from backend.app.routers.assistant import router as assistant_router
 
 
 from backend.app.utils.errors import register_error_handlers
-
-
-app = FastAPI(title="Pland API", version="0.1.0")
+from backend.app.core.db_metrics import register_db_metrics
+from backend.app.utils.timing import register_server_timing
+from backend.app.utils.responses import FastJSONResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    시작: DB 엔진 생성 + 커넥션 풀 워밍업 → 완료 후 ready
+    종료: 엔진 정리
+    """
+    app.state.ready = False
+    if database.db_configured():
+        await database.warm_up()
+        if settings.DB_CREATE_ALL:
+            await database.create_all()
+    else:
+        logger.info("DB_HOST/DB_USER/DB_NAME not set; skipping database warm-up")
+    # 모델 워밍업 (지정된 모델만, 실패해도 기동은 계속)
+    warm = [n.strip() for n in settings.ML_WARMUP_MODELS.split(",") if n.strip()]
+    if "pest" in warm:
+        warm.remove("pest")
+        try:
+            await pest_diagnosis.warm_up()
+        except Exception as e:
+            logger.warning("pest worker warm-up failed: %s", e)
+    await model_registry.warm_up(warm)
+    plant_content_service.start()  # Diary.plant_content 백그라운드 생성 워커
+    app.state.ready = True
+    try:
+        yield
+    finally:
+        app.state.ready = False
+        await plant_content_service.stop()
+        await species_classification.shutdown()
+        await pest_diagnosis.shutdown()
+        await database.dispose_engines()
+
+
+app = FastAPI(
+    title="Pland API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,  # orjson 인코딩 (없으면 표준 json)
+)
+app.state.ready = False
 # app = FastAPI()
 
 
 register_error_handlers(app) # 에러 핸들러 등록
+register_db_metrics(app)     # 요청 당 DB 쿼리 수/시간 집계
+register_server_timing(app)  # 구간별 Server-Timing 헤더 + 라우트별 히스토그램
 
 # 라우터 등록 (확인용)
 app.include_router(images_router, prefix="/api/v1")
+app.include_router(media_router, prefix="/api/v1")
 app.include_router(dashboard_router, prefix="/api/v1") 
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(plants_router, prefix="/api/v1")
+app.include_router(metrics_router, prefix="/api/v1")
+app.include_router(species_router, prefix="/api/v1")
+app.include_router(diagnosis_router, prefix="/api/v1")
+app.include_router(models_router, prefix="/api/v1")
+app.include_router(assistant_router, prefix="/api/v1")
 
 # CORS (모바일/프론트 개발 편의)
 app.add_middleware(
@@ -54,6 +121,13 @@ app.add_middleware(
 def healthcheck():
     return {"ok": True, "now": datetime.now(timezone.utc).isoformat()}
 
+# 준비 상태 (lifespan 워밍업 완료 전에는 503)
+@app.get("/readyz")
+def readyz():
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"ready": False})
+    return {"ready": True}
+
 @app.get("/version")
 def version():
     if get_settings:
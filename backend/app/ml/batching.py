@@ -0,0 +1,134 @@
+# 동시 요청을 마이크로배치로 묶어 이벤트 루프 밖(executor)에서 실행
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from backend.app.utils.metrics import COUNT_BUCKETS, Histogram
+
+I = TypeVar("I")
+O = TypeVar("O")
+
+
+class BatcherOverloaded(RuntimeError):
+    """대기열이 가득 참 (상위에서 503 처리)"""
+
+
+class MicroBatcher(Generic[I, O]):
+    """
+    submit() 으로 들어온 요청을 최대 max_batch 개 또는 첫 요청 후 max_wait_ms 까지 모아
+    fn(batch) 를 executor 에서 한 번에 실행. fn 은 입력과 같은 순서/길이의 결과 목록을 반환해야 함.
+
+    배치를 실행하는 동안 들어온 요청은 대기열에 쌓였다가 다음 배치로 묶이므로
+    부하가 클수록 배치가 커짐.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[List[I]], Sequence[O]],
+        *,
+        max_batch: int,
+        max_wait_ms: float,
+        executor: Optional[Executor] = None,
+        max_queue: int = 256,
+    ):
+        self.fn = fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.executor = executor
+        self.max_queue = max_queue
+        self.batch_sizes = Histogram(COUNT_BUCKETS + (500,))
+        self.queue_wait_ms = Histogram()
+        self.run_ms = Histogram()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        # 이벤트 루프가 바뀌면(테스트 클라이언트 재생성 등) 대기열/워커를 새로 만듦
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._worker = loop.create_task(self._run())
+        assert self._queue is not None
+        return self._queue
+
+    async def submit(self, item: I) -> O:
+        queue = self._ensure_worker()
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait((item, fut, time.perf_counter()))
+        except asyncio.QueueFull:
+            raise BatcherOverloaded("inference queue is full")
+        return await fut
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[I, asyncio.Future, float]]:
+        batch = [await queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            # 이미 쌓인 요청은 기다리지 않고 가져옴
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect(queue)
+            # 취소된(클라이언트 끊김) 요청은 배치에서 제외
+            live = [(item, fut, t) for item, fut, t in batch if not fut.done()]
+            if not live:
+                continue
+            started = time.perf_counter()
+            for _, _, enq in live:
+                self.queue_wait_ms.observe((started - enq) * 1000.0)
+            self.batch_sizes.observe(len(live))
+            try:
+                results = await loop.run_in_executor(self.executor, self.fn, [item for item, _, _ in live])
+                if len(results) != len(live):
+                    raise RuntimeError(f"batch fn returned {len(results)} results for {len(live)} inputs")
+            except Exception as e:
+                for _, fut, _ in live:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            finally:
+                self.run_ms.observe((time.perf_counter() - started) * 1000.0)
+            for (_, fut, _), res in zip(live, results):
+                if not fut.done():
+                    fut.set_result(res)
+
+    async def close(self) -> None:
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+        self._queue = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+            "run_ms": self.run_ms.snapshot(),
+        }
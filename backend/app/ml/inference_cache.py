@@ -0,0 +1,267 @@
+# 이미지 내용 해시 + 모델 버전 기준 추론 결과 캐시 (메모리 LRU + 선택적 디스크)
+#
+# 같은 사진을 다시 올리는 경우(재시도, 프로필/다이어리 중복, 재진단) 추론을 건너뜀.
+# 키에 모델 버전이 들어가므로 registry 에서 모델을 교체하면 자연스럽게 무효화됨
+# (교체 시 prune_model 로 이전 버전 항목을 메모리/디스크에서 정리).
+# 디스크 계층은 ML_CACHE_DISK_MB 상한, 넘으면 mtime 오래된 파일부터 삭제 (디스크 적중 시 mtime 갱신 → LRU).
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.app.core.config import settings
+from backend.app.utils.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+_VERSION_TOKEN_LEN = 16  # 디스크 파일명의 버전 토큰 (sha256(version) 앞 16자)
+_DISK_LOW_WATERMARK = 0.9  # 상한을 넘으면 상한의 90% 까지 비움 (쓰기마다 정리하지 않도록)
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: str, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class InferenceCache:
+    """
+    값은 JSON 직렬화 bytes 로 보관 → 메모리 사용량을 정확히 제한 (max_entries, max_bytes).
+    disk_dir 가 있으면 메모리에서 밀려난 항목도 디스크에서 다시 찾음 (프로세스 재시작 후에도 유지).
+    """
+
+    def __init__(
+        self, *, max_entries: int, max_bytes: int, disk_dir: Optional[Path] = None, disk_max_bytes: int = 0
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes  # 0 이면 무제한
+        self._disk_bytes: Optional[int] = None  # 첫 쓰기 때 폴더를 훑어 초기화 (다른 워커 몫은 정리 때 재계산)
+        self.disk_evictions = 0
+        self._items: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, version: Optional[str], content_digest: str) -> str:
+        return f"{model}:{version or '-'}:{content_digest}"
+
+    # ---- memory tier ----
+    def _mem_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            raw = self._items.get(key)
+            if raw is not None:
+                self._items.move_to_end(key)
+            return raw
+
+    def _mem_put(self, key: str, raw: bytes) -> None:
+        if len(raw) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._items[key] = raw
+            self._bytes += len(raw)
+            while self._items and (len(self._items) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    # ---- disk tier ----
+    @staticmethod
+    def _safe(name: str) -> str:
+        return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+
+    @staticmethod
+    def _version_token(version: Optional[str]) -> str:
+        # 버전 문자열은 swap API 로 아무 값이나 올 수 있음 → 문자 치환 대신 해시 (v1+cpu / v1_cpu 충돌 없음, 고정 길이)
+        return hashlib.sha256((version or "-").encode("utf-8")).hexdigest()[:_VERSION_TOKEN_LEN]
+
+    def _disk_path(self, model: str, version: Optional[str], content_digest: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        # <model>/<digest 앞 2자>/<version token>-<digest>.json → 모델별로 이전 버전만 골라 지울 수 있음
+        name = f"{self._version_token(version)}-{content_digest}.json"
+        return self.disk_dir / self._safe(model) / content_digest[:2] / name
+
+    def _disk_files(self, base: Optional[Path] = None) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) 목록 (다른 워커가 지우는 중인 파일은 건너뜀)"""
+        out: List[Tuple[float, int, Path]] = []
+        for dirpath, _, names in os.walk(base or self.disk_dir):
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def _disk_get(self, model: str, version: Optional[str], content_digest: str) -> Optional[bytes]:
+        path = self._disk_path(model, version, content_digest)
+        if path is None:
+            return None
+        try:
+            raw = path.read_bytes()
+            os.utime(path)  # 최근 사용 → 정리 순서에서 뒤로
+            return raw
+        except OSError:
+            return None
+
+    def _disk_put(self, model: str, version: Optional[str], content_digest: str, raw: bytes) -> None:
+        path = self._disk_path(model, version, content_digest)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(raw)
+            os.replace(tmp, path)  # 원자적 교체 (동시에 쓰는 워커가 있어도 깨진 파일 없음)
+        except OSError as e:
+            logger.warning("inference cache disk write failed: %s", e)
+            return
+        if self.disk_max_bytes <= 0:
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+            else:
+                self._disk_bytes += len(raw)
+            over = self._disk_bytes > self.disk_max_bytes
+        if over:
+            self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        """mtime 오래된 파일부터 삭제해 상한의 90% 이하로 (여러 워커가 같은 폴더를 써도 실제 크기로 재계산)"""
+        files = sorted(self._disk_files())
+        total = sum(size for _, size, _ in files)
+        target = int(self.disk_max_bytes * _DISK_LOW_WATERMARK)
+        removed = 0
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self._disk_bytes = total
+            self.disk_evictions += removed
+
+    def _disk_prune_model(self, model: str, keep_version: Optional[str]) -> int:
+        model_dir = self.disk_dir / self._safe(model)
+        keep = self._version_token(keep_version) + "-"
+        removed = freed = 0
+        for _, size, path in self._disk_files(model_dir):
+            if path.name.startswith(keep):
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+            freed += size
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes = max(0, self._disk_bytes - freed)
+        return removed
+
+    # ---- public ----
+    async def get(self, model: str, version: Optional[str], content_digest: str) -> Optional[Any]:
+        key = self.key(model, version, content_digest)
+        raw = self._mem_get(key)
+        if raw is None and self.disk_dir is not None:
+            raw = await asyncio.to_thread(self._disk_get, model, version, content_digest)
+            if raw is not None:
+                self.disk_hits += 1
+                self._mem_put(key, raw)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    async def put(self, model: str, version: Optional[str], content_digest: str, value: Any) -> None:
+        key = self.key(model, version, content_digest)
+        raw = dumps(value)
+        self._mem_put(key, raw)
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._disk_put, model, version, content_digest, raw)
+
+    def prune_model(self, model: str, keep_version: Optional[str]) -> int:
+        """모델 교체 후 호출: keep_version 이 아닌 model 항목을 메모리/디스크에서 삭제 (삭제 수 반환)"""
+        prefix = f"{model}:"
+        keep = self.key(model, keep_version, "")
+        with self._lock:
+            # digest 에는 ':' 가 없으므로 마지막 ':' 앞까지가 model:version (버전에 ':' 가 있어도 정확히 비교)
+            stale = [k for k in self._items if k.startswith(prefix) and k[: k.rindex(":") + 1] != keep]
+            for k in stale:
+                self._bytes -= len(self._items.pop(k))
+        removed = len(stale)
+        if self.disk_dir is not None:
+            removed += self._disk_prune_model(model, keep_version)
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "disk_dir": str(self.disk_dir) if self.disk_dir else None,
+            "disk_bytes": self._disk_bytes,
+            "disk_max_bytes": self.disk_max_bytes,
+            "disk_evictions": self.disk_evictions,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else None,
+        }
+
+
+_cache: Optional[InferenceCache] = None
+
+
+def get_cache() -> InferenceCache:
+    global _cache
+    if _cache is None:
+        disk_dir: Optional[Path] = None
+        if settings.ML_CACHE_DIR:
+            disk_dir = Path(settings.ML_CACHE_DIR)
+            if not disk_dir.is_absolute():
+                disk_dir = settings.ROOT_DIR.parent / disk_dir
+        _cache = InferenceCache(
+            max_entries=settings.ML_CACHE_MAX_ENTRIES,
+            max_bytes=settings.ML_CACHE_MAX_MB * 1024 * 1024,
+            disk_dir=disk_dir,
+            disk_max_bytes=settings.ML_CACHE_DISK_MB * 1024 * 1024,
+        )
+    return _cache
@@ -0,0 +1,382 @@
+# 병해충 진단 (비동기 job + CPU 코어 수 크기의 프로세스 풀)
+#
+# 모델 형식 (settings.PEST_MODEL, ML_MODELS_DIR 기준):
+#   - *.onnx : 출력 (1, K, 6) = [x1, y1, x2, y2, score, class] (좌표는 0~1 정규화)
+#   - *.npz  : NumPy 다중 라벨 헤드 {"W": (3*S*S, C), "b": (C,), "pest_ids"?: (C,)} - 로컬/테스트용
+# 클래스 → PestWiki.pest_id 매핑은 npz 의 pest_ids, 모델 옆 <모델명>.labels.txt, PEST_LABELS 파일 순.
+# 워커 프로세스마다 registry("pest") 로 로드 (npz 가중치는 memory-map 으로 공유).
+#
+# 흐름: submit() → job 즉시 반환(queued) → 워커 프로세스에서 추론 → UserPlant.pest_id 갱신 + PestWiki 매핑 → done
+# 업로드 버퍼에서 디코드/리사이즈한 uint8 텐서가 있으면 shared memory 로 넘겨 워커에서 파일을 다시 읽지 않음.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from backend.app.core.config import settings
+from backend.app.ml import inference_cache, preprocess
+from backend.app.ml.preprocess import InvalidImageError, PreparedImage, make_batch
+from backend.app.ml.registry import ModelUnavailableError, file_version, load_npz_mmap, models_root, registry
+
+try:
+    import onnxruntime as ort
+except Exception:  # pragma: no cover
+    ort = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------
+# Worker process side
+# -----------------------
+class PestDetector:
+    def __init__(self, model_path: Path, input_size: int, threshold: float):
+        self.input_size = input_size
+        self.threshold = threshold
+        self.pest_ids: Optional[List[int]] = None
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.session = None
+        if model_path.suffix == ".npz":
+            # 가중치 memory-map → 같은 파일을 여는 워커 프로세스들이 페이지 캐시 공유
+            self.arrays = load_npz_mmap(model_path)
+            self.W = self.arrays["W"].astype(np.float32, copy=False)
+            self.b = self.arrays["b"].astype(np.float32, copy=False)
+            if "pest_ids" in self.arrays:
+                self.pest_ids = [int(x) for x in self.arrays["pest_ids"]]
+        elif model_path.suffix == ".onnx":
+            if ort is None:
+                raise ModelUnavailableError("onnxruntime is not installed")
+            opts = ort.SessionOptions()
+            # 프로세스 당 1스레드 (병렬성은 프로세스 수로 확보)
+            opts.intra_op_num_threads = 1
+            self.session = ort.InferenceSession(str(model_path), sess_options=opts, providers=["CPUExecutionProvider"])
+            self.input_name = self.session.get_inputs()[0].name
+        else:
+            raise ModelUnavailableError(f"unsupported model format: {model_path.suffix}")
+        if self.pest_ids is None:
+            candidates = [model_path.with_suffix(".labels.txt")]
+            if settings.PEST_LABELS:
+                candidates.append(models_root() / settings.PEST_LABELS)
+            found = next((c for c in candidates if c.exists()), None)
+            if found is None:
+                raise ModelUnavailableError(f"pest labels not found: {candidates}")
+            self.pest_ids = [int(ln) for ln in found.read_text(encoding="utf-8").split() if ln.strip()]
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """(N, 3, S, S) 배치 → 모델 원출력 (npz: (N, C) 로짓, onnx: (N, K, 6))"""
+        if self.session is None:
+            return x.reshape(x.shape[0], -1) @ self.W + self.b
+        return self.session.run(None, {self.input_name: x})[0]
+
+    def postprocess(self, out: np.ndarray) -> List[Dict[str, Any]]:
+        """이미지 1장의 원출력 → threshold 이상 검출 목록"""
+        assert self.pest_ids is not None
+        if self.session is None:
+            scores = 1.0 / (1.0 + np.exp(-out))
+            return [
+                {"pest_id": self.pest_ids[i], "score": float(s), "box": None}
+                for i, s in enumerate(scores)
+                if s >= self.threshold
+            ]
+        return [
+            {"pest_id": self.pest_ids[int(cls)], "score": float(score), "box": [float(v) for v in (x1, y1, x2, y2)]}
+            for x1, y1, x2, y2, score, cls in out
+            if score >= self.threshold and 0 <= int(cls) < len(self.pest_ids)
+        ]
+
+    def detect(self, image: PreparedImage) -> List[Dict[str, Any]]:
+        return self.postprocess(self.forward(make_batch([image], self.input_size))[0])
+
+
+def load_pest_model(path: Path) -> PestDetector:
+    """registry loader (워커 프로세스에서 호출)"""
+    return PestDetector(path, settings.PEST_INPUT_SIZE, settings.PEST_SCORE_THRESHOLD)
+
+
+def _init_worker(model_path: str, version: Optional[str]) -> None:
+    # 워커 프로세스 시작 시 1회 로드 (실패해도 프로세스는 유지, 호출 시 에러 반환)
+    registry.register("pest", load_pest_model, Path(model_path), version)
+    try:
+        registry.get("pest")
+    except Exception as e:
+        logger.warning("pest detector load failed in worker %s: %s", os.getpid(), e)
+
+
+def _detect_file(image_path: str) -> List[Dict[str, Any]]:
+    """워커 프로세스에서 실행. 이미지는 경로로 받아 프로세스 간 큰 bytes 전달을 피함."""
+    detector: PestDetector = registry.get("pest")
+    with open(image_path, "rb") as f:
+        data = f.read()
+    dets = detector.detect(PreparedImage.decode(data, detector.input_size))
+    dets.sort(key=lambda d: d["score"], reverse=True)
+    return dets
+
+
+def _detect_shared(handle: preprocess.SharedHandle) -> List[Dict[str, Any]]:
+    """워커 프로세스에서 실행. API 프로세스가 리사이즈해 둔 uint8 텐서를 복사 없이 사용."""
+    detector: PestDetector = registry.get("pest")
+    shm, arr = preprocess.attach(handle)
+    try:
+        dets = detector.detect(PreparedImage.from_array(arr))
+    finally:
+        del arr
+        shm.close()
+    dets.sort(key=lambda d: d["score"], reverse=True)
+    return dets
+
+
+def _worker_stats() -> Dict[str, Any]:
+    stats = registry.stats()
+    stats["pid"] = os.getpid()
+    return stats
+
+
+# -----------------------
+# Job registry (API process side)
+# -----------------------
+@dataclass
+class DiagnosisJob:
+    job_id: str
+    user_id: str
+    image_path: str
+    user_plant_idx: Optional[int] = None
+    status: str = "queued"  # queued | running | done | failed
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    detections: List[Dict[str, Any]] = field(default_factory=list)
+    pest_id: Optional[int] = None
+    wiki: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    content_digest: Optional[str] = None
+    # 업로드 시 디코드한 이미지 (추론 후 해제)
+    prepared: Optional[PreparedImage] = field(default=None, repr=False)
+    # 상태 변경 알림 (SSE 용). 변경마다 새 Event 로 교체.
+    changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def _set(self, **fields: Any) -> None:
+        for k, v in fields.items():
+            setattr(self, k, v)
+        old, self.changed = self.changed, asyncio.Event()
+        old.set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "user_plant_idx": self.user_plant_idx,
+            "pest_id": self.pest_id,
+            "detections": self.detections,
+            "wiki": self.wiki,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+_jobs: Dict[str, DiagnosisJob] = {}
+_tasks: set = set()
+_pool: Optional[ProcessPoolExecutor] = None
+# 현재 워커 풀이 사용하는 모델 (swap_model 로 교체)
+_model_path: Optional[Path] = None
+_model_version: Optional[str] = None
+
+
+def pool_size() -> int:
+    return settings.PEST_WORKERS if settings.PEST_WORKERS > 0 else (os.cpu_count() or 1)
+
+
+def model_info() -> Dict[str, Any]:
+    path = _model_path or models_root() / settings.PEST_MODEL
+    version = _model_version or (file_version(path) if path.exists() else None)
+    return {"path": str(path), "version": version}
+
+
+def _new_pool(path: Path, version: Optional[str]) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=pool_size(),
+        # spawn: 이벤트 루프/DB 커넥션/스레드 상태를 물려받지 않음 (Windows 와 동작 동일)
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(str(path), version),
+    )
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        info = model_info()
+        _pool = _new_pool(Path(info["path"]), info["version"])
+    return _pool
+
+
+async def warm_up() -> None:
+    """워커 프로세스를 미리 띄워 모델 로드 (lifespan)"""
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    await asyncio.gather(*(loop.run_in_executor(pool, os.getpid) for _ in range(pool_size())))
+
+
+async def swap_model(path: Path, version: Optional[str] = None) -> Dict[str, Any]:
+    """
+    새 모델로 워커 풀 교체. 새 풀이 모델을 로드한 뒤 참조를 바꾸고,
+    기존 풀은 진행 중인 job 을 끝낸 뒤 종료 (무중단).
+    """
+    global _pool, _model_path, _model_version
+    if not path.exists():
+        raise ModelUnavailableError(f"model not found: {path}")
+    version = version or file_version(path)
+    new_pool = _new_pool(path, version)
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(new_pool, _worker_stats)
+    except Exception:
+        new_pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    old, _pool = _pool, new_pool
+    _model_path, _model_version = path, version
+    if old is not None:
+        old.shutdown(wait=False)
+    logger.info("pest model swapped to %s", version)
+    return model_info()
+
+
+async def worker_model_stats() -> Optional[Dict[str, Any]]:
+    """워커 1개의 모델 로드 시간/RSS (풀이 없으면 None)"""
+    if _pool is None:
+        return None
+    return await asyncio.get_running_loop().run_in_executor(_pool, _worker_stats)
+
+
+def _prune() -> None:
+    cutoff = time.time() - settings.PEST_JOB_TTL_SECONDS
+    for job_id in [j.job_id for j in _jobs.values() if j.finished and (j.finished_at or 0) < cutoff]:
+        _jobs.pop(job_id, None)
+
+
+def submit(
+    user_id: str,
+    image_path: str,
+    user_plant_idx: Optional[int] = None,
+    *,
+    prepared: Optional[PreparedImage] = None,
+    content_digest: Optional[str] = None,
+) -> DiagnosisJob:
+    """job 등록 후 즉시 반환 (추론은 백그라운드). prepared/content_digest 는 업로드 버퍼에서 미리 계산한 값."""
+    _prune()
+    job = DiagnosisJob(
+        job_id=str(uuid.uuid4()),
+        user_id=user_id,
+        image_path=image_path,
+        user_plant_idx=user_plant_idx,
+        content_digest=content_digest,
+        prepared=prepared,
+    )
+    _jobs[job.job_id] = job
+    task = asyncio.get_running_loop().create_task(_run(job))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job
+
+
+def get_job(job_id: str) -> Optional[DiagnosisJob]:
+    return _jobs.get(job_id)
+
+
+async def _infer(job: DiagnosisJob) -> List[Dict[str, Any]]:
+    global _pool
+    loop = asyncio.get_running_loop()
+    shm = None
+    if job.prepared is not None:
+        arr = await asyncio.to_thread(job.prepared.resized, settings.PEST_INPUT_SIZE)
+        shm, handle = preprocess.share(arr)
+        fn, arg = _detect_shared, handle
+    else:
+        fn, arg = _detect_file, job.image_path
+    try:
+        try:
+            return await loop.run_in_executor(_get_pool(), fn, arg)
+        except BrokenProcessPool:
+            # 워커가 죽으면(OOM 등) 풀을 새로 만들고 1회 재시도
+            logger.warning("pest process pool broken; recreating")
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+            return await loop.run_in_executor(_get_pool(), fn, arg)
+    finally:
+        preprocess.release(shm)
+
+
+async def _run(job: DiagnosisJob) -> None:
+    job._set(status="running")
+    try:
+        # 같은 이미지 + 같은 모델 버전이면 워커 풀을 거치지 않음
+        cache = inference_cache.get_cache()
+        content_digest = job.content_digest or await asyncio.to_thread(inference_cache.file_digest, job.image_path)
+        version = model_info()["version"]
+        detections = await cache.get("pest", version, content_digest)
+        if detections is None:
+            detections = await _infer(job)
+            await cache.put("pest", version, content_digest, detections)
+        pest_id = detections[0]["pest_id"] if detections else None
+        wiki = await _link_results(job, detections, pest_id)
+    except (ModelUnavailableError, InvalidImageError) as e:
+        job._set(status="failed", error=str(e), finished_at=time.time())
+        return
+    except Exception as e:
+        logger.exception("pest diagnosis job %s failed", job.job_id)
+        job._set(status="failed", error=f"internal error: {type(e).__name__}", finished_at=time.time())
+        return
+    finally:
+        job.prepared = None
+    job._set(status="done", detections=detections, pest_id=pest_id, wiki=wiki, finished_at=time.time())
+
+
+async def _link_results(job: DiagnosisJob, detections: List[Dict[str, Any]], pest_id: Optional[int]) -> List[Dict[str, Any]]:
+    """가장 점수가 높은 병해충을 UserPlant.pest_id 에 기록하고, 검출된 병해충의 PestWiki 반환"""
+    from backend.app.core import database
+    from backend.app.db.crud import pest_wiki, user_plant
+    from backend.app.db.schemas import PestWikiOut
+
+    if not database.db_configured():
+        return []
+    async with database.AsyncSessionLocal() as db:
+        if job.user_plant_idx is not None and pest_id is not None:
+            up = await user_plant.get_by_idx(db, job.user_plant_idx)
+            if up is not None and up.user_id == job.user_id:
+                await user_plant.patch(db, job.user_plant_idx, pest_id=pest_id)
+        rows = await pest_wiki.list_by_pest_ids(db, sorted({d["pest_id"] for d in detections}))
+        wiki = [PestWikiOut.model_validate(r).model_dump() for r in rows]
+        await db.commit()
+    return wiki
+
+
+async def shutdown() -> None:
+    global _pool
+    for task in list(_tasks):
+        task.cancel()
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def stats() -> Dict[str, Any]:
+    by_status: Dict[str, int] = {}
+    for j in list(_jobs.values()):
+        by_status[j.status] = by_status.get(j.status, 0) + 1
+    return {"workers": pool_size(), "pool_started": _pool is not None, "model": model_info(), "jobs": by_status}
@@ -0,0 +1,288 @@
+# 식물 도우미 답변 생성 (토큰 스트리밍 + 동시 생성 수 제한 + 연결 끊김 시 중단)
+#
+# 모델 (settings.LLM_MODEL, ML_MODELS_DIR 기준):
+#   - *.gguf : llama-cpp-python (CPU) 로 로드, registry("llm") 가 지연 로드/교체
+#   - 비우면 로컬 대체 모델(LocalStandInLLM) 사용 - 개발/테스트용, 토큰 간 지연을 흉내냄
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Protocol, Union
+
+from backend.app.core.config import settings
+from backend.app.ml import retrieval
+from backend.app.ml.registry import ModelUnavailableError, models_root, registry
+
+try:
+    from llama_cpp import Llama
+except Exception:  # pragma: no cover
+    Llama = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationQueueFull(RuntimeError):
+    """대기 중인 생성 요청이 LLM_QUEUE_MAX 를 넘음 (상위에서 503 처리)"""
+
+
+class PlantLLM(Protocol):
+    def generate(self, prompt: str, *, max_tokens: int, stop: threading.Event) -> Iterator[str]:
+        """토큰(문자열 조각)을 생성되는 대로 반환. stop 이 set 되면 즉시 종료해야 함."""
+        ...
+
+
+# -----------------------
+# Models
+# -----------------------
+class LocalStandInLLM:
+    """실제 모델 없이 스트리밍 경로를 시험하기 위한 대체 모델 (프롬프트의 참고 자료를 요약해 돌려줌)"""
+
+    def __init__(self, token_delay_ms: float):
+        self.token_delay = token_delay_ms / 1000.0
+
+    def generate(self, prompt: str, *, max_tokens: int, stop: threading.Event) -> Iterator[str]:
+        question = prompt.rsplit("질문:", 1)[-1].split("\n", 1)[0].strip()
+        context = prompt.split("참고 자료:", 1)[1].rsplit("질문:", 1)[0].strip() if "참고 자료:" in prompt else ""
+        answer = f"'{question}'에 대한 답변입니다. "
+        answer += f"참고 자료에 따르면 {context}" if context else "등록된 위키 정보가 없어 일반적인 관리법을 안내합니다. 흙이 마르면 물을 주고 직사광선은 피하세요."
+        for i, word in enumerate(answer.split(" ")):
+            if i >= max_tokens or stop.is_set():
+                return
+            if self.token_delay:
+                time.sleep(self.token_delay)
+            yield word if i == 0 else " " + word
+
+
+class LlamaCppLLM:
+    def __init__(self, path: Path):
+        if Llama is None:
+            raise ModelUnavailableError("llama-cpp-python is not installed")
+        # use_mmap: 가중치를 memory-map (여러 워커가 페이지 공유)
+        self.model = Llama(
+            model_path=str(path),
+            n_ctx=settings.LLM_CONTEXT_TOKENS,
+            n_threads=settings.ML_INTRA_OP_THREADS or None,
+            use_mmap=True,
+            verbose=False,
+        )
+
+    def generate(self, prompt: str, *, max_tokens: int, stop: threading.Event) -> Iterator[str]:
+        for chunk in self.model.create_completion(prompt, max_tokens=max_tokens, stream=True):
+            if stop.is_set():
+                return
+            text = chunk["choices"][0].get("text") or ""
+            if text:
+                yield text
+
+
+def load_llm(path: Path) -> LlamaCppLLM:
+    """registry loader"""
+    if path.suffix != ".gguf":
+        raise ModelUnavailableError(f"unsupported model format: {path.suffix}")
+    return LlamaCppLLM(path)
+
+
+_standin: Optional[LocalStandInLLM] = None
+
+
+def get_llm() -> PlantLLM:
+    global _standin
+    if settings.LLM_MODEL:
+        return registry.get("llm")
+    if _standin is None:
+        _standin = LocalStandInLLM(settings.LLM_STANDIN_TOKEN_MS)
+    return _standin
+
+
+def register_model() -> None:
+    if settings.LLM_MODEL:
+        registry.register("llm", load_llm, models_root() / settings.LLM_MODEL)
+
+
+# -----------------------
+# Prompt
+# -----------------------
+async def retrieve_context(question: str, species: Optional[str] = None) -> List[Dict[str, Any]]:
+    """PlantWiki/PestWiki 근거 검색 (실패해도 답변은 근거 없이 계속)"""
+    query = f"{species} {question}" if species else question
+    try:
+        return await retrieval.search(query)
+    except Exception as e:
+        logger.warning("wiki retrieval failed: %s", e)
+        return []
+
+
+def build_prompt(question: str, context: List[str], species: Optional[str] = None) -> str:
+    lines = ["당신은 반려식물 관리 도우미입니다. 참고 자료에 근거해 간결하게 한국어로 답하세요."]
+    if species:
+        lines.append(f"식물 종: {species}")
+    if context:
+        lines.append("참고 자료: " + " ".join(context))
+    lines.append(f"질문: {question}")
+    lines.append("답변:")
+    return "\n".join(lines)
+
+
+def build_diary_prompt(
+    title: str,
+    content: Optional[str],
+    hashtag: Optional[str] = None,
+    weather: Optional[str] = None,
+) -> str:
+    """Diary.plant_content 용: 일기 속 반려식물의 시점에서 쓰는 짧은 답장"""
+    lines = ["당신은 이 일기에 등장하는 반려식물입니다. 식물의 시점에서 주인에게 2~3문장으로 다정하게 답하세요."]
+    if weather:
+        lines.append(f"날씨: {weather}")
+    lines.append(f"일기 제목: {title}")
+    if content:
+        lines.append(f"일기 내용: {content}")
+    if hashtag:
+        lines.append(f"해시태그: {hashtag}")
+    lines.append("질문: 오늘 일기에 식물의 입장에서 답장을 써 주세요.")
+    lines.append("답변:")
+    return "\n".join(lines)
+
+
+# -----------------------
+# Generation queue
+# -----------------------
+class _Limiter:
+    """동시 생성 수(LLM_MAX_CONCURRENT) + 대기열 길이(LLM_QUEUE_MAX) 제한. 이벤트 루프별로 생성."""
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self.waiting = 0
+        self.running = 0
+
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._sem is None:
+            self._loop = loop
+            self._sem = asyncio.Semaphore(max(1, settings.LLM_MAX_CONCURRENT))
+            self.waiting = self.running = 0
+        return self._sem
+
+    def full(self) -> bool:
+        return self.waiting >= settings.LLM_QUEUE_MAX
+
+    def busy(self) -> bool:
+        return self.semaphore().locked()
+
+
+_limiter = _Limiter()
+_stats: Dict[str, Any] = {"started": 0, "completed": 0, "cancelled": 0, "rejected": 0, "batches": 0, "ttft_ms_last": None}
+
+
+def check_capacity() -> None:
+    """스트림 시작 전에 호출 (대기열이 가득 차면 예외)"""
+    if _limiter.full():
+        _stats["rejected"] += 1
+        raise GenerationQueueFull("assistant is busy, retry later")
+
+
+@asynccontextmanager
+async def _generation_slot() -> AsyncIterator[None]:
+    check_capacity()
+    sem = _limiter.semaphore()
+    _limiter.waiting += 1
+    try:
+        await sem.acquire()
+    finally:
+        _limiter.waiting -= 1
+    _limiter.running += 1
+    try:
+        yield
+    finally:
+        _limiter.running -= 1
+        sem.release()
+
+
+async def stream_tokens(prompt: str, *, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+    """
+    생성 스레드 → asyncio.Queue 로 토큰 전달.
+    소비자가 중간에 멈추면(클라이언트 연결 끊김 → 제너레이터 취소) stop 을 set 해 스레드도 바로 종료.
+    """
+    async with _generation_slot():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+        started = time.perf_counter()
+        first = True
+
+        def produce() -> None:
+            try:
+                llm = get_llm()
+                for token in llm.generate(prompt, max_tokens=max_tokens or settings.LLM_MAX_TOKENS, stop=stop):
+                    loop.call_soon_threadsafe(queue.put_nowait, token)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        _stats["started"] += 1
+        loop.run_in_executor(None, produce)
+        completed = False
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    completed = True
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                if first:
+                    _stats["ttft_ms_last"] = round((time.perf_counter() - started) * 1000.0, 3)
+                    first = False
+                yield item
+        finally:
+            # 스레드 종료는 기다리지 않음 (다음 토큰에서 stop 확인 후 종료)
+            stop.set()
+            _stats["completed" if completed else "cancelled"] += 1
+
+
+def _generate_all(prompts: List[str], max_tokens: int, stop: threading.Event) -> List[Union[str, Exception]]:
+    llm = get_llm()
+    out: List[Union[str, Exception]] = []
+    for prompt in prompts:
+        if stop.is_set():  # 취소됨 → 남은 프롬프트는 생성하지 않음
+            break
+        try:
+            out.append("".join(llm.generate(prompt, max_tokens=max_tokens, stop=stop)).strip())
+        except Exception as e:
+            out.append(e)
+    return out
+
+
+async def complete_batch(prompts: List[str], *, max_tokens: Optional[int] = None) -> List[Union[str, Exception]]:
+    """
+    백그라운드 작업용 일괄 생성. 생성 slot 1개로 여러 프롬프트를 차례로 처리 →
+    대화형 스트리밍 요청이 쓸 slot 을 배치 크기만큼 차지하지 않음.
+    항목별 실패는 결과 자리에 예외 객체 (모델 로드 실패는 전체 예외).
+    호출 쪽이 취소되면(워커 stop/종료) stop 을 set 해 스레드도 다음 토큰에서 종료.
+    """
+    async with _generation_slot():
+        _stats["batches"] += 1
+        stop = threading.Event()
+        try:
+            return await asyncio.to_thread(_generate_all, prompts, max_tokens or settings.LLM_MAX_TOKENS, stop)
+        finally:
+            stop.set()
+
+
+def stats() -> Dict[str, Any]:
+    return {
+        **_stats,
+        "running": _limiter.running,
+        "waiting": _limiter.waiting,
+        "model": settings.LLM_MODEL or "local-stand-in",
+    }
+
+
+register_model()
@@ -0,0 +1,133 @@
+# 이미지 전처리 공용 단계 (분류/진단 모델이 같은 디코드 결과를 공유)
+#
+# - 업로드 버퍼에서 1회 디코드 (JPEG 는 draft 모드로 필요한 해상도까지만 DCT 디코드)
+# - 모델 입력 크기별 리사이즈 결과(uint8, HWC, C-contiguous)를 메모이즈
+# - 배치 텐서(NCHW float32, contiguous)의 각 slot 에 정규화까지 한 번에 기록 (중간 float 배열 없음)
+# - 워커 프로세스에는 uint8 텐서를 shared memory 로 넘겨 pickle 복사를 피함
+
+from __future__ import annotations
+
+import io
+import threading
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.app.ml.registry import ModelUnavailableError
+
+try:
+    from PIL import Image
+except Exception:  # pragma: no cover
+    Image = None  # type: ignore
+
+# ImageNet 정규화 값 (일반적인 분류기 export 기준)
+MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32).reshape(1, 3, 1, 1)
+STD = np.array([0.229, 0.224, 0.225], dtype=np.float32).reshape(1, 3, 1, 1)
+
+# x = (u8 / 255 - MEAN) / STD  →  x = u8 * _SCALE - _SHIFT
+_SCALE = (1.0 / (255.0 * STD)).reshape(3, 1, 1)
+_SHIFT = (MEAN / STD).reshape(3, 1, 1)
+
+
+class InvalidImageError(ValueError):
+    """이미지 디코드 실패 (상위에서 400 처리)"""
+
+
+@dataclass
+class PreparedImage:
+    """
+    디코드된 RGB 이미지 1장. resized(size) 는 크기별로 한 번만 계산.
+    여러 요청/모델이 같은 객체를 읽어도 되도록 메모이즈는 lock 으로 보호.
+    """
+
+    image: Any  # PIL.Image (RGB) 또는 None (shared memory 에서 받은 경우)
+    width: int
+    height: int
+    _resized: Dict[int, np.ndarray] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def decode(cls, data: bytes, max_size: int) -> "PreparedImage":
+        """JPEG/PNG bytes → RGB. max_size 는 이 이미지를 쓸 모델 입력 중 가장 큰 값."""
+        if Image is None:
+            raise ModelUnavailableError("Pillow is not installed")
+        try:
+            im = Image.open(io.BytesIO(data))
+            # JPEG: max_size 이상인 가장 작은 1/2^n 배율로 디코드 (큰 사진에서 디코드 비용 대부분 절약)
+            im.draft("RGB", (max_size, max_size))
+            im = im.convert("RGB")
+            im.load()
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            raise InvalidImageError(str(e)) from e
+        return cls(image=im, width=im.width, height=im.height)
+
+    @classmethod
+    def from_array(cls, resized: np.ndarray) -> "PreparedImage":
+        """이미 리사이즈된 (S, S, 3) uint8 배열 (워커 프로세스에서 shared memory 로 받은 경우)"""
+        size = resized.shape[0]
+        prepared = cls(image=None, width=size, height=size)
+        prepared._resized[size] = resized
+        return prepared
+
+    def resized(self, size: int) -> np.ndarray:
+        arr = self._resized.get(size)
+        if arr is not None:
+            return arr
+        with self._lock:
+            arr = self._resized.get(size)
+            if arr is None:
+                if self.image is None:
+                    raise ValueError(f"no source image for size {size}")
+                arr = np.asarray(self.image.resize((size, size), Image.BILINEAR), dtype=np.uint8)
+                self._resized[size] = arr
+        return arr
+
+    def fill(self, out: np.ndarray, size: int) -> None:
+        """out: (3, size, size) float32 view (배치 텐서의 한 slot) 에 정규화 결과를 직접 기록"""
+        np.multiply(self.resized(size).transpose(2, 0, 1), _SCALE, out=out)
+        out -= _SHIFT
+
+
+def make_batch(
+    images: Sequence[PreparedImage], size: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """(N, 3, size, size) float32 C-contiguous 배치. out 을 주면 재사용 (앞쪽 N개 slot 만 사용)."""
+    if out is None or out.shape[0] < len(images) or out.shape[1:] != (3, size, size):
+        out = np.empty((len(images), 3, size, size), dtype=np.float32)
+    batch = out[: len(images)]
+    for i, image in enumerate(images):
+        image.fill(batch[i], size)
+    return batch
+
+
+# -----------------------
+# Shared memory (API 프로세스 → 워커 프로세스)
+# -----------------------
+SharedHandle = Dict[str, Any]
+
+
+def share(arr: np.ndarray) -> Tuple[shared_memory.SharedMemory, SharedHandle]:
+    """배열을 shared memory 에 1회 복사. 반환한 블록은 작업이 끝나면 호출 측에서 close()+unlink()."""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, {"name": shm.name, "shape": tuple(arr.shape), "dtype": arr.dtype.str}
+
+
+def attach(handle: SharedHandle) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """워커 쪽: 복사 없이 배열 view 를 얻음. 사용 후 view 를 버리고 shm.close()."""
+    # 워커는 부모의 resource tracker 를 공유하므로 attach 로 인한 중복 등록/해제 문제 없음
+    shm = shared_memory.SharedMemory(name=handle["name"])
+    arr = np.ndarray(handle["shape"], dtype=np.dtype(handle["dtype"]), buffer=shm.buf)
+    return shm, arr
+
+
+def release(shm: Optional[shared_memory.SharedMemory]) -> None:
+    if shm is None:
+        return
+    try:
+        shm.close()
+        shm.unlink()
+    except FileNotFoundError:  # pragma: no cover
+        pass
@@ -0,0 +1,391 @@
+# 미디어 보관소 전체 종 재분류 (새 species 모델 배포 후 UserPlant.species 갱신)
+#
+# 사용법 (프로젝트 루트에서):
+#   python -m backend.app.ml.reclassify --checkpoint .cache/reclassify.json
+#   python -m backend.app.ml.reclassify --model classifier/species-v2.onnx --workers 8 --min-score 0.6
+#   python -m backend.app.ml.reclassify --dry-run --output preds.jsonl --limit 10000
+#   python -m backend.app.ml.reclassify --plant-map plant_map.json    # {"<UUID plant_id>": <UserPlant.plant_id>, ...}
+#
+# - storage.media_root_abs() 를 경로 순(= 업로드 날짜 순)으로 훑으며 chunk 단위로 프로세스 풀에 분배
+#   (디렉터리 목록은 한 번에 한 폴더만 메모리에 올림)
+# - 완료된 연속 구간의 마지막 경로를 체크포인트에 원자적으로 기록 → 중단 후 같은 명령으로 이어서 실행
+#   (모델 버전이 바뀌면 --restart 필요)
+# - 이미지 옆 sidecar(<파일>.json, image_service 가 기록)의 plant_id 로 chunk 마다 UserPlant.species 일괄 UPDATE
+#   경로 순으로 처리하므로 식물마다 가장 최근의 (min-score 이상) 사진 결과가 최종 값이 됨
+# - sidecar 의 plant_id 는 업로드 API 경로의 값 그대로: 숫자면 UserPlant.plant_id,
+#   /plants API 로 만든 식물은 UUID 문자열이라 DB 와 키가 다름 → --plant-map (UUID → UserPlant.plant_id JSON) 으로 연결
+#   연결되지 않은 사진은 "unlinked" 로 세고, 한 장도 연결되지 않으면 경고 후 종료 코드 3
+# - 주기적으로 처리량(img/s)과 ETA 출력 (전체 개수는 별도 스레드가 세는 동안 ETA 는 "?")
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from backend.app.core.config import settings
+from backend.app.ml.preprocess import InvalidImageError, PreparedImage, make_batch
+from backend.app.ml.registry import file_version, models_root, registry
+from backend.app.ml.species_classification import _softmax, load_species_model
+from backend.app.services import storage
+
+IMAGE_EXTS = {".jpg", ".jpeg", ".png"}
+
+
+# -----------------------
+# Walk
+# -----------------------
+def _key(rel: str) -> Tuple[str, ...]:
+    return tuple(rel.split("/"))
+
+
+def iter_images(root: Path, *, after: Optional[str] = None, exclude: Tuple[str, ...] = ()) -> Iterator[str]:
+    """root 아래 이미지 상대 경로를 정렬 순서로. after 이하(체크포인트까지)는 디렉터리째 건너뜀."""
+    after_key = _key(after) if after else None
+
+    def walk(path: Path, prefix: Tuple[str, ...]) -> Iterator[str]:
+        try:
+            entries = sorted(os.scandir(path), key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            key = prefix + (entry.name,)
+            if entry.is_dir(follow_symlinks=False):
+                if not prefix and entry.name in exclude:
+                    continue
+                if after_key is not None and key < after_key[: len(key)]:
+                    continue
+                yield from walk(Path(entry.path), key)
+            elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTS:
+                if after_key is not None and key <= after_key:
+                    continue
+                yield "/".join(key)
+
+    yield from walk(root, ())
+
+
+def _chunked(paths: Iterator[str], size: int, limit: Optional[int]) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for n, rel in enumerate(paths):
+        if limit is not None and n >= limit:
+            break
+        chunk.append(rel)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# -----------------------
+# Worker process side
+# -----------------------
+def _init_worker(model_path: str, version: str, threads: int) -> None:
+    settings.ML_INTRA_OP_THREADS = threads  # 병렬성은 프로세스 수로 확보
+    registry.register("species", load_species_model, Path(model_path), version)
+    registry.get("species")
+
+
+def _read_sidecar(path: str) -> Dict[str, Any]:
+    # --root 가 MEDIA_ROOT 와 다를 수 있으므로 storage.read_meta 대신 root 기준으로 직접 읽음
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _score_chunk(root: str, rels: List[str], input_size: int, top_k: int) -> List[Dict[str, Any]]:
+    """chunk 1개 = 배치 1개. 결과: [{"path", "plant_id", "preds": [[species, score], ...] | None, "error"}]"""
+    model = registry.get("species")
+    out: List[Dict[str, Any]] = []
+    prepared: List[PreparedImage] = []
+    ok: List[Dict[str, Any]] = []
+    for rel in rels:
+        meta = _read_sidecar(os.path.join(root, rel + storage.META_SUFFIX))
+        item: Dict[str, Any] = {"path": rel, "plant_id": meta.get("plant_id"), "preds": None, "error": None}
+        out.append(item)
+        try:
+            with open(os.path.join(root, rel), "rb") as f:
+                prepared.append(PreparedImage.decode(f.read(), input_size))
+            ok.append(item)
+        except (OSError, InvalidImageError) as e:
+            item["error"] = str(e)[:200]
+    if prepared:
+        probs = _softmax(np.asarray(model.runtime(make_batch(prepared, input_size)), dtype=np.float32))
+        k = min(top_k, probs.shape[1])
+        top = np.argsort(-probs, axis=1)[:, :k]
+        for item, row, idx in zip(ok, probs, top):
+            item["preds"] = [[model.labels[i], round(float(row[i]), 6)] for i in idx]
+    return out
+
+
+# -----------------------
+# Checkpoint / progress
+# -----------------------
+@dataclass
+class Checkpoint:
+    model_version: Optional[str] = None
+    last_path: Optional[str] = None
+    processed: int = 0
+    updated: int = 0
+    unlinked: int = 0
+    low_score: int = 0
+    errors: int = 0
+    elapsed_seconds: float = 0.0
+    path: Optional[Path] = field(default=None, repr=False)
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "Checkpoint":
+        if path is None or not path.exists():
+            return cls(path=path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(**data, path=path)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        data = asdict(self)
+        data.pop("path")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class _Counter(threading.Thread):
+    """남은 이미지 수를 세는 스레드 (ETA 용, 본 작업과 병렬)"""
+
+    def __init__(self, root: Path, after: Optional[str], exclude: Tuple[str, ...], limit: Optional[int]):
+        super().__init__(daemon=True)
+        self.args = (root, after, exclude)
+        self.limit = limit
+        self.total: Optional[int] = None
+
+    def run(self) -> None:
+        root, after, exclude = self.args
+        n = sum(1 for _ in iter_images(root, after=after, exclude=exclude))
+        self.total = min(n, self.limit) if self.limit is not None else n
+
+
+def _fmt_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}h{m:02d}m{s:02d}s" if h else f"{m}m{s:02d}s"
+
+
+# -----------------------
+# Main
+# -----------------------
+async def _write_species(updates: Dict[int, str]) -> int:
+    from backend.app.core import database
+    from backend.app.db.crud import user_plant
+
+    async with database.AsyncSessionLocal() as db:
+        n = await user_plant.bulk_set_species(db, updates)
+        await db.commit()
+    return n
+
+
+def load_plant_map(path: Optional[str]) -> Dict[str, int]:
+    """--plant-map JSON ({"<sidecar plant_id>": <UserPlant.plant_id>}) 로드"""
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {str(k): int(v) for k, v in data.items()}
+
+
+def resolve_plant_id(raw: Any, plant_map: Dict[str, int]) -> Optional[int]:
+    """sidecar plant_id → UserPlant.plant_id (명시적 매핑 우선, 없으면 숫자 id 만 그대로 사용)"""
+    if raw is None:
+        return None
+    key = str(raw)
+    if key in plant_map:
+        return plant_map[key]
+    return int(key) if key.isdigit() else None
+
+
+def _plant_updates(
+    results: List[Dict[str, Any]], min_score: float, ckpt: Checkpoint, plant_map: Dict[str, int]
+) -> Dict[int, str]:
+    updates: Dict[int, str] = {}
+    for item in results:
+        if item["error"]:
+            ckpt.errors += 1
+            continue
+        plant_id = resolve_plant_id(item["plant_id"], plant_map)
+        if plant_id is None:
+            ckpt.unlinked += 1
+            continue
+        species, score = item["preds"][0]
+        if score < min_score:
+            ckpt.low_score += 1
+            continue
+        updates[plant_id] = species  # chunk 안에서도 뒤(최근) 사진이 우선
+    return updates
+
+
+async def run(args: argparse.Namespace) -> int:
+    from backend.app.core import database
+
+    root = Path(args.root) if args.root else storage.media_root_abs()
+    model_path = Path(args.model) if args.model else Path(settings.SPECIES_MODEL)
+    if not model_path.is_absolute():
+        model_path = models_root() / model_path
+    if not model_path.exists():
+        print(f"model not found: {model_path}", file=sys.stderr)
+        return 2
+    version = args.version or file_version(model_path)
+    if not args.dry_run and not database.db_configured():
+        print("database is not configured (use --dry-run to score only)", file=sys.stderr)
+        return 2
+
+    ckpt = Checkpoint.load(Path(args.checkpoint) if args.checkpoint else None)
+    if args.restart or ckpt.model_version is None:
+        ckpt = Checkpoint(model_version=version, path=ckpt.path)
+    elif ckpt.model_version != version:
+        print(f"checkpoint is for model {ckpt.model_version}, not {version} (use --restart)", file=sys.stderr)
+        return 2
+    if ckpt.last_path:
+        print(f"resuming after {ckpt.last_path} ({ckpt.processed} images done)")
+
+    try:
+        plant_map = load_plant_map(args.plant_map)
+    except (OSError, ValueError) as e:
+        print(f"cannot read plant map {args.plant_map}: {e}", file=sys.stderr)
+        return 2
+
+    exclude = tuple(x for x in args.exclude.split(",") if x)
+    counter = _Counter(root, ckpt.last_path, exclude, args.limit)
+    counter.start()
+    output = open(args.output, "a", encoding="utf-8") if args.output else None
+
+    pool = ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(str(model_path), version, args.threads),
+    )
+    pending: Deque[Tuple[List[str], Future]] = deque()
+    started = time.perf_counter()
+    base_elapsed = ckpt.elapsed_seconds
+    base_counts = (ckpt.processed, ckpt.errors, ckpt.unlinked)
+    done_this_run = 0
+    last_report = started
+
+    def report(final: bool = False) -> None:
+        elapsed = time.perf_counter() - started
+        rate = done_this_run / elapsed if elapsed > 0 else 0.0
+        eta = "?"
+        if counter.total is not None and rate > 0:
+            eta = _fmt_duration(max(0, counter.total - done_this_run) / rate)
+        print(
+            f"{'done' if final else 'progress'}: {ckpt.processed} images "
+            f"({rate:.1f} img/s), {ckpt.updated} species updates, {ckpt.unlinked} unlinked, "
+            f"{ckpt.low_score} low score, {ckpt.errors} errors, "
+            f"remaining {'?' if counter.total is None else max(0, counter.total - done_this_run)}, eta {eta}",
+            flush=True,
+        )
+
+    async def drain_head() -> None:
+        nonlocal done_this_run, last_report
+        rels, future = pending.popleft()
+        results = await asyncio.wrap_future(future)
+        updates = _plant_updates(results, args.min_score, ckpt, plant_map)
+        if updates and not args.dry_run:
+            await _write_species(updates)
+        ckpt.updated += len(updates)
+        if output is not None:
+            for item in results:
+                output.write(json.dumps(item, ensure_ascii=False) + "\n")
+            output.flush()
+        # 앞선 chunk 가 모두 끝난 뒤에만 체크포인트 전진 (순서대로 drain)
+        ckpt.last_path = rels[-1]
+        ckpt.processed += len(rels)
+        ckpt.elapsed_seconds = base_elapsed + (time.perf_counter() - started)
+        done_this_run += len(rels)
+        ckpt.save()
+        if time.perf_counter() - last_report >= args.report_seconds:
+            last_report = time.perf_counter()
+            report()
+
+    try:
+        max_in_flight = args.workers * 2
+        for chunk in _chunked(iter_images(root, after=ckpt.last_path, exclude=exclude), args.chunk_size, args.limit):
+            pending.append(
+                (chunk, pool.submit(_score_chunk, str(root), chunk, settings.SPECIES_INPUT_SIZE, args.top_k))
+            )
+            while len(pending) >= max_in_flight or (pending and pending[0][1].done()):
+                await drain_head()
+        while pending:
+            await drain_head()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+        if output is not None:
+            output.close()
+        await database.dispose_engines()
+        ckpt.save()
+    report(final=True)
+
+    # 이번 실행에서 예측은 됐지만 식물에 연결되지 않은 사진 (id 체계 불일치는 조용히 넘어가지 않음)
+    scored = (ckpt.processed - base_counts[0]) - (ckpt.errors - base_counts[1])
+    unlinked = ckpt.unlinked - base_counts[2]
+    if unlinked:
+        print(
+            f"WARNING: {unlinked} of {scored} scored images have no UserPlant.plant_id "
+            "(sidecar plant_id is not numeric and not in --plant-map)",
+            file=sys.stderr,
+        )
+    if scored > 0 and unlinked == scored:
+        print(
+            "ERROR: no image could be linked to a UserPlant; nothing was written. "
+            "Provide --plant-map and re-run with --restart",
+            file=sys.stderr,
+        )
+        return 3
+    return 0
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Re-classify stored plant images and update UserPlant.species")
+    p.add_argument("--root", default=None, help="미디어 폴더 (기본: storage.media_root_abs())")
+    p.add_argument("--model", default=None, help="ML_MODELS_DIR 기준 모델 경로 (기본: SPECIES_MODEL)")
+    p.add_argument("--version", default=None, help="모델 버전 (기본: 파일명-크기-수정시각)")
+    p.add_argument("--checkpoint", default=None, help="체크포인트 JSON 경로 (없으면 재개 불가)")
+    p.add_argument("--restart", action="store_true", help="체크포인트 무시하고 처음부터")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--threads", type=int, default=1, help="워커 프로세스 당 추론 스레드 수")
+    p.add_argument("--chunk-size", type=int, default=64, help="워커에 한 번에 넘기는 이미지 수 (= 배치 크기)")
+    p.add_argument("--top-k", type=int, default=3)
+    p.add_argument("--min-score", type=float, default=0.5, help="이 점수 미만이면 species 를 바꾸지 않음")
+    p.add_argument("--exclude", default="diagnosis", help="건너뛸 최상위 폴더 (쉼표 구분)")
+    p.add_argument("--limit", type=int, default=None, help="이번 실행에서 처리할 최대 이미지 수")
+    p.add_argument("--output", default=None, help="이미지별 예측을 JSONL 로 추가 기록")
+    p.add_argument("--report-seconds", type=float, default=10.0)
+    p.add_argument("--plant-map", default=None, help="sidecar plant_id(UUID) → UserPlant.plant_id 매핑 JSON")
+    p.add_argument("--dry-run", action="store_true", help="DB 에 쓰지 않음")
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    return asyncio.run(run(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
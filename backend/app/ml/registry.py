@@ -0,0 +1,249 @@
+# 모델 레지스트리: 첫 사용 시 지연 로드, 가중치 memory-map, lifespan 워밍업, 무중단 버전 교체
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+from backend.app.core.config import settings
+
+try:
+    import resource  # Windows 에는 없음
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[Path], Any]
+
+
+class ModelUnavailableError(RuntimeError):
+    """모델 파일/런타임이 없음 (상위에서 503 처리)"""
+
+
+def models_root() -> Path:
+    root = Path(settings.ML_MODELS_DIR)
+    if root.is_absolute():
+        return root
+    # ROOT_DIR 은 backend/ → 그 상위가 project root(pland/)
+    return settings.ROOT_DIR.parent / root
+
+
+# -----------------------
+# Memory / mmap helpers
+# -----------------------
+def rss_bytes() -> int:
+    """현재 프로세스 RSS (Linux: /proc, 그 외: 최대 RSS 로 근사)"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        if resource is None:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def load_npz_mmap(path: Path) -> Dict[str, np.ndarray]:
+    """
+    np.savez(비압축) 파일의 각 배열을 복사 없이 memory-map 으로 연다.
+    fork/spawn 된 워커들도 같은 파일을 매핑하므로 페이지 캐시를 공유함.
+    압축(savez_compressed) 항목은 일반 로드로 폴백.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as raw:
+        for info in zf.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                with zf.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+                continue
+            # local file header(30 bytes) + 파일명 + extra 다음이 .npy 본문
+            raw.seek(info.header_offset + 26)
+            name_len = int.from_bytes(raw.read(2), "little")
+            extra_len = int.from_bytes(raw.read(2), "little")
+            raw.seek(info.header_offset + 30 + name_len + extra_len)
+            major, _ = np.lib.format.read_magic(raw)
+            read_header = np.lib.format.read_array_header_1_0 if major == 1 else np.lib.format.read_array_header_2_0
+            shape, fortran, dtype = read_header(raw)
+            if dtype.hasobject:
+                raise ModelUnavailableError(f"object arrays are not supported: {path}:{name}")
+            arrays[name] = np.memmap(
+                path, dtype=dtype, mode="r", shape=shape, order="F" if fortran else "C", offset=raw.tell()
+            )
+    return arrays
+
+
+def file_version(path: Path) -> str:
+    """명시 버전이 없을 때: 파일명 + 크기 + 수정시각"""
+    st = path.stat()
+    return f"{path.stem}-{st.st_size:x}-{int(st.st_mtime):x}"
+
+
+# -----------------------
+# Registry
+# -----------------------
+@dataclass
+class ModelEntry:
+    name: str
+    loader: Loader
+    path: Path
+    version: Optional[str] = None
+    model: Any = None
+    loaded_at: Optional[float] = None
+    load_ms: Optional[float] = None
+    rss_delta_bytes: Optional[int] = None
+    mapped_bytes: int = 0
+    swaps: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "version": self.version,
+            "loaded": self.model is not None,
+            "loaded_at": self.loaded_at,
+            "load_ms": round(self.load_ms, 3) if self.load_ms is not None else None,
+            "rss_delta_bytes": self.rss_delta_bytes,
+            "mapped_bytes": self.mapped_bytes,
+            "swaps": self.swaps,
+        }
+
+
+def _mapped_bytes(model: Any) -> int:
+    arrays = getattr(model, "arrays", None) or {}
+    return sum(a.nbytes for a in arrays.values() if isinstance(a, np.memmap))
+
+
+class ModelRegistry:
+    """
+    사용 예)
+        registry.register("species", load_species, models_root() / "classifier/species.onnx")
+        model = registry.get("species")         # 첫 호출 시 로드 (스레드 안전)
+        await registry.swap("species", new_path)  # 새 버전 로드 후 참조만 교체
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, ModelEntry] = {}
+
+    def register(self, name: str, loader: Loader, path: Path, version: Optional[str] = None) -> None:
+        old = self._entries.get(name)
+        if old is not None and old.path == path and old.loader is loader:
+            return
+        self._entries[name] = ModelEntry(name=name, loader=loader, path=path, version=version)
+
+    def names(self) -> Iterable[str]:
+        return list(self._entries)
+
+    def _entry(self, name: str) -> ModelEntry:
+        entry = self._entries.get(name)
+        if entry is None:
+            raise ModelUnavailableError(f"model not registered: {name}")
+        return entry
+
+    @staticmethod
+    def _load(entry: ModelEntry, path: Path) -> Dict[str, Any]:
+        if not path.exists():
+            raise ModelUnavailableError(f"model not found: {path}")
+        rss0 = rss_bytes()
+        t0 = time.perf_counter()
+        model = entry.loader(path)
+        return {
+            "model": model,
+            "load_ms": (time.perf_counter() - t0) * 1000.0,
+            "rss_delta_bytes": rss_bytes() - rss0,
+            "mapped_bytes": _mapped_bytes(model),
+            "loaded_at": time.time(),
+        }
+
+    def get(self, name: str) -> Any:
+        entry = self._entry(name)
+        model = entry.model
+        if model is not None:
+            return model
+        with entry.lock:
+            if entry.model is None:
+                loaded = self._load(entry, entry.path)
+                entry.version = entry.version or file_version(entry.path)
+                for k, v in loaded.items():
+                    setattr(entry, k, v)
+                logger.info(
+                    "model %s loaded (%s) in %.1fms, rss +%d bytes",
+                    name, entry.version, entry.load_ms, entry.rss_delta_bytes,
+                )
+            return entry.model
+
+    def version(self, name: str) -> Optional[str]:
+        entry = self._entry(name)
+        if entry.version is None and entry.path.exists():
+            entry.version = file_version(entry.path)
+        return entry.version
+
+    async def aget(self, name: str) -> Any:
+        entry = self._entry(name)
+        if entry.model is not None:
+            return entry.model
+        return await asyncio.to_thread(self.get, name)
+
+    async def warm_up(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """lifespan 에서 호출. 실패는 기록만 하고 계속 (해당 모델 요청은 503)."""
+        errors: Dict[str, Optional[str]] = {}
+        for name in names:
+            try:
+                await self.aget(name)
+                errors[name] = None
+            except Exception as e:
+                logger.warning("model %s warm-up failed: %s", name, e)
+                errors[name] = str(e)
+        return errors
+
+    async def swap(self, name: str, path: Optional[Path] = None, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        새 버전을 별도 스레드에서 로드한 뒤 참조만 교체.
+        교체 전에 시작된 추론은 기존 객체로 끝나고, 이후 요청부터 새 버전 사용 (무중단).
+        """
+        from backend.app.ml import inference_cache
+
+        entry = self._entry(name)
+        path = path or entry.path
+        loaded = await asyncio.to_thread(self._load, entry, path)
+        with entry.lock:
+            previous = entry.version
+            for k, v in loaded.items():
+                setattr(entry, k, v)
+            entry.path = path
+            entry.version = version or file_version(path)
+            entry.swaps += 1
+        logger.info("model %s swapped to %s", name, entry.version)
+        if previous != entry.version:
+            # 이전 버전 결과는 다시 쓰이지 않음 → 캐시(특히 디스크)에서 정리
+            removed = await asyncio.to_thread(inference_cache.get_cache().prune_model, name, entry.version)
+            logger.info("inference cache: pruned %d entries of %s", removed, name)
+        return entry.info()
+
+    def unload(self, name: str) -> None:
+        entry = self._entry(name)
+        with entry.lock:
+            entry.model = None
+            entry.loaded_at = entry.load_ms = entry.rss_delta_bytes = None
+            entry.mapped_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rss_bytes": rss_bytes(),
+            "models": {name: e.info() for name, e in list(self._entries.items())},
+        }
+
+
+registry = ModelRegistry()
@@ -0,0 +1,313 @@
+# PlantWiki / PestWiki 인메모리 검색 인덱스 (식물 도우미 답변의 근거 자료)
+#
+# - BM25 역색인 + 해시 TF 벡터 코사인(NumPy) 두 순위를 RRF 로 결합
+#   (한글은 조사가 붙어도 맞도록 단어 + 음절 bigram 으로 토큰화)
+# - 첫 검색 시 전체 로드, 이후에는 커밋된 위키 변경(crud → database.track_change)만 다시 읽어 반영
+# - 질문 당 DB 조회 없이 수 ms 내 top-k 반환
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import re
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import Row
+
+from backend.app.core import database
+from backend.app.core.config import settings
+from backend.app.db.crud import pest_wiki, plant_wiki
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+_RRF_K = 60  # Reciprocal Rank Fusion 상수
+_KINDS = {"plant_wiki": "plant", "pest_wiki": "pest"}
+_KIND_CODES = {"plant": 1, "pest": 2}
+
+
+def tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        tokens.append(word)
+        if len(word) > 2 and _HANGUL_RE.search(word):
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+@dataclass
+class WikiDoc:
+    kind: str  # "plant" | "pest"
+    idx: int
+    title: str
+    text: str
+
+
+def plant_doc(row: Row) -> WikiDoc:
+    parts = [f"{row.species} -"]
+    if row.sunlight:
+        parts.append(f"햇빛: {row.sunlight},")
+    if row.watering is not None:
+        parts.append(f"물주기: {row.watering}일마다,")
+    if row.flowering:
+        parts.append(f"개화: {row.flowering},")
+    if row.fertilizer:
+        parts.append(f"비료: {row.fertilizer},")
+    if row.toxic:
+        parts.append(f"독성: {row.toxic},")
+    return WikiDoc("plant", row.idx, row.species, " ".join(parts).rstrip(",-").strip())
+
+
+def pest_doc(row: Row) -> WikiDoc:
+    title = f"병해충 {row.pest_id}"
+    return WikiDoc("pest", row.idx, title, f"{title} - 원인: {row.cause}, 대처: {row.cure}")
+
+
+# -----------------------
+# Index
+# -----------------------
+class WikiIndex:
+    """
+    문서는 slot 단위로 저장 (삭제된 slot 은 재사용).
+    BM25 는 term → {slot: tf} 역색인, 코사인은 (capacity, dim) float32 행렬 한 번의 matvec.
+    """
+
+    def __init__(self, *, dim: int, k1: float = 1.5, b: float = 0.75, capacity: int = 256):
+        self.dim = dim
+        self.k1 = k1
+        self.b = b
+        self._docs: List[Optional[WikiDoc]] = []
+        self._slots: Dict[Tuple[str, int], int] = {}
+        self._free: List[int] = []
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._terms: Dict[int, Counter] = {}
+        self._lengths = np.zeros(capacity, dtype=np.float32)
+        self._kinds = np.zeros(capacity, dtype=np.int8)  # 0 = 빈 slot
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._total_len = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # ---- vectors ----
+    def _embed(self, tf: Counter) -> np.ndarray:
+        """feature hashing (부호 포함) + 로그 TF, L2 정규화"""
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for term, count in tf.items():
+            h = zlib.crc32(term.encode("utf-8"))
+            vec[h % self.dim] += (1.0 if (h >> 31) & 1 else -1.0) * (1.0 + math.log(count))
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+    def _grow(self) -> None:
+        cap = len(self._lengths) * 2
+        self._lengths = np.resize(self._lengths, cap)
+        self._lengths[len(self._docs):] = 0
+        self._kinds = np.resize(self._kinds, cap)
+        self._kinds[len(self._docs):] = 0
+        vectors = np.zeros((cap, self.dim), dtype=np.float32)
+        vectors[: len(self._docs)] = self._vectors[: len(self._docs)]
+        self._vectors = vectors
+
+    # ---- updates ----
+    def upsert(self, doc: WikiDoc) -> None:
+        self.remove(doc.kind, doc.idx)
+        if self._free:
+            slot = self._free.pop()
+            self._docs[slot] = doc
+        else:
+            slot = len(self._docs)
+            if slot >= len(self._lengths):
+                self._grow()
+            self._docs.append(doc)
+        tf = Counter(tokenize(doc.text))
+        for term, count in tf.items():
+            self._postings.setdefault(term, {})[slot] = count
+        length = float(sum(tf.values()))
+        self._terms[slot] = tf
+        self._lengths[slot] = length
+        self._total_len += length
+        self._kinds[slot] = _KIND_CODES[doc.kind]
+        self._vectors[slot] = self._embed(tf)
+        self._slots[(doc.kind, doc.idx)] = slot
+
+    def remove(self, kind: str, idx: int) -> bool:
+        slot = self._slots.pop((kind, idx), None)
+        if slot is None:
+            return False
+        for term in self._terms.pop(slot):
+            postings = self._postings[term]
+            postings.pop(slot, None)
+            if not postings:
+                del self._postings[term]
+        self._total_len -= float(self._lengths[slot])
+        self._lengths[slot] = 0
+        self._kinds[slot] = 0
+        self._vectors[slot] = 0
+        self._docs[slot] = None
+        self._free.append(slot)
+        return True
+
+    # ---- search ----
+    def _bm25(self, terms: Iterable[str], n: int) -> np.ndarray:
+        scores = np.zeros(n, dtype=np.float32)
+        count = len(self._slots)
+        avgdl = self._total_len / count if count else 1.0
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            slots = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+            tfs = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            idf = math.log(1.0 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            norm = tfs + self.k1 * (1.0 - self.b + self.b * self._lengths[slots] / avgdl)
+            scores[slots] += idf * tfs * (self.k1 + 1.0) / norm
+        return scores
+
+    @staticmethod
+    def _ranked(scores: np.ndarray, mask: np.ndarray, depth: int) -> np.ndarray:
+        scores = np.where(mask & (scores > 0), scores, 0)
+        depth = min(depth, int(np.count_nonzero(scores)))
+        if depth == 0:
+            return np.empty(0, dtype=np.int64)
+        top = np.argpartition(-scores, depth - 1)[:depth]
+        return top[np.argsort(-scores[top])]
+
+    def search(self, query: str, k: int, kind: Optional[str] = None) -> List[Tuple[WikiDoc, float]]:
+        tf = Counter(tokenize(query))
+        n = len(self._docs)
+        if not tf or not n:
+            return []
+        mask = self._kinds[:n] != 0 if kind is None else self._kinds[:n] == _KIND_CODES[kind]
+        depth = k * 4
+        fused: Dict[int, float] = {}
+        bm25 = self._bm25(tf.keys(), n)
+        cosine = self._vectors[:n] @ self._embed(tf)
+        for ranking in (self._ranked(bm25, mask, depth), self._ranked(cosine, mask, depth)):
+            for rank, slot in enumerate(ranking.tolist()):
+                fused[slot] = fused.get(slot, 0.0) + 1.0 / (_RRF_K + rank + 1)
+        best = sorted(fused.items(), key=lambda kv: kv[1], reverse=True)[:k]
+        return [(self._docs[slot], score) for slot, score in best]  # type: ignore[misc]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "docs": len(self._slots),
+            "terms": len(self._postings),
+            "capacity": len(self._lengths),
+            "vector_bytes": int(self._vectors.nbytes),
+        }
+
+
+# -----------------------
+# Module state / refresh
+# -----------------------
+_index = WikiIndex(dim=settings.RETRIEVAL_DIM)
+_loaded = False
+_stale: Set[Tuple[str, int]] = set()
+_lock: Optional[asyncio.Lock] = None
+_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+_stats: Dict[str, Any] = {"full_loads": 0, "refreshes": 0, "refreshed_rows": 0, "last_refresh_ms": None, "last_search_ms": None}
+_PAGE = 500
+
+
+def _on_commit(changed: database.ChangedRows) -> None:
+    _stale.update((table, idx) for table, idx in changed if table in _KINDS)
+
+
+database.on_commit(_on_commit)
+
+
+def _refresh_lock() -> asyncio.Lock:
+    global _lock, _lock_loop
+    loop = asyncio.get_running_loop()
+    if _lock is None or _lock_loop is not loop:
+        _lock, _lock_loop = asyncio.Lock(), loop
+    return _lock
+
+
+async def _load_all(db) -> None:
+    global _index
+    index = WikiIndex(dim=settings.RETRIEVAL_DIM)
+    for crud, to_doc in ((plant_wiki, plant_doc), (pest_wiki, pest_doc)):
+        last_idx: Optional[int] = None
+        while True:
+            rows = await crud.list_rows_by_cursor(db, limit=_PAGE, last_idx=last_idx)
+            for row in rows[:_PAGE]:
+                index.upsert(to_doc(row))
+            if len(rows) <= _PAGE:
+                break
+            last_idx = rows[_PAGE - 1].idx
+    _index = index
+
+
+async def _apply_changes(db, changed: Set[Tuple[str, int]]) -> None:
+    for table, crud, to_doc in (("plant_wiki", plant_wiki, plant_doc), ("pest_wiki", pest_wiki, pest_doc)):
+        ids = sorted(idx for t, idx in changed if t == table)
+        if not ids:
+            continue
+        rows = await crud.list_rows_by_ids(db, ids)
+        for row in rows:
+            _index.upsert(to_doc(row))
+        for idx in set(ids) - {row.idx for row in rows}:
+            _index.remove(_KINDS[table], idx)
+
+
+async def refresh() -> None:
+    """미로드 상태면 전체 로드, 아니면 커밋된 변경분만 반영 (primary 읽기 전용 풀 사용 → 복제 지연 없음)"""
+    global _loaded
+    if _loaded and not _stale:
+        return
+    async with _refresh_lock():
+        if _loaded and not _stale:
+            return
+        t0 = time.perf_counter()
+        changed = set(_stale)
+        _stale.difference_update(changed)
+        try:
+            async with database.ReadSessionLocal() as db:
+                if not _loaded:
+                    await _load_all(db)
+                    _loaded = True
+                    _stats["full_loads"] += 1
+                else:
+                    await _apply_changes(db, changed)
+                    _stats["refreshes"] += 1
+                    _stats["refreshed_rows"] += len(changed)
+        except Exception:
+            _stale.update(changed)  # 다음 검색에서 재시도
+            raise
+        _stats["last_refresh_ms"] = round((time.perf_counter() - t0) * 1000.0, 3)
+
+
+async def search(query: str, *, k: Optional[int] = None, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+    """질문과 가까운 위키 문서 top-k. DB 미설정 시 빈 목록."""
+    if not database.db_configured():
+        return []
+    await refresh()
+    t0 = time.perf_counter()
+    hits = _index.search(query, k or settings.RETRIEVAL_TOP_K, kind)
+    _stats["last_search_ms"] = round((time.perf_counter() - t0) * 1000.0, 3)
+    return [
+        {"kind": doc.kind, "idx": doc.idx, "title": doc.title, "text": doc.text, "score": round(score, 6)}
+        for doc, score in hits
+    ]
+
+
+def invalidate(rows: Sequence[Tuple[str, int]] = ()) -> None:
+    """외부 적재(배치 스크립트 등) 후 호출. rows 가 없으면 다음 검색 때 전체 재로드."""
+    global _loaded
+    if rows:
+        _stale.update(rows)
+    else:
+        _loaded = False
+
+
+def stats() -> Dict[str, Any]:
+    return {**_index.stats(), **_stats, "loaded": _loaded, "stale": len(_stale)}
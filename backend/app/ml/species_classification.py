@@ -0,0 +1,239 @@
+# 식물 종 분류 (CPU 추론 + 동적 마이크로배치)
+#
+# 모델 형식 (settings.SPECIES_MODEL, ML_MODELS_DIR 기준):
+#   - *.onnx : onnxruntime CPUExecutionProvider 로 실행 (입력 NCHW float32, 출력 logits)
+#   - *.npz  : NumPy 선형 헤드 {"W": (3*S*S, C), "b": (C,), "labels"?: (C,)} - 로컬/테스트용
+# 라벨은 npz 의 labels, 모델 옆 <모델명>.labels.txt, SPECIES_LABELS 파일 순으로 찾음
+# (한 줄에 하나, PlantWiki.species 와 같은 이름).
+# 모델 객체는 registry("species") 가 지연 로드/교체하며, 배치마다 현재 버전을 가져다 씀.
+# 전처리는 ml/preprocess.py 공용 단계 (업로드 버퍼에서 1회 디코드 → 배치 텐서에 정규화까지 직접 기록).
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.ml import inference_cache
+from backend.app.ml.batching import MicroBatcher
+from backend.app.ml.preprocess import InvalidImageError, PreparedImage, make_batch
+from backend.app.ml.registry import ModelUnavailableError, load_npz_mmap, models_root, registry
+
+# 선택 의존성: 없으면 해당 형식만 사용 불가
+try:
+    import onnxruntime as ort
+except Exception:  # pragma: no cover
+    ort = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# 캐시에는 top_k 와 무관하게 상위 N개를 저장 (요청 top_k 는 잘라서 사용)
+CACHED_TOP_N = 20
+
+# -----------------------
+# Runtime
+# -----------------------
+class _OnnxRuntime:
+    def __init__(self, path: Path):
+        if ort is None:
+            raise ModelUnavailableError("onnxruntime is not installed")
+        opts = ort.SessionOptions()
+        if settings.ML_INTRA_OP_THREADS > 0:
+            opts.intra_op_num_threads = settings.ML_INTRA_OP_THREADS
+        # 대용량 external data 는 onnxruntime 이 파일에서 직접 매핑
+        self.session = ort.InferenceSession(str(path), sess_options=opts, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.labels: Optional[List[str]] = None
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        return self.session.run(None, {self.input_name: batch})[0]
+
+
+class _NumpyLinearRuntime:
+    def __init__(self, path: Path):
+        # 가중치는 memory-map (float32 로 저장된 경우 복사 없음)
+        self.arrays = load_npz_mmap(path)
+        self.W = self.arrays["W"].astype(np.float32, copy=False)
+        self.b = self.arrays["b"].astype(np.float32, copy=False)
+        self.labels = [str(x) for x in self.arrays["labels"]] if "labels" in self.arrays else None
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        return batch.reshape(batch.shape[0], -1) @ self.W + self.b
+
+
+@dataclass
+class SpeciesModel:
+    runtime: Any
+    labels: List[str]
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return self.runtime.arrays
+
+
+def load_species_model(path: Path) -> SpeciesModel:
+    """registry loader"""
+    if path.suffix == ".onnx":
+        runtime: Any = _OnnxRuntime(path)
+    elif path.suffix == ".npz":
+        runtime = _NumpyLinearRuntime(path)
+    else:
+        raise ModelUnavailableError(f"unsupported model format: {path.suffix}")
+    labels = runtime.labels
+    if labels is None:
+        candidates = [path.with_suffix(".labels.txt")]
+        if settings.SPECIES_LABELS:
+            candidates.append(models_root() / settings.SPECIES_LABELS)
+        found = next((c for c in candidates if c.exists()), None)
+        if found is None:
+            raise ModelUnavailableError(f"species labels not found: {candidates}")
+        labels = [ln.strip() for ln in found.read_text(encoding="utf-8").splitlines() if ln.strip()]
+    return SpeciesModel(runtime=runtime, labels=labels)
+
+
+# 업로드 bytes (추론 스레드에서 디코드) 또는 이미 디코드된 이미지
+ImageInput = Union[bytes, PreparedImage]
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    z = logits - logits.max(axis=1, keepdims=True)
+    np.exp(z, out=z)
+    z /= z.sum(axis=1, keepdims=True)
+    return z
+
+
+def rank_labels(probs: np.ndarray, labels: List[str], k: int) -> List[Tuple[str, float]]:
+    """확률 벡터 1개 → 상위 k개 (라벨, 확률)"""
+    k = min(k, probs.shape[0])
+    top = np.argpartition(-probs, k - 1)[:k]
+    top = top[np.argsort(-probs[top])]
+    return [(labels[i], float(probs[i])) for i in top]
+
+
+# -----------------------
+# Service
+# -----------------------
+class SpeciesClassifier:
+    """
+    분류 서비스. predict() 는 동시에 들어온 요청을 마이크로배치로 묶어
+    전용 스레드에서 추론 (onnxruntime/NumPy 는 연산 중 GIL 을 놓음).
+    """
+
+    model_name = "species"
+
+    def __init__(self, *, input_size: int, max_batch: int, max_wait_ms: float, max_queue: int):
+        self.input_size = input_size
+        # 배치 텐서 재사용 (추론 스레드가 1개라 동시 접근 없음)
+        self._buffer = np.empty((max_batch, 3, input_size, input_size), dtype=np.float32)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="species-infer")
+        self.batcher: MicroBatcher[ImageInput, Any] = MicroBatcher(
+            self._predict_batch,
+            max_batch=max_batch,
+            max_wait_ms=max_wait_ms,
+            executor=self._executor,
+            max_queue=max_queue,
+        )
+
+    def _predict_batch(self, images: List[ImageInput]) -> List[Any]:
+        """
+        배치 추론. 디코드에 실패한 항목은 결과 자리에 예외 객체를 넣어 나머지는 그대로 처리.
+        결과는 (확률, 라벨 목록) - 배치 도중 모델이 교체돼도 라벨과 확률의 버전이 일치.
+        """
+        model: SpeciesModel = registry.get(self.model_name)
+        out: List[Any] = [None] * len(images)
+        ok: List[int] = []
+        prepared: List[PreparedImage] = []
+        for i, image in enumerate(images):
+            try:
+                if not isinstance(image, PreparedImage):
+                    image = PreparedImage.decode(image, self.input_size)
+                prepared.append(image)
+                ok.append(i)
+            except InvalidImageError as e:
+                out[i] = e
+        if ok:
+            x = make_batch(prepared, self.input_size, out=self._buffer)
+            probs = _softmax(np.asarray(model.runtime(x), dtype=np.float32))
+            for j, i in enumerate(ok):
+                out[i] = (probs[j], model.labels)
+        return out
+
+    async def predict(self, image: ImageInput, top_k: int) -> List[Tuple[str, float]]:
+        res = await self.batcher.submit(image)
+        if isinstance(res, Exception):
+            raise res
+        probs, labels = res
+        return rank_labels(probs, labels, top_k)
+
+    async def close(self) -> None:
+        await self.batcher.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def register_model() -> None:
+    registry.register("species", load_species_model, models_root() / settings.SPECIES_MODEL)
+
+
+_classifier: Optional[SpeciesClassifier] = None
+
+
+def get_classifier() -> SpeciesClassifier:
+    global _classifier
+    if _classifier is None:
+        register_model()
+        _classifier = SpeciesClassifier(
+            input_size=settings.SPECIES_INPUT_SIZE,
+            max_batch=settings.ML_BATCH_MAX_SIZE,
+            max_wait_ms=settings.ML_BATCH_MAX_WAIT_MS,
+            max_queue=settings.ML_QUEUE_MAX,
+        )
+    return _classifier
+
+
+async def shutdown() -> None:
+    global _classifier
+    if _classifier is not None:
+        await _classifier.close()
+        _classifier = None
+
+
+async def classify(
+    db: AsyncSession,
+    image_bytes: bytes,
+    top_k: Optional[int] = None,
+    *,
+    prepared: Optional[PreparedImage] = None,
+) -> List[Dict[str, Any]]:
+    """
+    top-k 종 예측 + PlantWiki 매핑 (위키가 없는 종은 wiki=None).
+    prepared: 이미 디코드한 이미지가 있으면 재사용 (캐시 키는 image_bytes 해시).
+    반환: [{"species": str, "score": float, "wiki": PlantWiki | None}, ...]
+    """
+    from backend.app.db.crud import plant_wiki
+
+    cache = inference_cache.get_cache()
+    content_digest = inference_cache.digest(image_bytes)
+    version = registry.version("species")
+    preds = await cache.get("species", version, content_digest)
+    if preds is None:
+        preds = await get_classifier().predict(prepared or image_bytes, CACHED_TOP_N)
+        await cache.put("species", version, content_digest, preds)
+    preds = preds[: top_k or settings.SPECIES_TOP_K]
+    wikis = {w.species: w for w in await plant_wiki.list_by_species(db, [s for s, _ in preds])}
+    return [{"species": s, "score": score, "wiki": wikis.get(s)} for s, score in preds]
+
+
+def stats() -> Dict[str, Any]:
+    if _classifier is None:
+        return {"started": False}
+    return {"started": True, "batcher": _classifier.batcher.stats()}
+
+
+register_model()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from backend.app.ml import plant_llm
+from backend.app.ml.registry import ModelUnavailableError
+from backend.app.utils.errors import err
+from backend.app.utils.responses import dumps
+from backend.app.utils.security import get_current_user
+
+router = APIRouter(prefix="/assistant", tags=["ml"])
+
+
+# ====== Schemas ======
+class AssistantAskIn(BaseModel):
+    question: str = Field(..., min_length=1, max_length=1000)
+    species: Optional[str] = Field(None, max_length=100)
+    max_tokens: Optional[int] = Field(None, ge=1, le=2048)
+
+
+# ====== Helpers ======
+def _sse(event: str, data: Dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: ".encode() + dumps(data) + b"\n\n"
+
+
+# ====== Routes ======
+@router.post("/ask")
+async def ask_assistant(body: AssistantAskIn, current_user=Depends(get_current_user)):
+    """
+    SSE 로 답변 토큰을 생성되는 대로 전송.
+      event: start → sources(근거 위키) → (token)* → done | error
+    클라이언트가 연결을 끊으면 Starlette 가 스트림을 취소 → 생성 스레드도 중단.
+    """
+    try:
+        plant_llm.check_capacity()
+    except plant_llm.GenerationQueueFull as e:
+        raise err(status.HTTP_503_SERVICE_UNAVAILABLE, "OVERLOADED", str(e))
+
+    async def events():
+        # 검색/대기열에서 기다리는 동안에도 첫 바이트는 바로 나가도록 start 먼저 전송
+        yield _sse("start", {"model": plant_llm.stats()["model"]})
+        docs = await plant_llm.retrieve_context(body.question, body.species)
+        yield _sse("sources", {"sources": [{k: d[k] for k in ("kind", "idx", "title", "score")} for d in docs]})
+        prompt = plant_llm.build_prompt(body.question, [d["text"] for d in docs], body.species)
+        count = 0
+        try:
+            async for token in plant_llm.stream_tokens(prompt, max_tokens=body.max_tokens):
+                count += 1
+                yield _sse("token", {"text": token})
+        except plant_llm.GenerationQueueFull as e:
+            yield _sse("error", {"code": "OVERLOADED", "message": str(e)})
+            return
+        except ModelUnavailableError as e:
+            yield _sse("error", {"code": "MODEL_UNAVAILABLE", "message": str(e)})
+            return
+        yield _sse("done", {"tokens": count})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
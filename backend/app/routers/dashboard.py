@@ -16,6 +16,8 @@ from ..services.users_service import (
     get_current_user,
     UsersService,
 )
+from ..utils import timing
+from ..utils.responses import model_response
 from ..utils.weather_client import WeatherClient
 
 router = APIRouter()
@@ -108,17 +110,21 @@ async def get_dashboard_summary(
             dash_svc.list_plants_summary(user_id=user_id, limit=limit_plants, cursor=cursor_plants)
         )
         # prefs 먼저 필요 → 위치 코드 추출 후 날씨 호출
-        prefs = await prefs_task
+        with timing.span("prefs"):
+            prefs = await prefs_task
         weather_task = asyncio.create_task(
             dash_svc.get_weather_for_preference(prefs=prefs)
         )
 
         plants_out, weather_out = await asyncio.gather(plants_task, weather_task)
 
-        weather_model = WeatherOut(**weather_out) if weather_out else None
-        plants_model = PlantsListOut(**plants_out)
+        # 검증은 여기서 한 번만 (dict → DashboardSummaryOut → JSON bytes)
+        with timing.span("build"):
+            response = model_response(
+                DashboardSummaryOut,
+                {"weather": weather_out, "plants": plants_out},
+            )
 
-    
     except Exception as e:
         # 안전한 에러 포맷
         return JSONResponse(
@@ -126,7 +132,7 @@ async def get_dashboard_summary(
             content=_error_payload("INTERNAL_ERROR", f"failed to build dashboard: {e}"),
         )
 
-    return DashboardSummaryOut(weather=weather_model, plants=plants_model, routes=RoutesOut())
+    return response
 
 
 @router.get("/dashboard/plants", response_model=PlantsListOut)
@@ -137,7 +143,8 @@ async def get_dashboard_plants_only(
 ):
     """식물 요약 리스트 전용 (프론트 최적화용)"""
     dash_svc = DashboardService(weather_client=WeatherClient(), users_service=UsersService())
-    return await dash_svc.list_plants_summary(user_id=user["user_id"], limit=limit, cursor=cursor)
+    plants_out = await dash_svc.list_plants_summary(user_id=user["user_id"], limit=limit, cursor=cursor)
+    return model_response(PlantsListOut, plants_out)
 
 
 @router.get("/users/me/preferences", response_model=PreferencesOut)
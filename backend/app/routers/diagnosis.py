@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from backend.app.core.config import settings
+from backend.app.ml import inference_cache, pest_diagnosis
+from backend.app.ml.preprocess import InvalidImageError, PreparedImage
+from backend.app.ml.registry import ModelUnavailableError
+from backend.app.services import storage
+from backend.app.utils.errors import err
+from backend.app.utils.responses import dumps, model_response
+from backend.app.utils.security import get_current_user
+
+router = APIRouter(prefix="/diagnosis", tags=["ml"])
+
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+# ====== Schemas ======
+class DetectionOut(BaseModel):
+    pest_id: int
+    score: float
+    box: Optional[List[float]] = None
+
+
+class PestWikiBrief(BaseModel):
+    idx: int
+    pest_id: int
+    cause: str
+    cure: str
+
+
+class DiagnosisJobOut(BaseModel):
+    job_id: str
+    status: str
+    user_plant_idx: Optional[int] = None
+    pest_id: Optional[int] = None
+    detections: List[DetectionOut] = []
+    wiki: List[PestWikiBrief] = []
+    error: Optional[str] = None
+    created_at: float
+    finished_at: Optional[float] = None
+
+
+# ====== Helpers ======
+def _owned_job(job_id: str, user: Dict[str, Any]) -> pest_diagnosis.DiagnosisJob:
+    job = pest_diagnosis.get_job(job_id)
+    if job is None or job.user_id != user["id"]:
+        raise err(status.HTTP_404_NOT_FOUND, "NOT_FOUND", "job not found")
+    return job
+
+
+def _sse(event: str, data: Dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: ".encode() + dumps(data) + b"\n\n"
+
+
+# ====== Routes ======
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED, response_model=DiagnosisJobOut)
+async def submit_diagnosis(
+    file: UploadFile = File(..., description="jpg/png"),
+    user_plant_idx: Optional[int] = Form(None, description="결과(pest_id)를 기록할 UserPlant.idx"),
+    current_user=Depends(get_current_user),
+):
+    """이미지 저장 후 진단 job 등록 → 즉시 202 (결과는 폴링 또는 SSE)"""
+    ext = storage.safe_ext(file.filename or "")
+    if ext not in (".jpg", ".png"):
+        raise err(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "UNSUPPORTED_MEDIA_TYPE", "only jpg/png allowed")
+    max_bytes = settings.MAX_UPLOAD_MB * 1024 * 1024
+    data = await file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise ValueError("too_large")  # 전역 미들웨어가 413 리턴
+    if storage.sniff_mime(data[:16]) not in ("image/jpeg", "image/png"):
+        raise err(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "UNSUPPORTED_MEDIA_TYPE", "invalid file type")
+
+    # 같은 버퍼로 디코드/해시/저장 (워커는 파일을 다시 읽지 않음)
+    try:
+        prepared = await asyncio.to_thread(PreparedImage.decode, data, settings.PEST_INPUT_SIZE)
+    except InvalidImageError:
+        raise err(status.HTTP_400_BAD_REQUEST, "INVALID_IMAGE", "cannot decode image")
+    except ModelUnavailableError:
+        prepared = None  # Pillow 미설치 → job 에서 실패 처리
+    rel_path = "diagnosis/" + storage.build_rel_path(datetime.now(timezone.utc), storage.new_uuid(), ext)
+    full, _ = await asyncio.to_thread(storage.save_file, io.BytesIO(data), rel_path, max_bytes=max_bytes)
+    job = pest_diagnosis.submit(
+        current_user["id"],
+        str(full),
+        user_plant_idx,
+        prepared=prepared,
+        content_digest=inference_cache.digest(data),
+    )
+    return model_response(DiagnosisJobOut, job.to_dict(), status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.get("/jobs/{job_id}", response_model=DiagnosisJobOut)
+async def get_diagnosis(job_id: str, current_user=Depends(get_current_user)):
+    """job 상태/결과 폴링"""
+    return model_response(DiagnosisJobOut, _owned_job(job_id, current_user).to_dict())
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_diagnosis(job_id: str, request: Request, current_user=Depends(get_current_user)):
+    """
+    SSE: 상태가 바뀔 때마다 `event: status` 전송, 완료/실패 시 `event: done` 후 종료.
+    """
+    job = _owned_job(job_id, current_user)
+
+    async def events():
+        yield _sse("status", job.to_dict())
+        while not job.finished:
+            changed = job.changed
+            try:
+                await asyncio.wait_for(changed.wait(), SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield b": keepalive\n\n"
+                continue
+            if not job.finished:
+                yield _sse("status", job.to_dict())
+        yield _sse("done", job.to_dict())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Optional, Literal, List, Dict, Any
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile, Query, Path, Header, status
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, File, Form, UploadFile, Query, Path, Header, Request, Response, status
+from pydantic import BaseModel, Field
 import jwt  # PyJWT
 from jwt import InvalidTokenError
 
 from backend.app.core.config import settings
-# from backend.app.utils.errors import err
-from backend.app.services import image_service
-from backend.app.services.storage import safe_ext, sniff_mime
+from backend.app.utils.errors import err
+from backend.app.services import image_service, upload_sessions
+from backend.app.services.image_validation import ImageValidationError
+from backend.app.services.storage import safe_ext
+from backend.app.utils.responses import model_response
 
 router = APIRouter(prefix="/plants", tags=["images"])
 
@@ -28,6 +31,8 @@ class ImageOut(BaseModel):
     plant_id: str
     url: str
     type: Literal["profile", "diary", "general"]
+    width: Optional[int] = None
+    height: Optional[int] = None
     uploaded_at: str
 
 
@@ -37,6 +42,45 @@ class ImageListOut(BaseModel):
     has_more: bool = False
 
 
+class UploadErrorOut(BaseModel):
+    code: str
+    message: str
+
+
+class BatchItemOut(BaseModel):
+    filename: str
+    image: Optional[ImageOut] = None
+    error: Optional[UploadErrorOut] = None
+
+
+class BatchUploadOut(BaseModel):
+    items: List[BatchItemOut]
+    created: int
+    failed: int
+
+
+class UploadCreateIn(BaseModel):
+    filename: str
+    size: int = Field(..., gt=0, description="전체 파일 크기 (bytes)")
+    type: Literal["profile", "diary", "general"] = "general"
+    note: Optional[str] = None
+
+
+class UploadSessionOut(BaseModel):
+    upload_id: str
+    offset: int
+    size: int
+    expires_at: float
+
+
+class PresignOut(BaseModel):
+    image_id: str
+    method: str
+    url: str
+    headers: Dict[str, str] = Field(default_factory=dict, description="PUT 요청에 그대로 보낼 헤더")
+    expires_at: float
+
+
 # -----------------------
 # Auth (JWT Access required)
 # -----------------------
@@ -90,34 +134,228 @@ async def upload_image(
         # raise err(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "UNSUPPORTED_MEDIA_TYPE", "only jpg/png allowed")
         raise Exception("only jpg/png allowed")
 
-    # Peek header for signature sniff
-    await file.seek(0)
-    header = await file.read(16)
-    await file.seek(0)
-
-    mime = sniff_mime(header)
-    if mime not in ("image/jpeg", "image/png"):
-        # raise err(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "UNSUPPORTED_MEDIA_TYPE", "invalid file type")
-        raise Exception("invalid file type")
-
-    # Extension ↔ signature cross check
-    if mime == "image/jpeg" and ext not in (".jpg", ".jpeg"):
-        # raise err(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "UNSUPPORTED_MEDIA_TYPE", "jpeg required")
-        raise Exception("jpeg required")
-    if mime == "image/png" and ext != ".png":
-        # raise err(status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "UNSUPPORTED_MEDIA_TYPE", "png required")
-        raise Exception("png required")
-
-    # Size guard & 저장은 서비스에서 처리 (413 on exceed)
-    meta = await image_service.create_image(
+    # 시그니처/확장자 일치, 구조, 픽셀 수는 저장 스트림에서 검증 (413 on exceed)
+    try:
+        meta = await image_service.create_image(
+            plant_id=plant_id,
+            user_id=user["user_id"],
+            upload=file,
+            image_type=type,
+            note=note,
+            max_mb=settings.MAX_UPLOAD_MB,
+        )
+    except ImageValidationError as e:
+        raise err(e.status_code, e.code, str(e))
+    return model_response(ImageOut, meta, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/{plant_id}/images/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BatchUploadOut,
+    responses={207: {"model": BatchUploadOut, "description": "일부 파일 실패 (파일별 error 확인)"}},
+)
+async def upload_images_batch(
+    plant_id: str = Path(...),
+    files: List[UploadFile] = File(..., description="jpg/png 여러 개, 각각 ≤ MAX_UPLOAD_MB"),
+    type: Literal["profile", "diary", "general"] = Form("general"),
+    note: Optional[str] = Form(None),
+    user=Depends(get_current_user),
+):
+    """다이어리 사진 등 여러 장을 한 요청으로 업로드. 파일별로 검증하고 결과를 입력 순서대로 반환."""
+    image_service.assert_plant_owned(user["user_id"], plant_id)
+    if len(files) > settings.UPLOAD_BATCH_MAX_FILES:
+        raise err(
+            status.HTTP_400_BAD_REQUEST, "TOO_MANY_FILES", f"at most {settings.UPLOAD_BATCH_MAX_FILES} files per request"
+        )
+    items = await image_service.create_images(
         plant_id=plant_id,
         user_id=user["user_id"],
-        upload=file,
+        uploads=files,
         image_type=type,
         note=note,
         max_mb=settings.MAX_UPLOAD_MB,
+        concurrency=settings.UPLOAD_BATCH_CONCURRENCY,
+    )
+    failed = sum(1 for item in items if item["error"] is not None)
+    return model_response(
+        BatchUploadOut,
+        {"items": items, "created": len(items) - failed, "failed": failed},
+        status_code=status.HTTP_207_MULTI_STATUS if failed else status.HTTP_201_CREATED,
+    )
+
+
+# -----------------------
+# Direct uploads (presign → 클라이언트가 url 로 PUT → complete)
+# -----------------------
+@router.post(
+    "/{plant_id}/images/presign",
+    status_code=status.HTTP_201_CREATED,
+    response_model=PresignOut,
+)
+async def presign_image(
+    body: UploadCreateIn,
+    plant_id: str = Path(...),
+    user=Depends(get_current_user),
+):
+    """저장소 직접 업로드 URL 발급 (본문이 API 서버를 거치지 않음). url 이 상대 경로면 API 서버 기준."""
+    image_service.assert_plant_owned(user["user_id"], plant_id)
+    try:
+        data = await asyncio.to_thread(
+            image_service.presign_image,
+            plant_id=plant_id,
+            filename=body.filename,
+            size=body.size,
+            image_type=body.type,
+            note=body.note,
+        )
+    except ImageValidationError as e:
+        raise err(e.status_code, e.code, str(e))
+    return model_response(PresignOut, data, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/{plant_id}/images/{image_id}/complete",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ImageOut,
+)
+async def complete_image(
+    plant_id: str,
+    image_id: str,
+    user=Depends(get_current_user),
+):
+    """직접 업로드 후 호출: 크기/구조 검증 → 메타 등록. 아직 PUT 전이면 409 (다시 호출 가능)"""
+    image_service.assert_plant_owned(user["user_id"], plant_id)
+    try:
+        meta = await image_service.complete_presigned(plant_id=plant_id, image_id=image_id)
+    except ImageValidationError as e:
+        raise err(e.status_code, e.code, str(e))
+    if meta is None:
+        raise err(status.HTTP_404_NOT_FOUND, "NOT_FOUND", "pending upload not found")
+    return model_response(ImageOut, meta, status_code=status.HTTP_201_CREATED)
+
+
+# -----------------------
+# Resumable uploads (create → PATCH Upload-Offset → finalize)
+# -----------------------
+def _session_error(e: upload_sessions.UploadSessionError):
+    # 409/413 응답에도 현재 offset 을 헤더로 알려 클라이언트가 바로 이어서 보냄
+    headers = {"Upload-Offset": str(e.offset)} if e.offset is not None else None
+    return err(e.status_code, e.code, str(e), headers)
+
+
+def _session_response(session: upload_sessions.UploadSession, status_code: int = status.HTTP_200_OK) -> Response:
+    return model_response(
+        UploadSessionOut, session.to_dict(), status_code=status_code, headers={"Upload-Offset": str(session.offset)}
     )
-    return ImageOut(**meta)
+
+
+@router.post(
+    "/{plant_id}/uploads",
+    status_code=status.HTTP_201_CREATED,
+    response_model=UploadSessionOut,
+)
+async def create_upload(
+    body: UploadCreateIn,
+    plant_id: str = Path(...),
+    user=Depends(get_current_user),
+):
+    image_service.assert_plant_owned(user["user_id"], plant_id)
+    try:
+        # 만료 세션 정리(색인 파일 glob + JSON 파싱)와 색인 쓰기가 있으므로 이벤트 루프 밖에서
+        session = await asyncio.to_thread(
+            upload_sessions.create,
+            user_id=user["user_id"],
+            plant_id=plant_id,
+            filename=body.filename,
+            size=body.size,
+            image_type=body.type,
+            note=body.note,
+        )
+    except upload_sessions.UploadSessionError as e:
+        raise _session_error(e)
+    return _session_response(session, status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/{plant_id}/uploads/{upload_id}",
+    response_model=UploadSessionOut,
+)
+async def get_upload(
+    plant_id: str,
+    upload_id: str,
+    user=Depends(get_current_user),
+):
+    """재개 전 현재 offset 확인 (Upload-Offset 헤더 + 본문)"""
+    try:
+        session = await asyncio.to_thread(upload_sessions.status, upload_id, user_id=user["user_id"], plant_id=plant_id)
+    except upload_sessions.UploadSessionError as e:
+        raise _session_error(e)
+    return _session_response(session)
+
+
+@router.patch(
+    "/{plant_id}/uploads/{upload_id}",
+    response_model=UploadSessionOut,
+)
+async def append_upload(
+    request: Request,
+    plant_id: str,
+    upload_id: str,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    user=Depends(get_current_user),
+):
+    """본문(raw bytes)을 Upload-Offset 위치부터 이어 씀. offset 이 다르면 409 + 현재 Upload-Offset."""
+    length = request.headers.get("content-length")
+    try:
+        session = await upload_sessions.append(
+            upload_id,
+            user_id=user["user_id"],
+            plant_id=plant_id,
+            offset=upload_offset,
+            body=request.stream(),
+            content_length=int(length) if length and length.isdigit() else None,
+        )
+    except upload_sessions.UploadSessionError as e:
+        raise _session_error(e)
+    except ImageValidationError as e:
+        raise err(e.status_code, e.code, str(e))
+    return _session_response(session)
+
+
+@router.post(
+    "/{plant_id}/uploads/{upload_id}/finalize",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ImageOut,
+)
+async def finalize_upload(
+    plant_id: str,
+    upload_id: str,
+    user=Depends(get_current_user),
+):
+    try:
+        meta = await upload_sessions.finalize(upload_id, user_id=user["user_id"], plant_id=plant_id)
+    except upload_sessions.UploadSessionError as e:
+        raise _session_error(e)
+    except ImageValidationError as e:
+        raise err(e.status_code, e.code, str(e))
+    return model_response(ImageOut, meta, status_code=status.HTTP_201_CREATED)
+
+
+@router.delete(
+    "/{plant_id}/uploads/{upload_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def abort_upload(
+    plant_id: str,
+    upload_id: str,
+    user=Depends(get_current_user),
+):
+    try:
+        await upload_sessions.abort(upload_id, user_id=user["user_id"], plant_id=plant_id)
+    except upload_sessions.UploadSessionError as e:
+        raise _session_error(e)
+    return None
 
 
 @router.get(
@@ -131,7 +369,8 @@ async def list_images(
     user=Depends(get_current_user),
 ):
     image_service.assert_plant_owned(user["user_id"], plant_id)
-    return await image_service.list_images(plant_id=plant_id, limit=limit, cursor=cursor)
+    page = await image_service.list_images(plant_id=plant_id, limit=limit, cursor=cursor)
+    return model_response(ImageListOut, page)
 
 
 @router.get(
@@ -147,7 +386,7 @@ async def get_image(
     meta = await image_service.get_image(plant_id=plant_id, image_id=image_id)
     if not meta:
         raise Exception("image not found")
-    return ImageOut(**meta)
+    return model_response(ImageOut, meta)
 
 
 @router.delete(
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+import io
+
+from fastapi import APIRouter, Query, Request, Response, status
+
+from backend.app.core.config import settings
+from backend.app.services import image_service, storage
+from backend.app.services.media_backend import STAGING_PREFIX, verify_local_upload
+from backend.app.utils.errors import err
+
+# MEDIA_BACKEND=local 일 때 presigned 직접 업로드를 받는 엔드포인트 (S3 의 presigned PUT 과 같은 흐름)
+# 인증 헤더 대신 URL 서명(키/크기/Content-Type/만료)으로 권한 확인 → 구조 검증은 complete 에서
+# 임시 키(STAGING_PREFIX)에만, complete 전인 대기 항목에 한 번만 받음 (complete 후 같은 URL 재사용 차단)
+router = APIRouter(prefix="/media", tags=["media"])
+
+
+@router.put("/upload", status_code=status.HTTP_200_OK)
+async def put_presigned(
+    request: Request,
+    key: str = Query(...),
+    size: int = Query(..., gt=0),
+    expires: int = Query(...),
+    signature: str = Query(...),
+):
+    content_type = request.headers.get("content-type", "")
+    if ".." in key.split("/") or key.startswith("/") or not verify_local_upload(key, size, content_type, expires, signature):
+        raise err(status.HTTP_403_FORBIDDEN, "SIGNATURE_INVALID", "invalid or expired upload url")
+    if not key.startswith(STAGING_PREFIX) or not image_service.is_pending_upload(key):
+        raise err(status.HTTP_403_FORBIDDEN, "UPLOAD_NOT_PENDING", "upload is no longer pending")
+    if (storage.media_root_abs() / key).exists():
+        raise err(status.HTTP_409_CONFLICT, "ALREADY_UPLOADED", "object already uploaded")
+    if size > settings.MAX_UPLOAD_MB * 1024 * 1024:
+        raise ValueError("too_large")  # 전역 미들웨어가 413 리턴
+
+    # 서명된 크기까지만 받음 (업로드 상한 이하)
+    buf = io.BytesIO()
+    async for chunk in request.stream():
+        if buf.tell() + len(chunk) > size:
+            raise err(status.HTTP_400_BAD_REQUEST, "SIZE_MISMATCH", "body exceeds signed size")
+        buf.write(chunk)
+    if buf.tell() != size:
+        raise err(status.HTTP_400_BAD_REQUEST, "SIZE_MISMATCH", "body does not match signed size")
+    buf.seek(0)
+    await asyncio.to_thread(storage.save_file, buf, key, max_bytes=size)
+    return Response(status_code=status.HTTP_200_OK)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import hmac
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, status
+
+from backend.app.core import db_metrics
+from backend.app.core.config import settings
+from backend.app.ml import inference_cache, pest_diagnosis, plant_llm, retrieval, species_classification
+from backend.app.services import plant_content_service
+from backend.app.utils import timing
+from backend.app.utils.errors import err
+
+
+def require_metrics_token(x_metrics_token: Optional[str] = Header(None)) -> None:
+    # 정규화 SQL, 라우트별 지연, 모델/대기열 내부 상태 노출 → 운영 토큰이 있을 때만 (models.py 관리 API 와 같은 방식)
+    if not settings.METRICS_TOKEN:
+        raise err(status.HTTP_404_NOT_FOUND, "NOT_FOUND", "metrics api is disabled")
+    if not x_metrics_token or not hmac.compare_digest(x_metrics_token, settings.METRICS_TOKEN):
+        raise err(status.HTTP_403_FORBIDDEN, "FORBIDDEN", "invalid metrics token")
+
+
+router = APIRouter(prefix="/metrics", tags=["metrics"], dependencies=[Depends(require_metrics_token)])
+
+
+# DB 커넥션 풀/쿼리 계측 스냅샷
+@router.get("/db")
+async def get_db_metrics() -> Dict[str, Any]:
+    return db_metrics.snapshot()
+
+
+# 라우트별 구간(Server-Timing span) 지연시간 히스토그램
+@router.get("/timing")
+async def get_timing_metrics() -> Dict[str, Any]:
+    return timing.snapshot()
+
+
+# ML 추론 배치 크기/대기시간/실행시간
+@router.get("/ml")
+async def get_ml_metrics() -> Dict[str, Any]:
+    return {
+        "species": species_classification.stats(),
+        "pest": pest_diagnosis.stats(),
+        "cache": inference_cache.get_cache().stats(),
+        "assistant": plant_llm.stats(),
+        "retrieval": retrieval.stats(),
+        "plant_content": plant_content_service.stats(),
+    }
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import hmac
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, status
+from pydantic import BaseModel
+
+from backend.app.core.config import settings
+from backend.app.ml import pest_diagnosis
+from backend.app.ml.registry import ModelUnavailableError, models_root, registry
+from backend.app.utils.errors import err
+
+router = APIRouter(prefix="/models", tags=["ml"])
+
+
+class ModelSwapIn(BaseModel):
+    path: str  # ML_MODELS_DIR 기준 상대 경로 (예: classifier/species-v2.onnx)
+    version: Optional[str] = None
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    if not settings.ML_ADMIN_TOKEN:
+        raise err(status.HTTP_404_NOT_FOUND, "NOT_FOUND", "model admin api is disabled")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ML_ADMIN_TOKEN):
+        raise err(status.HTTP_403_FORBIDDEN, "FORBIDDEN", "invalid admin token")
+
+
+def _resolve(rel: str) -> Path:
+    root = models_root().resolve()
+    path = (root / rel).resolve()
+    if root not in path.parents:
+        raise err(status.HTTP_400_BAD_REQUEST, "BAD_REQUEST", "path must be inside ML_MODELS_DIR")
+    return path
+
+
+# 모델별 버전/로드 시간/RSS (pest 는 워커 프로세스 1개 기준)
+@router.get("")
+async def list_models(_: None = Depends(require_admin)) -> Dict[str, Any]:
+    return {
+        "api": registry.stats(),
+        "pest": {"model": pest_diagnosis.model_info(), "worker": await pest_diagnosis.worker_model_stats()},
+    }
+
+
+# 새 버전 로드 후 교체 (로드 실패 시 기존 버전 유지)
+@router.post("/{name}/swap")
+async def swap_model(name: str, body: ModelSwapIn, _: None = Depends(require_admin)) -> Dict[str, Any]:
+    path = _resolve(body.path)
+    try:
+        if name == "pest":
+            return await pest_diagnosis.swap_model(path, body.version)
+        if name not in registry.names():
+            raise err(status.HTTP_404_NOT_FOUND, "NOT_FOUND", f"unknown model: {name}")
+        return await registry.swap(name, path, body.version)
+    except ModelUnavailableError as e:
+        raise err(status.HTTP_400_BAD_REQUEST, "MODEL_UNAVAILABLE", str(e))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.database import get_read_db
+from backend.app.db.schemas import PlantWikiOut
+from backend.app.ml import species_classification
+from backend.app.ml.batching import BatcherOverloaded
+from backend.app.utils import timing
+from backend.app.utils.errors import err
+from backend.app.utils.responses import model_response
+from backend.app.utils.security import get_current_user
+
+router = APIRouter(prefix="/species", tags=["ml"])
+
+
+# ====== Schemas ======
+class SpeciesPredictionOut(BaseModel):
+    species: str
+    score: float
+    wiki: Optional[PlantWikiOut] = None
+
+
+class SpeciesClassifyOut(BaseModel):
+    predictions: List[SpeciesPredictionOut]
+
+
+# ====== Routes ======
+@router.post("/classify", response_model=SpeciesClassifyOut)
+async def classify_species(
+    file: UploadFile = File(..., description="jpg/png"),
+    top_k: int = Query(settings.SPECIES_TOP_K, ge=1, le=20),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+):
+    """업로드 이미지의 종 top-k 예측 + PlantWiki 매핑"""
+    max_bytes = settings.MAX_UPLOAD_MB * 1024 * 1024
+    with timing.span("read"):
+        data = await file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise ValueError("too_large")  # 전역 미들웨어가 413 리턴
+
+    try:
+        with timing.span("classify"):
+            preds = await species_classification.classify(db, data, top_k)
+    except species_classification.ModelUnavailableError as e:
+        raise err(status.HTTP_503_SERVICE_UNAVAILABLE, "MODEL_UNAVAILABLE", str(e))
+    except species_classification.InvalidImageError:
+        raise err(status.HTTP_400_BAD_REQUEST, "INVALID_IMAGE", "cannot decode image")
+    except BatcherOverloaded:
+        raise err(status.HTTP_503_SERVICE_UNAVAILABLE, "OVERLOADED", "inference queue is full, retry later")
+
+    return model_response(SpeciesClassifyOut, {"predictions": preds})
@@ -2,7 +2,7 @@ from typing import Dict, Any, Optional
 
 from backend.app.core.config import get_settings
 from backend.app.services import storage
-from backend.app.utils import token_blacklist
+from backend.app.utils import timing, token_blacklist
 from backend.app.utils.errors import http_error
 from backend.app.utils.security import (
     create_access_token,
@@ -23,7 +23,7 @@ def register(email: str, password: str, nickname: str) -> Dict[str, Any]:
         "email": email,
         "nickname": nickname,
         "avatar_url": None,
-        "password_hash": hash_password(password),
+        "password_hash": _hash(password),
         "created_at": now,
         "updated_at": now,
     }
@@ -33,10 +33,13 @@ def register(email: str, password: str, nickname: str) -> Dict[str, Any]:
 
 def login(email: str, password: str) -> Dict[str, Any]:
     user = storage.get_user_by_email(email)
-    if not user or not verify_password(password, user["password_hash"]):
+    with timing.span("password_verify"):
+        ok = bool(user) and verify_password(password, user["password_hash"])
+    if not ok:
         raise http_error("INVALID_CREDENTIALS", "invalid email or password", status=401)
 
-    tokens = _issue_tokens_for_user(user["id"])
+    with timing.span("token_issue"):
+        tokens = _issue_tokens_for_user(user["id"])
     return {"user": _public_user(user), **tokens}
 
 
@@ -44,7 +47,8 @@ def refresh(refresh_token: str) -> Dict[str, Any]:
     # decode+validate inside utils.security.decode_token(), blacklist checked by services flow
     from backend.app.utils.security import decode_token
 
-    payload = decode_token(refresh_token, refresh=True)
+    with timing.span("token_decode"):
+        payload = decode_token(refresh_token, refresh=True)
     jti = payload["jti"]
     sub = payload["sub"]
 
@@ -66,6 +70,11 @@ def logout(refresh_token: str) -> Dict[str, Any]:
     return {"ok": True}
 
 
+def _hash(password: str) -> str:
+    with timing.span("password_hash"):
+        return hash_password(password)
+
+
 def _issue_tokens_for_user(user_id: str) -> Dict[str, str]:
     settings = get_settings()
     access = create_access_token({"sub": user_id}, expires_seconds=settings.ACCESS_EXPIRES)
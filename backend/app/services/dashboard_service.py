@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils import timing
 from ..utils.weather_client import WeatherClient
 from .users_service import UsersService
 
@@ -26,7 +27,8 @@ class DashboardService:
             wl = prefs.get("weather_location") or {}
             code = wl.get("location_code", "SEOUL_KR")
             name = wl.get("name", "Seoul, KR")
-            raw = await self.weather_client.get_weather(code)
+            with timing.span("weather"):
+                raw = await self.weather_client.get_weather(code)
             # 인터페이스 표준화
             return {
                 "location_code": code,
@@ -45,7 +47,8 @@ class DashboardService:
         스와이프 카드용 식물 요약 리스트 (커서 기반).
         외부 저장소 연동 전까지 메모리/더미 데이터 사용.
         """
-        items_all = _get_or_seed_user_plants(user_id)
+        with timing.span("plants_load"):
+            items_all = _get_or_seed_user_plants(user_id)
 
         start_idx = 0
         if cursor:
@@ -61,25 +64,26 @@ class DashboardService:
         # brief_status 간단 규칙 생성
         now = datetime.now(timezone.utc)
         out_items: List[Dict[str, Any]] = []
-        for p in window:
-            # 랜덤 규칙 예시
-            soil_ok = random.random() > 0.35
-            if soil_ok:
-                brief = "토양 수분 적정. 24시간 후 재확인 권장."
-            else:
-                brief = "토양 수분 낮음. 오늘 저녁 100ml 권장."
-
-            last_update = now - timedelta(minutes=random.randint(10, 180))
-            out_items.append(
-                {
-                    "plant_id": p["plant_id"],
-                    "nickname": p["nickname"],
-                    "brief_status": brief,
-                    "last_update_at": last_update,
-                    "thumbnail_url": p.get("thumbnail_url"),
-                    "detail_path": f"/plants/{p['plant_id']}",
-                }
-            )
+        with timing.span("plants_build"):
+            for p in window:
+                # 랜덤 규칙 예시
+                soil_ok = random.random() > 0.35
+                if soil_ok:
+                    brief = "토양 수분 적정. 24시간 후 재확인 권장."
+                else:
+                    brief = "토양 수분 낮음. 오늘 저녁 100ml 권장."
+
+                last_update = now - timedelta(minutes=random.randint(10, 180))
+                out_items.append(
+                    {
+                        "plant_id": p["plant_id"],
+                        "nickname": p["nickname"],
+                        "brief_status": brief,
+                        "last_update_at": last_update,
+                        "thumbnail_url": p.get("thumbnail_url"),
+                        "detail_path": f"/plants/{p['plant_id']}",
+                    }
+                )
 
         has_more = end_idx < len(items_all)
         next_cursor = _encode_cursor({"offset": end_idx}) if has_more else None
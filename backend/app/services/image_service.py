@@ -1,26 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from fastapi import UploadFile, status
 
 # from backend.app.utils.errors import err
 # from backend.app.utils.pagination import paginate
+from backend.app.core.config import settings
+from backend.app.utils import timing
+from backend.app.services.image_validation import ImageValidationError, StreamingImageValidator, expected_mime
+from backend.app.services.media_backend import STAGING_PREFIX, MediaBackendError, get_backend
 from backend.app.services.storage import (
-    ensure_dirs,
     new_uuid,
     utcnow_iso,
-    save_file,
     build_rel_path,
-    build_url,
-    rel_from_url,
-    delete_file,
     safe_ext,
 )
 
+logger = logging.getLogger(__name__)
+
 # In-memory registries (DB 교체 예정)
 _images: Dict[str, Dict[str, Any]] = {}  # image_id -> meta
 _plant_owners: Dict[str, str] = {}       # plant_id -> owner_user_id
+_pending: Dict[str, Dict[str, Any]] = {}  # image_id -> presigned 직접 업로드 대기 정보 (complete 전)
+
+_VERIFY_CHUNK = 1024 * 1024
 
 
 def assert_plant_owned(user_id: str, plant_id: str) -> None:
@@ -36,6 +44,21 @@ def assert_plant_owned(user_id: str, plant_id: str) -> None:
         raise Exception("not your plant")  
 
 
+def _store(upload: UploadFile, max_bytes: int) -> Tuple[str, str, StreamingImageValidator]:
+    """
+    업로드 1개 저장. 저장하면서 PNG chunk / JPEG 마커를 검증 (한 번만 읽음)
+    용량 초과 시 ValueError("too_large") (전역 미들웨어가 413 리턴), 구조 오류/픽셀 초과 시 ImageValidationError
+    """
+    uid = new_uuid()
+    ext = safe_ext(upload.filename or "")
+    if ext == ".jpeg":
+        ext = ".jpg"
+    rel_path = build_rel_path(datetime.now(timezone.utc), uid, ext)
+    validator = StreamingImageValidator(expected=expected_mime(ext), max_pixels=settings.MAX_IMAGE_PIXELS)
+    get_backend().save(upload.file, rel_path, max_bytes=max_bytes, validator=validator)
+    return uid, rel_path, validator
+
+
 async def create_image(
     plant_id: str,
     user_id: str,  # 예약: 소유권 확인용
@@ -44,38 +67,263 @@ async def create_image(
     note: Optional[str],
     max_mb: int,
 ) -> Dict[str, Any]:
-    uid = new_uuid()
-    now = datetime.now(timezone.utc)
-    ext = safe_ext(upload.filename or "")
-    if ext == ".jpeg":
-        ext = ".jpg"
+    with timing.span("save_file"):
+        # 저장소가 S3 면 네트워크 호출 → 이벤트 루프를 막지 않도록 스레드에서
+        uid, rel_path, validator = await asyncio.to_thread(_store, upload, max_mb * 1024 * 1024)
+    return await asyncio.to_thread(
+        _register, uid, plant_id, rel_path, image_type, note, validator.width, validator.height
+    )
+
 
-    rel_path = build_rel_path(now, uid, ext)
-    ensure_dirs(rel_path)
+def _upload_error(e: Exception) -> Dict[str, str]:
+    if isinstance(e, ImageValidationError):
+        return {"code": e.code, "message": str(e)}
+    if isinstance(e, ValueError) and str(e) == "too_large":
+        return {"code": "PAYLOAD_TOO_LARGE", "message": "file too large"}
+    logger.error("batch upload: file store failed", exc_info=e)
+    return {"code": "UPLOAD_FAILED", "message": "could not store file"}
 
+
+async def create_images(
+    plant_id: str,
+    user_id: str,  # 예약: 소유권 확인용
+    uploads: List[UploadFile],
+    image_type: str,
+    note: Optional[str],
+    max_mb: int,
+    concurrency: int,
+) -> List[Dict[str, Any]]:
+    """
+    여러 파일을 스레드에서 동시에 저장/검증하고, 통과한 파일의 메타는 한 번에 등록.
+    결과는 입력 순서대로 {"filename", "image" | "error"} (한 파일의 실패가 나머지에 영향 없음).
+    """
     max_bytes = max_mb * 1024 * 1024
-    await upload.seek(0)
-    # save_file 내부에서 용량 초과 시 ValueError("too_large") 발생 (전역 미들웨어가 413 리턴)
-    save_file(upload.file, rel_path, max_bytes=max_bytes)
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def store(upload: UploadFile) -> Tuple[str, str, StreamingImageValidator]:
+        if safe_ext(upload.filename or "") not in (".jpg", ".png"):
+            raise ImageValidationError(
+                "only jpg/png allowed", code="UNSUPPORTED_MEDIA_TYPE", status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+        async with sem:
+            return await asyncio.to_thread(_store, upload, max_bytes)
+
+    with timing.span("save_files"):
+        stored = await asyncio.gather(*(store(u) for u in uploads), return_exceptions=True)
+
+    results: List[Dict[str, Any]] = []
+    entries: List[Tuple[str, str, int, int]] = []
+    for upload, res in zip(uploads, stored):
+        item: Dict[str, Any] = {"filename": upload.filename or "", "image": None, "error": None}
+        if isinstance(res, Exception):
+            item["error"] = _upload_error(res)
+        else:
+            uid, rel_path, validator = res
+            entries.append((uid, rel_path, validator.width, validator.height))
+        results.append(item)
+
+    metas = iter(await asyncio.to_thread(_register_many, plant_id, entries, image_type, note))
+    for item in results:
+        if item["error"] is None:
+            item["image"] = next(metas)
+            if item["image"] is None:  # 메타 sidecar 저장 실패 → 객체는 이미 삭제됨
+                item["error"] = {"code": "UPLOAD_FAILED", "message": "could not store file"}
+    return results
+
+
+async def create_image_from_file(
+    plant_id: str,
+    user_id: str,  # 예약: 소유권 확인용
+    src: Path,
+    ext: str,
+    image_type: str,
+    note: Optional[str],
+    width: int,
+    height: int,
+) -> Dict[str, Any]:
+    """
+    이미 검증을 마친 파일(재개 가능 업로드의 조각 파일 등)을 미디어 경로로 옮기고 메타 등록.
+    로컬 저장소는 같은 파일시스템 안에서 rename 만 하므로 내용을 다시 읽거나 복사하지 않음.
+    """
+    uid = new_uuid()
+    rel_path = build_rel_path(datetime.now(timezone.utc), uid, ".jpg" if ext == ".jpeg" else ext)
+    await asyncio.to_thread(get_backend().put_file, src, rel_path)
+    return await asyncio.to_thread(_register, uid, plant_id, rel_path, image_type, note, width, height)
+
 
-    url = build_url(rel_path)
-    meta = {
+# -----------------------
+# Presigned direct upload (presign → 클라이언트가 저장소에 PUT → complete)
+# -----------------------
+def presign_image(
+    plant_id: str,
+    filename: str,
+    size: int,
+    image_type: str,
+    note: Optional[str],
+) -> Dict[str, Any]:
+    """
+    저장소 직접 업로드 URL 발급. 크기/Content-Type 이 서명에 포함되어 다른 크기의 본문은 저장소가 거부.
+    URL 은 임시 키(STAGING_PREFIX)를 가리킴 → complete 에서 최종 키로 옮긴 뒤 구조를 검증하므로
+    만료 전에 같은 URL 로 다시 PUT 해도 등록된 이미지는 바뀌지 않음.
+    """
+    ext = safe_ext(filename)
+    if ext not in (".jpg", ".png"):
+        raise ImageValidationError(
+            "only jpg/png allowed", code="UNSUPPORTED_MEDIA_TYPE", status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        )
+    if size > settings.MAX_UPLOAD_MB * 1024 * 1024:
+        raise ValueError("too_large")  # 전역 미들웨어가 413 리턴
+    backend = get_backend()
+    now = time.time()
+    for image_id in [k for k, v in _pending.items() if v["expires_at"] < now]:
+        expired = _pending.pop(image_id, None)
+        if expired is not None:
+            backend.delete(expired["staging_key"])  # complete 되지 않은 임시 객체
+
+    uid = new_uuid()
+    staging_key = f"{STAGING_PREFIX}{uid}{ext}"
+    upload = backend.presign_put(
+        staging_key, size=size, content_type=expected_mime(ext), expires=settings.MEDIA_PRESIGN_EXPIRES
+    )
+    _pending[uid] = {
+        "plant_id": plant_id,
+        "staging_key": staging_key,
+        "rel_path": build_rel_path(datetime.now(timezone.utc), uid, ext),
+        "ext": ext,
+        "size": size,
+        "type": image_type,
+        "note": note,
+        "expires_at": upload.expires_at,
+    }
+    return {
+        "image_id": uid,
+        "method": upload.method,
+        "url": upload.url,
+        "headers": upload.headers,
+        "expires_at": upload.expires_at,
+    }
+
+
+def is_pending_upload(staging_key: str) -> bool:
+    """로컬 presigned PUT 수신 시 확인: complete 전인 대기 항목의 임시 키인지"""
+    return any(v["staging_key"] == staging_key for v in _pending.values())
+
+
+def _verify_uploaded(pending: Dict[str, Any]) -> StreamingImageValidator:
+    """최종 키로 옮긴 객체를 구간 단위로 읽어 크기/구조 검증 (업로드 상한 이하라 몇 번의 range GET)"""
+    backend = get_backend()
+    rel_path = pending["rel_path"]
+    size = backend.size(rel_path)
+    if size != pending["size"]:
+        raise ImageValidationError("uploaded size does not match declared size")
+    validator = StreamingImageValidator(expected=expected_mime(pending["ext"]), max_pixels=settings.MAX_IMAGE_PIXELS)
+    offset = 0
+    while offset < size:
+        chunk = backend.read_range(rel_path, offset, min(_VERIFY_CHUNK, size - offset))
+        if not chunk:
+            break
+        validator.feed(chunk)
+        offset += len(chunk)
+    validator.close()
+    return validator
+
+
+async def complete_presigned(plant_id: str, image_id: str) -> Optional[Dict[str, Any]]:
+    """직접 업로드 완료 처리. 검증 실패 시 객체를 지우고 ImageValidationError (대기 항목 없으면 None)"""
+    pending = _pending.get(image_id)
+    if pending is None or pending["plant_id"] != plant_id:
+        return None
+    # 대기 항목을 먼저 가져가서 동시 complete / 로컬 재 PUT 을 막고,
+    # 임시 키 → 최종 키로 옮긴 뒤(그 시점 내용으로 고정) 검증 → 검증한 바이트가 곧 등록되는 바이트
+    _pending.pop(image_id, None)
+    backend = get_backend()
+    try:
+        await asyncio.to_thread(backend.move, pending["staging_key"], pending["rel_path"])
+    except FileNotFoundError:
+        _pending[image_id] = pending  # 아직 PUT 전 → 재시도 가능하도록 대기 항목 유지
+        raise ImageValidationError("object not uploaded", code="UPLOAD_INCOMPLETE", status_code=status.HTTP_409_CONFLICT)
+    try:
+        validator = await asyncio.to_thread(_verify_uploaded, pending)
+    except ImageValidationError:
+        await asyncio.to_thread(backend.delete, pending["rel_path"])
+        raise
+    return await asyncio.to_thread(
+        _register, image_id, plant_id, pending["rel_path"], pending["type"], pending["note"], validator.width, validator.height
+    )
+
+
+def _new_meta(
+    uid: str,
+    plant_id: str,
+    rel_path: str,
+    image_type: str,
+    note: Optional[str],
+    width: int,
+    height: int,
+) -> Dict[str, Any]:
+    return {
         "image_id": uid,
         "plant_id": plant_id,
-        "url": url,
+        "url": get_backend().public_url(rel_path),  # 저장소에서 바로 받는 주소 (S3 면 버킷/CDN)
+        "rel_path": rel_path,  # 삭제용 저장소 키 (응답 모델에는 없음)
         "type": image_type,
         "note": note,
+        "width": width,
+        "height": height,
         "uploaded_at": utcnow_iso(),  # ISO8601 UTC
     }
-    _images[uid] = meta
+
+
+def _register(
+    uid: str,
+    plant_id: str,
+    rel_path: str,
+    image_type: str,
+    note: Optional[str],
+    width: int,
+    height: int,
+) -> Dict[str, Any]:
+    meta = _register_many(plant_id, [(uid, rel_path, width, height)], image_type, note)[0]
+    if meta is None:
+        raise MediaBackendError(f"could not register {rel_path}")
     return meta
 
 
+def _register_many(
+    plant_id: str,
+    entries: List[Tuple[str, str, int, int]],
+    image_type: str,
+    note: Optional[str],
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    (uid, rel_path, width, height) 목록의 메타를 한 번에 등록.
+    sidecar 저장에 실패한 항목은 저장한 객체를 지우고 None (나머지 항목은 그대로 등록).
+    """
+    backend = get_backend()
+    metas: List[Optional[Dict[str, Any]]] = []
+    for uid, rel_path, w, h in entries:
+        meta = _new_meta(uid, plant_id, rel_path, image_type, note, w, h)
+        try:
+            backend.write_meta(rel_path, meta)  # 파일 옆 sidecar (plant_id 등) → 오프라인 배치 작업이 파일만으로 식물을 찾음
+        except Exception:
+            logger.error("image register: sidecar write failed for %s", rel_path, exc_info=True)
+            try:
+                backend.delete(rel_path)  # 파일 + (일부 쓰였을 수 있는) sidecar
+            except Exception:
+                logger.error("image register: could not remove orphaned %s", rel_path, exc_info=True)
+            metas.append(None)
+            continue
+        metas.append(meta)
+    _images.update((meta["image_id"], meta) for meta in metas if meta is not None)
+    return metas
+
+
 async def list_images(plant_id: str, limit: int, cursor: Optional[str]) -> Dict[str, Any]:
     # Filter by plant
-    items = [v for v in _images.values() if v["plant_id"] == plant_id]
-    # 정렬: uploaded_at desc, image_id desc (ISO8601 문자열은 역순 정렬 시 최신이 먼저)
-    items.sort(key=lambda x: (x["uploaded_at"], x["image_id"]), reverse=True)
+    with timing.span("images_scan"):
+        items = [v for v in _images.values() if v["plant_id"] == plant_id]
+        # 정렬: uploaded_at desc, image_id desc (ISO8601 문자열은 역순 정렬 시 최신이 먼저)
+        items.sort(key=lambda x: (x["uploaded_at"], x["image_id"]), reverse=True)
 
     def key_fn(x):
         return (x["uploaded_at"], x["image_id"])
@@ -106,9 +354,8 @@ async def delete_image(plant_id: str, image_id: str) -> bool:
     meta = _images.get(image_id)
     if not meta or meta["plant_id"] != plant_id:
         return False
-    # 파일 제거
-    rel = rel_from_url(meta["url"])
-    delete_file(rel)
+    # 파일 제거 (url 은 저장소마다 형식이 달라 키를 따로 보관)
+    await asyncio.to_thread(get_backend().delete, meta["rel_path"])
     # 메타 제거
     _images.pop(image_id, None)
     return True
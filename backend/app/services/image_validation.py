@@ -0,0 +1,239 @@
+# 업로드 이미지 스트리밍 검증 (저장 경로에서 chunk 를 쓰기 전에 구조를 점진적으로 파싱)
+#
+# - PNG : 시그니처 → chunk(length/type/data/CRC) 단위로 CRC 까지 검증, 첫 chunk 는 IHDR(크기), IEND 로 종료
+# - JPEG: SOI → 마커 세그먼트 길이만큼 건너뜀, SOFn 에서 크기 추출, SOS 이후 엔트로피 구간은 다음 마커까지 스캔, EOI 로 종료
+# - 구조가 깨졌거나 픽셀 수가 MAX_IMAGE_PIXELS 를 넘으면 그 chunk 에서 바로 예외 → save_file 이 쓰던 파일을 지움
+# 한 번 읽은 바이트는 다시 읽지 않음 (헤더 peek/seek 없음). 버퍼에는 아직 해석하지 못한 꼬리만 남김.
+
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import status
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SOI = b"\xff\xd8"
+
+# 길이 필드가 없는 JPEG 마커: TEM, RST0~7, SOI, EOI
+_JPEG_STANDALONE = {0x01, *range(0xD0, 0xD8), 0xD8, 0xD9}
+# 프레임 헤더 (DHT=C4, JPG=C8, DAC=CC 제외)
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+class ImageValidationError(ValueError):
+    """업로드 이미지 거부 (status/code 는 라우터에서 err() 로 그대로 사용)"""
+
+    def __init__(self, message: str, *, code: str = "INVALID_IMAGE", status_code: int = status.HTTP_400_BAD_REQUEST):
+        super().__init__(message)
+        self.code = code
+        self.status_code = status_code
+
+
+def _unsupported(message: str) -> ImageValidationError:
+    return ImageValidationError(message, code="UNSUPPORTED_MEDIA_TYPE", status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+
+@dataclass
+class ImageInfo:
+    mime: str
+    width: int
+    height: int
+    size: int  # bytes
+
+
+class StreamingImageValidator:
+    """
+    save_file(validator=...) 에 넘겨 chunk 마다 feed(), EOF 에서 close() 호출.
+    expected 를 주면(확장자로 정한 mime) 시그니처가 다를 때 415.
+    """
+
+    def __init__(self, *, expected: Optional[str] = None, max_pixels: int):
+        self.expected = expected
+        self.max_pixels = max_pixels
+        self.mime: Optional[str] = None
+        self.width = 0
+        self.height = 0
+        self.size = 0
+        self.done = False  # IEND / EOI 도달
+        self._buf = bytearray()
+        self._skip = 0  # 해석 없이 건너뛸 바이트 (PNG chunk 본문, JPEG 세그먼트 본문)
+        # PNG
+        self._crc = 0
+        self._chunk_type = b""  # 본문/CRC 를 읽는 중인 chunk
+        self._seen_idat = False
+        # JPEG
+        self._in_scan = False
+
+    # ---- public ----
+    def feed(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.done:
+            return  # 종료 마커 뒤 데이터 (휴대폰 카메라의 부가 정보 등) 는 해석하지 않음
+        self._buf += chunk
+        if self.mime is None:
+            if len(self._buf) < len(PNG_SIGNATURE):
+                return
+            self._sniff()
+        if self.mime == "image/png":
+            self._parse_png()
+        else:
+            self._parse_jpeg()
+
+    def close(self) -> ImageInfo:
+        if self.mime is None:
+            self._sniff()  # 8 bytes 미만 파일
+        if not self.done:
+            raise ImageValidationError("truncated image")
+        return ImageInfo(self.mime or "", self.width, self.height, self.size)
+
+    # ---- common ----
+    def _sniff(self) -> None:
+        head = bytes(self._buf[:8])
+        if head.startswith(PNG_SIGNATURE):
+            mime = "image/png"
+        elif head.startswith(JPEG_SOI + b"\xff"):
+            mime = "image/jpeg"
+        else:
+            raise _unsupported("invalid file type")
+        if self.expected and mime != self.expected:
+            raise _unsupported("jpeg required" if self.expected == "image/jpeg" else "png required")
+        self.mime = mime
+        del self._buf[: len(PNG_SIGNATURE) if mime == "image/png" else len(JPEG_SOI)]
+
+    def _set_size(self, width: int, height: int) -> None:
+        if width <= 0 or height <= 0:
+            raise ImageValidationError("invalid image dimensions")
+        if width * height > self.max_pixels:
+            raise ImageValidationError(
+                f"image too large ({width}x{height})",
+                code="IMAGE_TOO_LARGE",
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        self.width, self.height = width, height
+
+    def _consume_skip(self) -> bool:
+        """건너뛸 바이트를 버퍼에서 소비. 남은 skip 이 있으면 False (다음 chunk 필요)."""
+        if not self._skip:
+            return True
+        n = min(self._skip, len(self._buf))
+        if self.mime == "image/png":
+            with memoryview(self._buf) as view:
+                self._crc = zlib.crc32(view[:n], self._crc)
+        del self._buf[:n]
+        self._skip -= n
+        return self._skip == 0
+
+    # ---- PNG ----
+    def _parse_png(self) -> None:
+        buf = self._buf
+        while True:
+            if self._chunk_type:
+                if not self._consume_skip() or len(buf) < 4:
+                    return
+                if struct.unpack(">I", buf[:4])[0] != self._crc:
+                    raise ImageValidationError(f"png chunk {self._chunk_type.decode('latin-1')} crc mismatch")
+                del buf[:4]
+                if self._chunk_type == b"IEND":
+                    self.done = True
+                    return
+                self._chunk_type = b""
+                continue
+            if len(buf) < 8:
+                return
+            length, ctype = struct.unpack(">I4s", buf[:8])
+            if length > 0x7FFFFFFF or not ctype.isalpha():
+                raise ImageValidationError("corrupt png chunk header")
+            first = not self.width
+            if first and ctype != b"IHDR":
+                raise ImageValidationError("png must start with IHDR")
+            if ctype == b"IHDR":
+                if not first or length != 13:
+                    raise ImageValidationError("invalid png IHDR")
+                if len(buf) < 8 + 13:
+                    return
+                width, height, depth, color = struct.unpack(">IIBB", buf[8:18])
+                if depth not in (1, 2, 4, 8, 16) or color not in (0, 2, 3, 4, 6):
+                    raise ImageValidationError("invalid png IHDR")
+                self._set_size(width, height)
+            elif ctype == b"IDAT":
+                self._seen_idat = True
+            elif ctype == b"IEND":
+                if not self._seen_idat:
+                    raise ImageValidationError("png has no image data")
+                if length:
+                    raise ImageValidationError("invalid png IEND")
+            self._crc = zlib.crc32(buf[4:8])
+            del buf[:8]
+            self._chunk_type, self._skip = ctype, length
+
+    # ---- JPEG ----
+    def _parse_jpeg(self) -> None:
+        buf = self._buf
+        while True:
+            if not self._consume_skip():
+                return
+            if self._in_scan:
+                # 엔트로피 구간: FF00(stuffing), FFD0~D7(RST) 가 아닌 FF xx 가 다음 마커
+                pos = 0
+                while True:
+                    pos = buf.find(b"\xff", pos)
+                    if pos < 0 or pos + 1 >= len(buf):
+                        keep = 1 if pos >= 0 else 0
+                        del buf[: len(buf) - keep]
+                        return
+                    nxt = buf[pos + 1]
+                    if nxt == 0x00 or 0xD0 <= nxt <= 0xD7 or nxt == 0xFF:
+                        pos += 1 if nxt == 0xFF else 2
+                        continue
+                    del buf[:pos]
+                    self._in_scan = False
+                    break
+            # 마커: FF (FF 채움 허용) xx
+            start = 0
+            while start < len(buf) and buf[start] == 0xFF:
+                start += 1
+            if start == 0 and buf:
+                raise ImageValidationError("corrupt jpeg marker")
+            if start >= len(buf):
+                del buf[: max(0, start - 1)]  # FF 하나는 남겨 다음 chunk 와 이어 봄
+                return
+            marker = buf[start]
+            if marker == 0x00:
+                raise ImageValidationError("corrupt jpeg marker")
+            if marker in _JPEG_STANDALONE:
+                if marker == 0xD8:
+                    raise ImageValidationError("unexpected jpeg SOI")
+                del buf[: start + 1]
+                if marker == 0xD9:
+                    if not self.width:
+                        raise ImageValidationError("jpeg has no image data")
+                    self.done = True
+                    return
+                continue
+            if len(buf) < start + 3:
+                return
+            length = struct.unpack(">H", buf[start + 1:start + 3])[0]
+            if length < 2:
+                raise ImageValidationError("corrupt jpeg segment length")
+            if marker in _JPEG_SOF:
+                if self.width:
+                    raise ImageValidationError("multiple jpeg frames")
+                if length < 8:
+                    raise ImageValidationError("invalid jpeg frame header")
+                if len(buf) < start + 8:
+                    return
+                height, width = struct.unpack(">HH", buf[start + 4:start + 8])
+                self._set_size(width, height)
+            elif marker == 0xDA:
+                if not self.width:
+                    raise ImageValidationError("jpeg scan before frame header")
+                self._in_scan = True
+            del buf[: start + 3]
+            self._skip = length - 2
+
+
+def expected_mime(ext: str) -> Optional[str]:
+    return {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}.get(ext)
@@ -0,0 +1,398 @@
+# 미디어 저장소 백엔드 (MEDIA_BACKEND=local | s3)
+#
+# - LocalDiskBackend: MEDIA_ROOT 아래 파일 (storage.py 의 로컬 함수 사용, 기존 동작 그대로)
+# - S3Backend       : S3 호환 오브젝트 스토리지 (AWS S3, MinIO 등). path-style 주소, SigV4 서명을 직접 계산해
+#                     httpx 로 호출 → boto3 없이 동작, transport 를 바꿔 로컬 stand-in(benchmarks/s3_standin.py)으로 시험 가능
+# - presign_put(): 클라이언트가 API 프로세스를 거치지 않고 저장소에 직접 PUT 하는 URL
+#   (크기/Content-Type 을 서명에 포함 → 저장소가 선언과 다른 업로드를 거부)
+#   로컬 백엔드는 같은 흐름을 위해 HMAC 서명된 /media/upload URL 을 발급 (routers/media.py 가 받음)
+#   presigned URL 은 만료 전까지 재사용 가능하므로 항상 임시 키(STAGING_PREFIX)를 가리키고,
+#   검증 전에 move() 로 최종 키에 옮김 → 이후 같은 URL 로 다시 PUT 해도 등록된 이미지는 바뀌지 않음
+#
+# 객체 키 = 기존 rel_path (예: 2025/01/31/<uuid>.jpg), 메타 sidecar 는 키 + ".json" 객체.
+# public_url(): 클라이언트가 이미지를 받는 주소 (로컬은 MEDIA_URL + 키, S3 는 S3_PUBLIC_URL 또는 버킷 주소 + 키)
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+import httpx
+
+from backend.app.core.config import settings
+from backend.app.services import storage
+from backend.app.services.image_validation import StreamingImageValidator
+
+_CHUNK = 1024 * 1024
+STAGING_PREFIX = ".uploads/direct/"  # presigned 직접 업로드 임시 키 (재개 업로드 조각과 같은 .uploads 아래)
+
+
+class MediaBackendError(RuntimeError):
+    """저장소 호출 실패 (상위에서 502/503 처리)"""
+
+
+@dataclass
+class PresignedUpload:
+    method: str
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)  # 클라이언트가 그대로 보내야 하는 헤더
+    expires_at: float = 0.0
+
+
+class MediaBackend(ABC):
+    name: str = ""
+
+    @abstractmethod
+    def save(
+        self, fileobj: BinaryIO, rel_path: str, *, max_bytes: int, validator: Optional[StreamingImageValidator] = None
+    ) -> Optional[Path]:
+        """스트리밍 저장 + 용량/구조 검증 (storage.save_file 과 같은 예외). 로컬 경로가 있으면 반환."""
+
+    @abstractmethod
+    def put_file(self, src: Path, rel_path: str) -> None:
+        """이미 검증된 로컬 파일(재개 업로드 조각 등)을 rel_path 로 옮김. src 는 이후 사라짐."""
+
+    @abstractmethod
+    def move(self, src_rel: str, dst_rel: str) -> None:
+        """저장소 안에서 src → dst 이동 (src 없으면 FileNotFoundError)"""
+
+    @abstractmethod
+    def delete(self, rel_path: str) -> None:
+        """파일 + 메타 sidecar 삭제 (없으면 무시)"""
+
+    @abstractmethod
+    def size(self, rel_path: str) -> Optional[int]:
+        """없으면 None"""
+
+    @abstractmethod
+    def read_range(self, rel_path: str, start: int, length: int) -> bytes:
+        ...
+
+    @abstractmethod
+    def write_meta(self, rel_path: str, meta: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def read_meta(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def presign_put(self, rel_path: str, *, size: int, content_type: str, expires: int) -> PresignedUpload:
+        ...
+
+    @abstractmethod
+    def public_url(self, rel_path: str) -> str:
+        """이미지 메타의 url (API 서버를 거치지 않고 바로 받을 수 있는 주소)"""
+
+    def local_path(self, rel_path: str) -> Optional[Path]:
+        return None
+
+
+# -----------------------
+# Local disk
+# -----------------------
+def _local_signature(rel_path: str, size: int, content_type: str, expires_at: int) -> str:
+    msg = f"PUT\n{rel_path}\n{size}\n{content_type}\n{expires_at}".encode("utf-8")
+    return hmac.new(settings.JWT_SECRET.encode("utf-8"), msg, hashlib.sha256).hexdigest()
+
+
+def verify_local_upload(rel_path: str, size: int, content_type: str, expires_at: int, signature: str) -> bool:
+    """routers/media.py 에서 호출: 서명/만료 확인"""
+    if expires_at < time.time():
+        return False
+    return hmac.compare_digest(_local_signature(rel_path, size, content_type, expires_at), signature)
+
+
+class LocalDiskBackend(MediaBackend):
+    name = "local"
+
+    def save(self, fileobj, rel_path, *, max_bytes, validator=None):
+        full, _ = storage.save_file(fileobj, rel_path, max_bytes=max_bytes, validator=validator)
+        return full
+
+    def put_file(self, src, rel_path):
+        os.replace(src, storage.ensure_dirs(rel_path))  # 같은 파일시스템 → rename 만
+
+    def move(self, src_rel, dst_rel):
+        os.replace(storage.media_root_abs() / src_rel, storage.ensure_dirs(dst_rel))
+
+    def delete(self, rel_path):
+        storage.delete_file(rel_path)
+
+    def size(self, rel_path):
+        try:
+            return (storage.media_root_abs() / rel_path).stat().st_size
+        except FileNotFoundError:
+            return None
+
+    def read_range(self, rel_path, start, length):
+        with open(storage.media_root_abs() / rel_path, "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+    def write_meta(self, rel_path, meta):
+        storage.write_meta(rel_path, meta)
+
+    def read_meta(self, rel_path):
+        return storage.read_meta(rel_path)
+
+    def presign_put(self, rel_path, *, size, content_type, expires):
+        expires_at = int(time.time()) + expires
+        query = (
+            f"key={quote(rel_path, safe='')}&size={size}&expires={expires_at}"
+            f"&signature={_local_signature(rel_path, size, content_type, expires_at)}"
+        )
+        return PresignedUpload(
+            method="PUT",
+            url=f"/api/v1/media/upload?{query}",
+            headers={"Content-Type": content_type, "Content-Length": str(size)},
+            expires_at=float(expires_at),
+        )
+
+    def public_url(self, rel_path):
+        return storage.build_url(rel_path)
+
+    def local_path(self, rel_path):
+        return storage.media_root_abs() / rel_path
+
+
+# -----------------------
+# S3 compatible (SigV4)
+# -----------------------
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _uri_encode(value: str, *, path: bool = False) -> str:
+    return quote(value, safe="/-_.~" if path else "-_.~")
+
+
+def canonical_query(params: Dict[str, str]) -> str:
+    return "&".join(f"{_uri_encode(k)}={_uri_encode(v)}" for k, v in sorted(params.items()))
+
+
+def sigv4_signature(
+    *,
+    method: str,
+    path: str,
+    query: Dict[str, str],
+    headers: Dict[str, str],
+    signed_headers: List[str],
+    payload_hash: str,
+    amz_date: str,
+    region: str,
+    secret_key: str,
+    service: str = "s3",
+) -> str:
+    """AWS Signature Version 4 (S3 와 MinIO 가 같은 방식으로 검증). headers 키는 소문자."""
+    canonical_headers = "".join(f"{h}:{' '.join(headers[h].split())}\n" for h in signed_headers)
+    canonical_request = "\n".join(
+        [method, _uri_encode(path, path=True), canonical_query(query), canonical_headers, ";".join(signed_headers), payload_hash]
+    )
+    scope = f"{amz_date[:8]}/{region}/{service}/aws4_request"
+    string_to_sign = "\n".join(
+        ["AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()]
+    )
+    key = _hmac(("AWS4" + secret_key).encode("utf-8"), amz_date[:8])
+    for part in (region, service, "aws4_request"):
+        key = _hmac(key, part)
+    return hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+class S3Backend(MediaBackend):
+    name = "s3"
+
+    def __init__(
+        self,
+        *,
+        endpoint_url: str,
+        bucket: str,
+        access_key: str,
+        secret_key: str,
+        region: str = "us-east-1",
+        public_url: str = "",
+        transport: Optional[httpx.BaseTransport] = None,
+        timeout: float = 30.0,
+    ):
+        if not bucket or not access_key or not secret_key:
+            raise MediaBackendError("S3_BUCKET, S3_ACCESS_KEY and S3_SECRET_KEY are required")
+        self.endpoint = (endpoint_url or f"https://s3.{region}.amazonaws.com").rstrip("/")
+        self.host = urlsplit(self.endpoint).netloc
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.public_base = (public_url or f"{self.endpoint}/{bucket}").rstrip("/")  # CDN 이 없으면 path-style 버킷 주소
+        self.client = httpx.Client(transport=transport, timeout=timeout)
+
+    # ---- signing ----
+    def _path(self, key: str) -> str:
+        return f"/{self.bucket}/{key}"
+
+    def _url(self, path: str, query: Dict[str, str]) -> str:
+        url = self.endpoint + _uri_encode(path, path=True)
+        return f"{url}?{canonical_query(query)}" if query else url
+
+    def _request(
+        self,
+        method: str,
+        key: str,
+        *,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        ok: Tuple[int, ...] = (200,),
+    ) -> httpx.Response:
+        amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = self._path(key)
+        hdrs = {k.lower(): v for k, v in (headers or {}).items()}
+        hdrs.update({"host": self.host, "x-amz-date": amz_date, "x-amz-content-sha256": UNSIGNED_PAYLOAD})
+        signed = sorted(hdrs)
+        signature = sigv4_signature(
+            method=method, path=path, query={}, headers=hdrs, signed_headers=signed,
+            payload_hash=UNSIGNED_PAYLOAD, amz_date=amz_date, region=self.region, secret_key=self.secret_key,
+        )
+        hdrs["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{amz_date[:8]}/{self.region}/s3/aws4_request, "
+            f"SignedHeaders={';'.join(signed)}, Signature={signature}"
+        )
+        del hdrs["host"]  # httpx 가 같은 값으로 채움
+        try:
+            resp = self.client.request(method, self._url(path, {}), content=content, headers=hdrs)
+        except httpx.HTTPError as e:
+            raise MediaBackendError(f"s3 {method} {key}: {e}") from e
+        if resp.status_code not in ok:
+            raise MediaBackendError(f"s3 {method} {key}: HTTP {resp.status_code} {resp.text[:200]}")
+        return resp
+
+    # ---- MediaBackend ----
+    def save(self, fileobj, rel_path, *, max_bytes, validator=None):
+        # 업로드 상한(MAX_UPLOAD_MB)이 작으므로 검증하며 메모리에 모은 뒤 한 번에 PUT (검증 실패 시 저장소 호출 없음)
+        buf = io.BytesIO()
+        while True:
+            chunk = fileobj.read(_CHUNK)
+            if not chunk:
+                break
+            if buf.tell() + len(chunk) > max_bytes:
+                raise ValueError("too_large")
+            if validator is not None:
+                validator.feed(chunk)
+            buf.write(chunk)
+        if validator is not None:
+            validator.close()
+        content_type = f"image/{'png' if rel_path.endswith('.png') else 'jpeg'}"
+        self._request("PUT", rel_path, content=buf.getvalue(), headers={"Content-Type": content_type})
+        return None
+
+    def put_file(self, src, rel_path):
+        with open(src, "rb") as f:
+            self.save(f, rel_path, max_bytes=src.stat().st_size)
+        src.unlink()
+
+    def move(self, src_rel, dst_rel):
+        # S3 에는 rename 이 없음 → 서버 측 복사 후 원본 삭제 (복사 시점의 내용으로 고정)
+        source = quote(f"/{self.bucket}/{src_rel}", safe="/-_.~")
+        resp = self._request("PUT", dst_rel, headers={"x-amz-copy-source": source}, ok=(200, 404))
+        if resp.status_code == 404:
+            raise FileNotFoundError(src_rel)
+        self._request("DELETE", src_rel, ok=(200, 204, 404))
+
+    def delete(self, rel_path):
+        for key in (rel_path, rel_path + storage.META_SUFFIX):
+            self._request("DELETE", key, ok=(200, 204, 404))
+
+    def size(self, rel_path):
+        resp = self._request("HEAD", rel_path, ok=(200, 404))
+        return int(resp.headers["content-length"]) if resp.status_code == 200 else None
+
+    def read_range(self, rel_path, start, length):
+        resp = self._request("GET", rel_path, headers={"Range": f"bytes={start}-{start + length - 1}"}, ok=(200, 206))
+        return resp.content[:length] if resp.status_code == 200 else resp.content
+
+    def write_meta(self, rel_path, meta):
+        body = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        self._request("PUT", rel_path + storage.META_SUFFIX, content=body, headers={"Content-Type": "application/json"})
+
+    def read_meta(self, rel_path):
+        resp = self._request("GET", rel_path + storage.META_SUFFIX, ok=(200, 404))
+        if resp.status_code != 200:
+            return None
+        try:
+            return json.loads(resp.content)
+        except ValueError:
+            return None
+
+    def presign_put(self, rel_path, *, size, content_type, expires):
+        amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = self._path(rel_path)
+        headers = {"content-length": str(size), "content-type": content_type, "host": self.host}
+        signed = sorted(headers)
+        query = {
+            "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+            "X-Amz-Credential": f"{self.access_key}/{amz_date[:8]}/{self.region}/s3/aws4_request",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires),
+            "X-Amz-SignedHeaders": ";".join(signed),
+        }
+        query["X-Amz-Signature"] = sigv4_signature(
+            method="PUT", path=path, query=query, headers=headers, signed_headers=signed,
+            payload_hash=UNSIGNED_PAYLOAD, amz_date=amz_date, region=self.region, secret_key=self.secret_key,
+        )
+        return PresignedUpload(
+            method="PUT",
+            url=self._url(path, query),
+            headers={"Content-Type": content_type, "Content-Length": str(size)},
+            expires_at=time.time() + expires,
+        )
+
+    def public_url(self, rel_path):
+        return self.public_base + "/" + _uri_encode(rel_path, path=True)
+
+
+# -----------------------
+# Selection
+# -----------------------
+_backend: Optional[MediaBackend] = None
+
+
+def create_backend(name: Optional[str] = None, **overrides: Any) -> MediaBackend:
+    name = (name or settings.MEDIA_BACKEND).lower()
+    if name == "local":
+        return LocalDiskBackend()
+    if name == "s3":
+        options: Dict[str, Any] = {
+            "endpoint_url": settings.S3_ENDPOINT_URL,
+            "bucket": settings.S3_BUCKET,
+            "access_key": settings.S3_ACCESS_KEY,
+            "secret_key": settings.S3_SECRET_KEY.get_secret_value(),
+            "region": settings.S3_REGION,
+            "public_url": settings.S3_PUBLIC_URL,
+        }
+        options.update(overrides)
+        return S3Backend(**options)
+    raise MediaBackendError(f"unknown MEDIA_BACKEND: {name}")
+
+
+def get_backend() -> MediaBackend:
+    global _backend
+    if _backend is None:
+        _backend = create_backend()
+    return _backend
+
+
+def set_backend(backend: Optional[MediaBackend]) -> None:
+    """테스트/벤치마크에서 stand-in 백엔드로 교체 (None 이면 설정값으로 다시 생성)"""
+    global _backend
+    _backend = backend
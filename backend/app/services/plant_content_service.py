@@ -0,0 +1,166 @@
+# Diary.plant_content (식물 시점 글) 백그라운드 생성
+#
+# crud/diary.create 가 같은 트랜잭션에서 plant_content_job 을 등록 → 커밋되면 워커를 깨움.
+# 워커: job 배치 선점(lease) → 다이어리 일괄 조회 → LLM 일괄 생성 → crud/diary.patch 로 기록 → job 삭제.
+# 실패는 지수 백오프로 재시도, PLANT_CONTENT_MAX_ATTEMPTS 초과 시 failed 로 남김.
+# 대기열이 DB 에 있으므로 재시작/크래시 후에도 이어서 처리 (running 은 lease 만료 후 다시 선점).
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from backend.app.core import database
+from backend.app.core.config import settings
+from backend.app.db.crud import diary as diary_crud
+from backend.app.db.crud import plant_content_job
+from backend.app.ml import plant_llm
+
+logger = logging.getLogger(__name__)
+
+_task: Optional[asyncio.Task] = None
+_wake: Optional[asyncio.Event] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_next_retry_at: Optional[datetime] = None  # 가장 이른 재시도 예정 시각 (대기 시간 계산용)
+_stats: Dict[str, Any] = {
+    "batches": 0,
+    "generated": 0,
+    "retried": 0,
+    "failed": 0,
+    "last_batch_size": 0,
+    "last_batch_ms": None,
+}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _backoff(attempts: int) -> timedelta:
+    seconds = settings.PLANT_CONTENT_RETRY_SECONDS * (2 ** max(0, attempts - 1))
+    return timedelta(seconds=min(seconds, 3600.0))
+
+
+def _on_commit(changed: database.ChangedRows) -> None:
+    # 커밋 훅은 이벤트 루프 스레드에서 호출되지만, 다른 루프/스레드일 수도 있으므로 threadsafe 로 깨움
+    if _wake is None or _loop is None or _loop.is_closed():
+        return
+    if any(table == "plant_content_job" for table, _ in changed):
+        _loop.call_soon_threadsafe(_wake.set)
+
+
+database.on_commit(_on_commit)
+
+
+async def _process_batch() -> int:
+    """job 1배치 처리. 처리한 job 수 반환 (0 이면 대기열이 빔)."""
+    global _next_retry_at
+    now = _utcnow()
+    async with database.AsyncSessionLocal() as db:
+        jobs = await plant_content_job.claim_due(
+            db, now=now, limit=settings.PLANT_CONTENT_BATCH_SIZE, lease_seconds=settings.PLANT_CONTENT_LEASE_SECONDS
+        )
+        claimed = [(j.idx, j.diary_id, j.attempts) for j in jobs]  # attempts 는 선점 시 +1 된 값
+        await db.commit()
+    if not claimed:
+        return 0
+
+    t0 = time.perf_counter()
+    async with database.ReadSessionLocal() as db:
+        rows = {r.diary_id: r for r in await diary_crud.list_rows_by_ids(db, [d for _, d, _ in claimed])}
+
+    done: List[int] = []
+    todo = []
+    for idx, diary_id, attempts in claimed:
+        row = rows.get(diary_id)
+        if row is None or row.plant_content:
+            done.append(idx)  # 삭제됐거나 이미 작성됨
+        else:
+            todo.append((idx, row, attempts))
+
+    results: List[Any]
+    try:
+        prompts = [plant_llm.build_diary_prompt(r.user_title, r.user_content, r.hashtag, r.weather) for _, r, _ in todo]
+        results = await plant_llm.complete_batch(prompts, max_tokens=settings.PLANT_CONTENT_MAX_TOKENS) if todo else []
+    except plant_llm.GenerationQueueFull as e:
+        # 대화형 요청으로 바쁨 → 시도 횟수에 넣지 않고 잠시 뒤 다시
+        results = [e] * len(todo)
+        todo = [(idx, row, attempts - 1) for idx, row, attempts in todo]
+    except Exception as e:
+        logger.warning("plant_content batch generation failed: %s", e)
+        results = [e] * len(todo)
+
+    async with database.AsyncSessionLocal() as db:
+        for (idx, row, attempts), result in zip(todo, results):
+            if isinstance(result, Exception) or not result:
+                error = str(result) if isinstance(result, Exception) else "empty generation"
+                retry_at = _utcnow() + _backoff(attempts) if attempts < settings.PLANT_CONTENT_MAX_ATTEMPTS else None
+                await plant_content_job.mark_retry(db, idx, error=error, attempts=attempts, next_run_at=retry_at)
+                retry = retry_at is not None
+                if retry_at is not None and (_next_retry_at is None or retry_at < _next_retry_at):
+                    _next_retry_at = retry_at
+                _stats["retried" if retry else "failed"] += 1
+                continue
+            await diary_crud.patch(db, row.diary_id, plant_content=result)
+            done.append(idx)
+            _stats["generated"] += 1
+        await plant_content_job.delete_done(db, done)
+        await db.commit()
+
+    _stats["batches"] += 1
+    _stats["last_batch_size"] = len(claimed)
+    _stats["last_batch_ms"] = round((time.perf_counter() - t0) * 1000.0, 3)
+    return len(claimed)
+
+
+async def _run_forever() -> None:
+    global _next_retry_at
+    assert _wake is not None
+    while True:
+        try:
+            processed = await _process_batch()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("plant_content worker error")
+            processed = 0
+        if processed:
+            continue  # 남은 job 이 있을 수 있으므로 바로 다음 배치
+        _wake.clear()
+        timeout = settings.PLANT_CONTENT_POLL_SECONDS
+        if _next_retry_at is not None:
+            timeout = min(timeout, max(0.0, (_next_retry_at - _utcnow()).total_seconds()))
+            _next_retry_at = None
+        try:
+            await asyncio.wait_for(_wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass  # 재시도 예정(next_run_at) job 확인
+
+
+def start() -> None:
+    """lifespan 에서 호출 (DB 미설정/비활성화 시 아무것도 하지 않음)"""
+    global _task, _wake, _loop
+    if _task is not None or not settings.PLANT_CONTENT_ENABLED or not database.db_configured():
+        return
+    _loop = asyncio.get_running_loop()
+    _wake = asyncio.Event()
+    _task = _loop.create_task(_run_forever(), name="plant-content-worker")
+
+
+async def stop() -> None:
+    global _task, _wake, _loop
+    task, _task = _task, None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+    _wake = _loop = None
+
+
+def stats() -> Dict[str, Any]:
+    return {**_stats, "running": _task is not None}
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
+import json
 import os
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import BinaryIO, Tuple
 
 from backend.app.core.config import settings
+from backend.app.services.image_validation import StreamingImageValidator
 
 # In-memory stores
 _USERS_BY_ID: Dict[str, Dict[str, Any]] = {}
@@ -129,37 +131,77 @@ def rel_from_url(url: str) -> str:
 
 
 # ---------- I/O ----------
-def save_file(fileobj: BinaryIO, rel_path: str, *, max_bytes: int) -> Tuple[Path, str]:
+def save_file(
+    fileobj: BinaryIO,
+    rel_path: str,
+    *,
+    max_bytes: int,
+    validator: Optional[StreamingImageValidator] = None,
+) -> Tuple[Path, str]:
     """
     스트리밍 저장 + 용량 가드.
     초과 시 ValueError("too_large") → 전역 미들웨어가 413 변환.
+    validator 를 주면 각 chunk 를 쓰기 전에 feed(), EOF 에서 close() → 구조 오류면 그 자리에서 중단.
+    임시 파일(.part)에 쓴 뒤 끝까지 통과해야 rel_path 로 rename (중단된 업로드는 보이지 않음).
     """
     full = ensure_dirs(rel_path)
+    part = full.with_name(full.name + ".part")
     written = 0
     chunk_size = 1024 * 1024  # 1MB
-    with open(full, "wb") as out:
-        while True:
-            chunk = fileobj.read(chunk_size)
-            if not chunk:
-                break
-            written += len(chunk)
-            if written > max_bytes:
-                out.close()
-                try:
-                    os.remove(full)
-                except FileNotFoundError:
-                    pass
-                raise ValueError("too_large")
-            out.write(chunk)
+    try:
+        with open(part, "wb") as out:
+            while True:
+                chunk = fileobj.read(chunk_size)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > max_bytes:
+                    raise ValueError("too_large")
+                if validator is not None:
+                    validator.feed(chunk)
+                out.write(chunk)
+        if validator is not None:
+            validator.close()
+        os.replace(part, full)
+    except BaseException:
+        try:
+            os.remove(part)
+        except FileNotFoundError:
+            pass
+        raise
     return full, build_url(rel_path)
 
 
 def delete_file(rel_path: str) -> None:
     full = media_root_abs() / rel_path
+    for target in (full, meta_path(rel_path)):
+        try:
+            target.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ---------- 메타 sidecar (<파일>.json) ----------
+# 파일만 보고도 어느 식물의 사진인지 알 수 있도록 (배치 재분류 등 오프라인 작업용)
+META_SUFFIX = ".json"
+
+
+def meta_path(rel_path: str) -> Path:
+    return media_root_abs() / (rel_path + META_SUFFIX)
+
+
+def write_meta(rel_path: str, meta: Dict[str, Any]) -> None:
+    path = meta_path(rel_path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_meta(rel_path: str) -> Optional[Dict[str, Any]]:
     try:
-        full.unlink()
-    except FileNotFoundError:
-        pass
+        return json.loads(meta_path(rel_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
 
 
 
@@ -0,0 +1,335 @@
+# 재개 가능한 이미지 업로드 (모바일 네트워크 끊김 대비, tus 방식)
+#
+# 1) create  : 세션 생성 (파일명/전체 크기) → upload_id
+# 2) append  : Upload-Offset 위치부터 이어 쓰기. 서버 offset 과 다르면 409 + 현재 offset (클라이언트는 거기서 재전송)
+# 3) finalize: offset == size 이고 이미지 구조 검증을 통과하면 image_service 로 메타 등록
+#
+# 조각 데이터는 MEDIA_ROOT/.uploads/<id>.part, offset 인덱스는 <id>.json (원자적 교체).
+# 데이터를 fsync 한 뒤에만 인덱스 offset 을 올리므로, 크래시 후에도 인덱스 offset 까지는 항상 유효
+# (.part 가 더 길면 다음 append 때 잘라냄).
+# 이미지 검증기(StreamingImageValidator)는 세션별로 메모리에 유지해 청크마다 이어서 검증 →
+# 깨진 파일은 끝까지 받기 전에 중단. 재시작/다른 워커에서는 받은 만큼 한 번 다시 읽어 상태를 복원.
+# 세션 단위 직렬화: 프로세스 안은 asyncio.Lock, 워커 프로세스 사이는 <id>.lock 파일의 flock
+# (인덱스 <id>.json 은 os.replace 로 바뀌므로 잠금 대상이 될 수 없음). fcntl 이 없는 OS(Windows)는 단일 워커만 지원.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+try:
+    import fcntl  # POSIX 전용 (워커 간 잠금)
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+from backend.app.core.config import settings
+from backend.app.services import image_service
+from backend.app.services.image_validation import ImageValidationError, StreamingImageValidator, expected_mime
+from backend.app.services.storage import media_root_abs, new_uuid, safe_ext
+
+_WRITE_BUFFER = 1024 * 1024  # 이 크기만큼 모아서 스레드에서 기록
+_LOCK_POLL_SECONDS = 0.01    # 다른 워커가 잡고 있는 세션 잠금 재시도 간격
+
+
+class UploadSessionError(Exception):
+    """세션 상태 오류 (status/code 는 라우터에서 err() 로 사용)"""
+
+    def __init__(self, status_code: int, code: str, message: str, *, offset: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.offset = offset
+
+
+@dataclass
+class UploadSession:
+    upload_id: str
+    user_id: str
+    plant_id: str
+    ext: str
+    size: int
+    image_type: str
+    note: Optional[str]
+    offset: int = 0
+    created_at: float = 0.0
+    expires_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# 메모리 상태: 세션별 lock, (offset, validator) - 인덱스와 offset 이 다르면 버리고 복원
+_locks: Dict[str, asyncio.Lock] = {}
+_validators: Dict[str, Tuple[int, StreamingImageValidator]] = {}
+_last_prune = 0.0
+_stats: Dict[str, int] = {"created": 0, "appended_bytes": 0, "conflicts": 0, "rejected": 0, "finalized": 0, "resumed_validators": 0}
+
+
+# -----------------------
+# On-disk index
+# -----------------------
+def staging_dir() -> Path:
+    path = media_root_abs() / ".uploads"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _part_path(upload_id: str) -> Path:
+    return staging_dir() / f"{upload_id}.part"
+
+
+def _index_path(upload_id: str) -> Path:
+    return staging_dir() / f"{upload_id}.json"
+
+
+def _lock_path(upload_id: str) -> Path:
+    return staging_dir() / f"{upload_id}.lock"
+
+
+def _save(session: UploadSession) -> None:
+    path = _index_path(session.upload_id)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(session.to_dict(), ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _load(upload_id: str) -> Optional[UploadSession]:
+    if not upload_id.replace("-", "").isalnum():
+        return None  # 경로 조작 방지
+    try:
+        data = json.loads(_index_path(upload_id).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return UploadSession(**data)
+
+
+def _remove(upload_id: str) -> None:
+    _validators.pop(upload_id, None)
+    _locks.pop(upload_id, None)
+    for path in (_part_path(upload_id), _index_path(upload_id), _lock_path(upload_id)):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def prune_expired(now: Optional[float] = None) -> int:
+    """만료 세션 정리 (create 시 최대 1분에 한 번)"""
+    now = now or time.time()
+    removed = 0
+    for path in staging_dir().glob("*.json"):
+        session = _load(path.stem)
+        if session is None or session.expires_at < now:
+            _remove(path.stem)
+            removed += 1
+    return removed
+
+
+def _lock(upload_id: str) -> asyncio.Lock:
+    lock = _locks.get(upload_id)
+    if lock is None:
+        lock = _locks[upload_id] = asyncio.Lock()
+    return lock
+
+
+@asynccontextmanager
+async def _session_lock(upload_id: str) -> AsyncIterator[None]:
+    """
+    세션 1개에 대한 append/finalize/abort 직렬화 (같은 프로세스 + 다른 워커 프로세스).
+    flock 은 논블로킹으로 재시도 → 기다리는 동안 이벤트 루프를 막지 않고, 취소되어도 잠금이 새지 않음.
+    잠금을 얻은 뒤 세션이 지워졌으면 _get_owned 가 404.
+    """
+    async with _lock(upload_id):
+        if fcntl is None or _load(upload_id) is None:
+            yield
+            return
+        fd = os.open(_lock_path(upload_id), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(_LOCK_POLL_SECONDS)
+            yield
+        finally:
+            os.close(fd)  # 닫으면 flock 도 해제
+
+
+def _get_owned(upload_id: str, user_id: str, plant_id: str) -> UploadSession:
+    session = _load(upload_id)
+    if session is None or session.user_id != user_id or session.plant_id != plant_id:
+        raise UploadSessionError(404, "NOT_FOUND", "upload not found")
+    if session.expires_at < time.time():
+        _remove(upload_id)
+        raise UploadSessionError(404, "NOT_FOUND", "upload expired")
+    return session
+
+
+def _validator_for(session: UploadSession) -> StreamingImageValidator:
+    cached = _validators.get(session.upload_id)
+    if cached is not None and cached[0] == session.offset:
+        return cached[1]
+    # 재시작/다른 워커에서 이어 받는 경우: 이미 받은 구간을 한 번 다시 읽어 검증 상태 복원
+    validator = StreamingImageValidator(expected=expected_mime(session.ext), max_pixels=settings.MAX_IMAGE_PIXELS)
+    remaining = session.offset
+    if remaining:
+        with open(_part_path(session.upload_id), "rb") as f:
+            while remaining:
+                chunk = f.read(min(_WRITE_BUFFER, remaining))
+                if not chunk:
+                    raise UploadSessionError(409, "UPLOAD_CORRUPTED", "partial data is missing", offset=0)
+                validator.feed(chunk)
+                remaining -= len(chunk)
+        _stats["resumed_validators"] += 1
+    return validator
+
+
+# -----------------------
+# Operations
+# -----------------------
+def create(*, user_id: str, plant_id: str, filename: str, size: int, image_type: str, note: Optional[str]) -> UploadSession:
+    global _last_prune
+    ext = safe_ext(filename)
+    if ext not in (".jpg", ".png"):
+        raise UploadSessionError(415, "UNSUPPORTED_MEDIA_TYPE", "only jpg/png allowed")
+    if size <= 0:
+        raise UploadSessionError(400, "BAD_REQUEST", "size must be positive")
+    if size > settings.MAX_UPLOAD_MB * 1024 * 1024:
+        raise ValueError("too_large")  # 전역 미들웨어가 413 리턴
+    now = time.time()
+    if now - _last_prune > 60:
+        _last_prune = now
+        prune_expired(now)
+    session = UploadSession(
+        upload_id=new_uuid(),
+        user_id=user_id,
+        plant_id=plant_id,
+        ext=ext,
+        size=size,
+        image_type=image_type,
+        note=note,
+        created_at=now,
+        expires_at=now + settings.UPLOAD_SESSION_TTL_SECONDS,
+    )
+    _part_path(session.upload_id).touch()
+    _save(session)
+    _stats["created"] += 1
+    return session
+
+
+def status(upload_id: str, *, user_id: str, plant_id: str) -> UploadSession:
+    return _get_owned(upload_id, user_id, plant_id)
+
+
+def _write(upload_id: str, offset: int, data: bytes, *, truncate: bool, sync: bool) -> None:
+    with open(_part_path(upload_id), "r+b") as f:
+        if truncate:
+            f.truncate(offset)  # 인덱스보다 긴 꼬리(크래시 전 기록) 제거
+        f.seek(offset)
+        f.write(data)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+async def append(
+    upload_id: str,
+    *,
+    user_id: str,
+    plant_id: str,
+    offset: int,
+    body: AsyncIterator[bytes],
+    content_length: Optional[int] = None,
+) -> UploadSession:
+    """offset 위치부터 body 를 이어 씀. 중간에 연결이 끊겨도 받은 만큼은 offset 에 반영."""
+    async with _session_lock(upload_id):
+        session = _get_owned(upload_id, user_id, plant_id)
+        if offset != session.offset:
+            _stats["conflicts"] += 1
+            raise UploadSessionError(409, "OFFSET_MISMATCH", "upload offset mismatch", offset=session.offset)
+        if content_length is not None and offset + content_length > session.size:
+            raise UploadSessionError(413, "PAYLOAD_TOO_LARGE", "chunk exceeds declared size", offset=session.offset)
+        validator = await asyncio.to_thread(_validator_for, session)
+
+        pending = bytearray()
+        first = True
+
+        async def flush(sync: bool) -> None:
+            nonlocal first
+            data = bytes(pending)
+            pending.clear()
+            await asyncio.to_thread(_write, upload_id, session.offset, data, truncate=first, sync=sync)
+            first = False
+            session.offset += len(data)
+            _stats["appended_bytes"] += len(data)
+
+        interrupted: Optional[BaseException] = None
+        try:
+            async for chunk in body:
+                if session.offset + len(pending) + len(chunk) > session.size:
+                    raise UploadSessionError(413, "PAYLOAD_TOO_LARGE", "chunk exceeds declared size")
+                validator.feed(chunk)  # 구조 오류면 기록 전에 중단
+                pending += chunk
+                if len(pending) >= _WRITE_BUFFER:
+                    await flush(sync=False)
+        except ImageValidationError:
+            _stats["rejected"] += 1
+            _remove(upload_id)
+            raise
+        except BaseException as e:  # 크기 초과, 연결 끊김(ClientDisconnect/취소)
+            interrupted = e
+
+        # 받은 데이터까지 기록하고 offset 인덱스 갱신 → 재시도는 여기서부터
+        _validators.pop(upload_id, None)
+        await flush(sync=True)
+        _save(session)
+        _validators[upload_id] = (session.offset, validator)
+        if interrupted is not None:
+            if isinstance(interrupted, UploadSessionError):
+                interrupted.offset = session.offset
+            raise interrupted
+        return session
+
+
+async def finalize(upload_id: str, *, user_id: str, plant_id: str) -> Dict[str, Any]:
+    async with _session_lock(upload_id):
+        session = _get_owned(upload_id, user_id, plant_id)
+        if session.offset != session.size:
+            raise UploadSessionError(409, "UPLOAD_INCOMPLETE", "upload is not complete", offset=session.offset)
+        validator = await asyncio.to_thread(_validator_for, session)
+        try:
+            validator.close()
+        except ImageValidationError:
+            _stats["rejected"] += 1
+            _remove(upload_id)
+            raise
+        meta = await image_service.create_image_from_file(
+            plant_id=plant_id,
+            user_id=user_id,
+            src=_part_path(upload_id),
+            ext=session.ext,
+            image_type=session.image_type,
+            note=session.note,
+            width=validator.width,
+            height=validator.height,
+        )
+        _remove(upload_id)
+        _stats["finalized"] += 1
+        return meta
+
+
+async def abort(upload_id: str, *, user_id: str, plant_id: str) -> None:
+    async with _session_lock(upload_id):
+        _get_owned(upload_id, user_id, plant_id)
+        _remove(upload_id)
+
+
+def stats() -> Dict[str, Any]:
+    return {**_stats, "active_validators": len(_validators)}
@@ -8,6 +8,8 @@ from typing import Any, Dict, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from ..utils import timing
+
 # 설정에서 JWT 시크릿/알고리즘을 읽어오되, 없으면 느슨 모드로 동작
 try:
     from ..core.config import get_settings  # type: ignore
@@ -83,7 +85,8 @@ async def get_current_user(
         )
 
     token = credentials.credentials
-    payload = _decode_jwt_best_effort(token)
+    with timing.span("auth"):
+        payload = _decode_jwt_best_effort(token)
     if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
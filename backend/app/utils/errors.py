@@ -1,6 +1,7 @@
 from __future__ import annotations
 import http
 import uuid
+from typing import Dict, Optional
 
 from fastapi import HTTPException
 from uuid import uuid4
@@ -24,13 +25,13 @@ def _format_error(code: str, message: str) -> dict:
 
 # 애플리케이션 예외
 class AppError(FastAPIHTTPException):
-    def __init__(self, status_code: int, code: str, message: str):
-        super().__init__(status_code=status_code, detail={"code": code, "message": message})
+    def __init__(self, status_code: int, code: str, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(status_code=status_code, detail={"code": code, "message": message}, headers=headers)
         self.app_code = code
         self.app_message = message
 
-def err(status_code: int, code: str, message: str) -> AppError:
-    return AppError(status_code, code, message)
+def err(status_code: int, code: str, message: str, headers: Optional[Dict[str, str]] = None) -> AppError:
+    return AppError(status_code, code, message, headers)
 
 
 # 도메인 예외
@@ -48,6 +49,7 @@ def register_error_handlers(app: FastAPI) -> None:
         return JSONResponse(
             status_code=exc.status_code,
             content=_format_error(exc.app_code, exc.app_message),
+            headers=exc.headers,
         )
 
     @app.exception_handler(FastAPIHTTPException)
@@ -0,0 +1,95 @@
+# 인메모리 히스토그램 유틸리티 (메트릭 엔드포인트용)
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# 지연시간(ms) 기본 버킷
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# 개수(쿼리 수 등) 기본 버킷
+COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+
+class Histogram:
+    """고정 버킷 누적 히스토그램. 분위수는 버킷 상한으로 근사."""
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS_MS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= rank and c:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            count, total, vmax = self.count, self.sum, self.max
+        labels = [f"le_{b:g}" for b in self.buckets] + ["le_inf"]
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "avg": round(total / count, 3) if count else None,
+            "max": round(vmax, 3),
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(labels, counts)),
+        }
+
+
+class HistogramFamily:
+    """라벨(문자열) 별 히스토그램 묶음. 라벨 수가 max_labels를 넘으면 '<other>'로 합침."""
+
+    OTHER = "<other>"
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS_MS, max_labels: int = 500):
+        self.buckets = tuple(buckets)
+        self.max_labels = max_labels
+        self._items: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, label: str) -> Histogram:
+        h = self._items.get(label)
+        if h is not None:
+            return h
+        with self._lock:
+            h = self._items.get(label)
+            if h is None:
+                if len(self._items) >= self.max_labels:
+                    label = self.OTHER
+                    h = self._items.get(label)
+                if h is None:
+                    h = Histogram(self.buckets)
+                    self._items[label] = h
+        return h
+
+    def observe(self, label: str, value: float) -> None:
+        self.labels(label).observe(value)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            items = list(self._items.items())
+        return {k: h.snapshot() for k, h in items}
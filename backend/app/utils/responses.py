@@ -0,0 +1,75 @@
+# 빠른 JSON 응답 클래스 + 1회 검증 직렬화 헬퍼
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Optional, Type, TypeVar
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+# orjson 이 있으면 사용 (datetime/UUID/numpy 를 C 레벨에서 바로 인코딩), 없으면 표준 json 폴백
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+M = TypeVar("M", bound=BaseModel)
+
+_ORJSON_OPTS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def _default(obj: Any) -> Any:
+    # 표준 json 폴백용: orjson 과 같은 형태(ISO8601 문자열)로 맞춤
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID, Decimal)):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if isinstance(content, BaseModel):
+        # pydantic-core 직렬화기 (검증 없이 바로 JSON bytes)
+        return content.__pydantic_serializer__.to_json(content)
+    if orjson is not None:
+        return orjson.dumps(content, option=_ORJSON_OPTS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """앱 기본 응답 클래스 (FastAPI(default_response_class=...))"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def model_response(
+    model: Type[M],
+    data: Any,
+    *,
+    status_code: int = 200,
+    headers: Optional[dict] = None,
+) -> FastJSONResponse:
+    """
+    dict/모델 인스턴스를 한 번만 검증하고 바로 JSON bytes 로 직렬화.
+    Response 를 직접 반환하므로 FastAPI 의 response_model 재검증/jsonable_encoder 단계를 건너뜀
+    (response_model 은 OpenAPI 문서용으로 그대로 둠).
+    """
+    adapter = _adapter(model)
+    obj = data if isinstance(data, model) else adapter.validate_python(data)
+    resp = FastJSONResponse(content=None, status_code=status_code, headers=headers)
+    resp.body = adapter.dump_json(obj)
+    resp.headers["content-length"] = str(len(resp.body))
+    return resp
@@ -0,0 +1,114 @@
+# 요청 단위 구간(span) 시간 측정 → Server-Timing 헤더 + 라우트별 히스토그램
+
+from __future__ import annotations
+
+import functools
+import inspect
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+
+from backend.app.utils.metrics import HistogramFamily
+
+# route -> (span 이름 -> 히스토그램)
+_ROUTE_SPANS: Dict[str, HistogramFamily] = {}
+_MAX_ROUTES = 200
+
+_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("timing_spans", default=None)
+_TOKEN_RE = re.compile(r"[^A-Za-z0-9_.\-]")
+
+
+def record(name: str, duration_ms: float) -> None:
+    """현재 요청에 구간 시간 기록 (요청 밖에서는 무시)"""
+    spans = _spans.get()
+    if spans is not None:
+        spans.append((name, duration_ms))
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    사용 예)
+        with timing.span("weather"):
+            raw = await client.get_weather(code)
+    """
+    if _spans.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - started) * 1000.0)
+
+
+def timed(name: str) -> Callable:
+    """함수 전체를 span 으로 감싸는 데코레이터 (sync/async 모두 지원)"""
+
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def _route_family(route: str) -> HistogramFamily:
+    family = _ROUTE_SPANS.get(route)
+    if family is None:
+        if len(_ROUTE_SPANS) >= _MAX_ROUTES:
+            route = HistogramFamily.OTHER
+            family = _ROUTE_SPANS.get(route)
+        if family is None:
+            family = _ROUTE_SPANS.setdefault(route, HistogramFamily(max_labels=50))
+    return family
+
+
+def _server_timing_header(spans: List[Tuple[str, float]], total_ms: float) -> str:
+    # 같은 이름이 여러 번 기록되면 합산 (예: 루프 안의 span)
+    merged: Dict[str, float] = {}
+    for name, ms in spans:
+        key = _TOKEN_RE.sub("_", name) or "span"
+        merged[key] = merged.get(key, 0.0) + ms
+    parts = [f"{name};dur={ms:.1f}" for name, ms in merged.items()]
+    parts.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(parts)
+
+
+def register_server_timing(app: FastAPI) -> None:
+    @app.middleware("http")
+    async def server_timing(request: Request, call_next):
+        spans: List[Tuple[str, float]] = []
+        token = _spans.set(spans)
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            _spans.reset(token)
+        total_ms = (time.perf_counter() - started) * 1000.0
+
+        route = request.scope.get("route")
+        family = _route_family(f"{request.method} {getattr(route, 'path', None) or request.url.path}")
+        for name, ms in spans:
+            family.observe(name, ms)
+        family.observe("total", total_ms)
+
+        response.headers["Server-Timing"] = _server_timing_header(spans, total_ms)
+        return response
+
+
+def snapshot() -> Dict[str, Any]:
+    return {route: family.snapshot() for route, family in list(_ROUTE_SPANS.items())}
@@ -0,0 +1,325 @@
+# 부하 테스트용 대규모 합성 데이터 생성기
+#
+# 사용법 (프로젝트 루트에서):
+#   # SQL 모델 (DATABASE_URL 또는 DB_* 설정 대상) - 배치 스트리밍 INSERT
+#   python -m benchmarks.dataset --users 1000000 --plants 10000000 \
+#       --humidity 100000000 --diaries 3000000 --batch-size 20000
+#   # services/storage.py 인메모리 저장소는 프로세스 안에서만 유효 → HTTP 벤치마크가 직접 적재
+#   python -m benchmarks.http_bench --dataset 10000,100000
+#
+# 모든 행은 배치 단위 제너레이터로 만들어지므로 메모리 사용량은 --batch-size 에만 비례함.
+# 같은 --seed 면 같은 데이터가 생성됨.
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+Row = Dict[str, Any]
+
+NICKNAME_PREFIX = ["초코", "룰루", "레몬", "무화과", "피톤", "금빛", "행운", "올리브", "초록", "작은", "큰", "보송"]
+SPECIES = [
+    "몬스테라", "필로덴드론", "스킨답서스", "산세베리아", "칼라디움", "카랑코에", "금사철", "행운목",
+    "올리브나무", "고무나무", "스투키", "아레카야자", "테이블야자", "율마", "로즈마리", "선인장",
+]
+HASHTAGS = [
+    "#새잎", "#분갈이", "#물주기", "#햇빛", "#성장일기", "#반려식물", "#초보집사", "#식물스타그램",
+    "#병충해", "#꽃", "#가지치기", "#영양제", "#베란다", "#창가", "#행잉", "#수경재배",
+]
+WEATHER = ["맑음", "흐림", "비", "구름조금", "눈"]
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class DatasetSpec:
+    users: int = 1_000
+    plants: int = 10_000           # 사용자 당 평균 plants/users, 롱테일 분포
+    humidity: int = 100_000        # 식물 당 평균 humidity/plants, 시계열
+    diaries: int = 5_000           # 사용자 당 롱테일 분포
+    max_images_per_diary: int = 10
+    wiki_species: int = len(SPECIES)
+    batch_size: int = 10_000
+    seed: int = 42
+
+
+# -----------------------
+# 분포 헬퍼
+# -----------------------
+def _long_tail_counts(rng: random.Random, n_owners: int, total: int) -> Iterator[int]:
+    """
+    소유자 n명에게 총 total 개를 로그정규(롱테일) 분포로 배분해 순서대로 내보냄.
+    남은 양/남은 소유자로 평균을 매번 다시 잡아 합계가 정확히 total 이 되도록 함.
+    """
+    sigma = 1.0
+    remaining = total
+    for i in range(n_owners):
+        owners_left = n_owners - i
+        if owners_left == 1 or remaining <= 0:
+            k = max(remaining, 0)
+        else:
+            mean = remaining / owners_left
+            k = int(round(rng.lognormvariate(math.log(mean) - sigma * sigma / 2, sigma)))
+            k = min(k, remaining)
+        remaining -= k
+        yield k
+
+
+def _batched(rows: Iterator[Row], size: int) -> Iterator[List[Row]]:
+    batch: List[Row] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _user_id(i: int) -> str:
+    return f"user{i:08d}"
+
+
+# -----------------------
+# 행 제너레이터
+# -----------------------
+def gen_users(spec: DatasetSpec, password_hash: str) -> Iterator[Row]:
+    rng = random.Random(spec.seed)
+    for i in range(spec.users):
+        # 가입일: 최근일수록 많은 성장 곡선
+        days_ago = int(730 * (1 - math.sqrt(rng.random())))
+        yield {
+            "user_id": _user_id(i),
+            "user_pw": password_hash,
+            "email": f"{_user_id(i)}@example.com",
+            "hp": f"010-{i // 10000:04d}-{i % 10000:04d}",
+            "nickname": f"{rng.choice(NICKNAME_PREFIX)}{i}"[:20],
+            "regdate": (BASE_TIME - timedelta(days=days_ago)).replace(tzinfo=None),
+        }
+
+
+def gen_plants(spec: DatasetSpec) -> Iterator[Row]:
+    rng = random.Random(spec.seed + 1)
+    plant_id = 0
+    for u, k in enumerate(_long_tail_counts(rng, spec.users, spec.plants)):
+        for _ in range(k):
+            plant_id += 1
+            # 인기 종 쏠림 (Zipf 근사)
+            species = SPECIES[min(int(rng.paretovariate(1.2)) - 1, len(SPECIES) - 1)]
+            yield {
+                "user_id": _user_id(u),
+                "plant_id": plant_id,
+                "plant_name": f"{rng.choice(NICKNAME_PREFIX)}{species}",
+                "species": species,
+                "pest_id": rng.randint(1, 20) if rng.random() < 0.05 else None,
+                "meet_day": (BASE_TIME - timedelta(days=rng.randint(0, 1000))).replace(tzinfo=None),
+            }
+
+
+def gen_humidity(spec: DatasetSpec) -> Iterator[Row]:
+    """식물별 30분 간격 시계열 (일주기 + 물주기 후 감소 + 노이즈)"""
+    rng = random.Random(spec.seed + 2)
+    step = timedelta(minutes=30)
+    for idx, k in enumerate(_long_tail_counts(rng, spec.plants, spec.humidity)):
+        plant_id = idx + 1
+        level = rng.uniform(40, 70)
+        start = BASE_TIME.replace(tzinfo=None) - step * k
+        for j in range(k):
+            if level < 25 or rng.random() < 0.01:  # 물주기
+                level = rng.uniform(65, 85)
+            level -= rng.uniform(0.05, 0.25)
+            diurnal = 4.0 * math.sin(2 * math.pi * (j % 48) / 48)
+            yield {
+                "plant_id": plant_id,
+                "humid_date": start + step * j,
+                "humidity": round(min(100.0, max(0.0, level + diurnal + rng.gauss(0, 1.5))), 1),
+            }
+
+
+def gen_diaries(spec: DatasetSpec) -> Iterator[Row]:
+    """diary 행과 img_address 행을 함께 생성 (row["_table"] 로 구분)"""
+    rng = random.Random(spec.seed + 3)
+    diary_id = 0
+    image_idx = 0
+    for u, k in enumerate(_long_tail_counts(rng, spec.users, spec.diaries)):
+        for _ in range(k):
+            diary_id += 1
+            n_images = min(spec.max_images_per_diary, int(rng.expovariate(1 / 2.0)))
+            n_tags = min(len(HASHTAGS), int(rng.expovariate(1 / 2.5)))
+            created = (BASE_TIME - timedelta(minutes=rng.randint(0, 60 * 24 * 365))).replace(tzinfo=None)
+            first_url = f"/media/{created:%Y/%m/%d}/d{diary_id}-0.jpg" if n_images else None
+            yield {
+                "_table": "diary",
+                "diary_id": diary_id,
+                "user_id": _user_id(u),
+                "user_title": f"{created:%m월 %d일} 식물 일기",
+                "img_url": first_url,
+                "user_content": "오늘도 잘 자라고 있어요. " * rng.randint(1, 8),
+                "hashtag": " ".join(rng.sample(HASHTAGS, n_tags)) or None,
+                "plant_content": None,
+                "weather": rng.choice(WEATHER),
+                "created_at": created,
+            }
+            for n in range(n_images):
+                image_idx += 1
+                yield {
+                    "_table": "img_address",
+                    "idx": image_idx,
+                    "diary_id": diary_id,
+                    "img_url": f"/media/{created:%Y/%m/%d}/d{diary_id}-{n}.jpg",
+                }
+
+
+def gen_plant_wiki(spec: DatasetSpec) -> Iterator[Row]:
+    rng = random.Random(spec.seed + 4)
+    for i, species in enumerate(SPECIES[: spec.wiki_species]):
+        yield {
+            "species": species,
+            "wiki_img": f"/media/wiki/{i}.jpg",
+            "sunlight": rng.choice(["양지", "반양지", "반음지", "음지"]),
+            "watering": rng.randint(3, 21),
+            "flowering": rng.choice([None, "봄", "여름", "가을"]),
+            "fertilizer": rng.choice([None, "월 1회", "계절별"]),
+            "toxic": rng.choice([None, "반려동물 주의"]),
+        }
+
+
+# -----------------------
+# SQL 적재
+# -----------------------
+async def load_sql(spec: DatasetSpec, *, create_tables: bool = True) -> Dict[str, int]:
+    from sqlalchemy import insert
+
+    from backend.app.core import database
+    from backend.app.db.models import Diary, HumidInfo, ImgAddress, PlantWiki, User, UserPlant
+    from backend.app.utils.security import hash_password
+
+    if create_tables:
+        await database.create_all()
+    engine = database.get_engine()
+    counts: Dict[str, int] = {}
+
+    async def _stream(table_name: str, model, rows: Iterator[Row]) -> None:
+        started = time.perf_counter()
+        n = 0
+        for batch in _batched(rows, spec.batch_size):
+            async with engine.begin() as conn:
+                await conn.execute(insert(model), batch)
+            n += len(batch)
+            rate = n / max(time.perf_counter() - started, 1e-9)
+            print(f"\r{table_name:<12} {n:>12,} rows  {rate:>10,.0f} rows/s", end="", flush=True)
+        print()
+        counts[table_name] = counts.get(table_name, 0) + n
+
+    def _split(rows: Iterator[Row], table: str) -> Iterator[Row]:
+        for row in rows:
+            if row.pop("_table") == table:
+                yield row
+
+    pw = hash_password("bench-password")  # 모든 사용자 공통 (bcrypt 를 사용자마다 돌리지 않음)
+    await _stream("users", User, gen_users(spec, pw))
+    await _stream("plant_wiki", PlantWiki, gen_plant_wiki(spec))
+    await _stream("user_plant", UserPlant, gen_plants(spec))
+    await _stream("humid_info", HumidInfo, gen_humidity(spec))
+    # diary → img_address 순서 (FK): 같은 시드로 두 번 생성해 각각 스트리밍
+    await _stream("diary", Diary, _split(gen_diaries(spec), "diary"))
+    await _stream("img_address", ImgAddress, _split(gen_diaries(spec), "img_address"))
+    return counts
+
+
+# -----------------------
+# 인메모리 적재 (services/storage.py, 대시보드 스텁)
+# -----------------------
+def load_memory(spec: DatasetSpec) -> Dict[str, int]:
+    """
+    storage 의 사용자/식물 저장소와 dashboard_service 의 식물 요약 저장소를 채움.
+    (diary/humidity 는 인메모리 저장소가 없으므로 SQL 대상에서만 생성)
+    """
+    from backend.app.services import dashboard_service, storage
+    from backend.app.utils.security import hash_password
+
+    pw = hash_password("bench-password")
+    now = storage.utcnow_iso()
+    n_users = 0
+    for row in gen_users(spec, pw):
+        storage.add_user({
+            "id": row["user_id"],
+            "email": row["email"],
+            "nickname": row["nickname"],
+            "avatar_url": None,
+            "password_hash": pw,
+            "created_at": now,
+            "updated_at": now,
+        })
+        n_users += 1
+
+    n_plants = 0
+    for row in gen_plants(spec):
+        plant_id = f"plant-{row['plant_id']}"
+        created = row["meet_day"].replace(tzinfo=timezone.utc).isoformat()
+        # add_plant 는 매번 정렬하므로 대량 적재 시 목록에 직접 추가 후 마지막에 1회 정렬
+        storage._PLANTS_BY_USER.setdefault(row["user_id"], []).append({
+            "id": plant_id,
+            "user_id": row["user_id"],
+            "nickname": row["plant_name"],
+            "species_hint": row["species"],
+            "planted_at": created,
+            "location": None,
+            "created_at": created,
+            "updated_at": created,
+        })
+        dashboard_service._USER_PLANTS_DB.setdefault(row["user_id"], []).append({
+            "plant_id": plant_id,
+            "nickname": row["plant_name"],
+            "thumbnail_url": None,
+        })
+        n_plants += 1
+    for plants in storage._PLANTS_BY_USER.values():
+        plants.sort(key=lambda p: p.get("created_at", ""), reverse=True)
+    return {"users": n_users, "plants": n_plants}
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Pland synthetic dataset generator (SQL target)")
+    p.add_argument("--users", type=int, default=DatasetSpec.users)
+    p.add_argument("--plants", type=int, default=DatasetSpec.plants)
+    p.add_argument("--humidity", type=int, default=DatasetSpec.humidity)
+    p.add_argument("--diaries", type=int, default=DatasetSpec.diaries)
+    p.add_argument("--batch-size", type=int, default=DatasetSpec.batch_size)
+    p.add_argument("--seed", type=int, default=DatasetSpec.seed)
+    p.add_argument("--no-create", action="store_true", help="테이블 생성 생략")
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    spec = DatasetSpec(
+        users=args.users,
+        plants=args.plants,
+        humidity=args.humidity,
+        diaries=args.diaries,
+        batch_size=args.batch_size,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    from backend.app.core import database
+
+    async def _run() -> Dict[str, int]:
+        try:
+            return await load_sql(spec, create_tables=not args.no_create)
+        finally:
+            await database.dispose_engines()
+
+    counts = asyncio.run(_run())
+    print(f"done in {time.perf_counter() - started:.1f}s: {counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+# FastAPI app 을 ASGI 클라이언트로 프로세스 내에서 호출하는 HTTP 벤치마크
+#
+# 사용법 (프로젝트 루트에서):
+#   python -m benchmarks.http_bench                                   # 실행 + 결과 출력
+#   python -m benchmarks.http_bench --save-baseline                   # 결과를 기준선으로 저장
+#   python -m benchmarks.http_bench --max-regression 0.2              # 기준선 대비 20% 이상 느려지면 종료 코드 1
+#   python -m benchmarks.http_bench --scenarios dashboard.summary --concurrency 1,16
+#   python -m benchmarks.http_bench --dataset 10000,100000              # 인메모리 저장소에 사용자 1만/식물 10만 적재 후 측정
+#
+# DB 는 in-memory SQLite, 미디어는 임시 폴더를 사용하므로 외부 의존성 없이 실행됨.
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# app import 전에 환경 고정
+os.environ.setdefault("ENV", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("DB_CREATE_ALL", "true")
+os.environ.setdefault("MEDIA_ROOT", tempfile.mkdtemp(prefix="pland-bench-media-"))
+
+import httpx  # noqa: E402
+
+from backend.app.main import app  # noqa: E402
+from backend.app.utils.security import create_access_token  # noqa: E402
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "http.json"
+API = "/api/v1"
+
+# 1x1 PNG
+PNG_1PX = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360606060000000050001a5f645400000000049454e44ae426082"
+)
+
+
+@dataclass
+class BenchContext:
+    """시나리오 공통 상태 (setup 에서 채움)"""
+    email: str = "bench@example.com"
+    password: str = "bench-password"
+    user_id: str = ""
+    access_token: str = ""
+    image_token: str = ""   # images 라우터는 user_id 클레임을 요구
+    plant_id: str = ""
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def auth(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    @property
+    def image_auth(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.image_token}"}
+
+
+Scenario = Callable[[httpx.AsyncClient, BenchContext, int], Awaitable[httpx.Response]]
+
+
+# -----------------------
+# 시나리오
+# -----------------------
+async def _login(client: httpx.AsyncClient, ctx: BenchContext, i: int) -> httpx.Response:
+    return await client.post(f"{API}/auth/login", json={"email": ctx.email, "password": ctx.password})
+
+
+async def _dashboard_summary(client: httpx.AsyncClient, ctx: BenchContext, i: int) -> httpx.Response:
+    return await client.get(f"{API}/dashboard/summary", headers=ctx.auth)
+
+
+async def _plants_create(client: httpx.AsyncClient, ctx: BenchContext, i: int) -> httpx.Response:
+    return await client.post(f"{API}/plants", json={"nickname": f"plant-{i}"}, headers=ctx.auth)
+
+
+async def _plants_get(client: httpx.AsyncClient, ctx: BenchContext, i: int) -> httpx.Response:
+    return await client.get(f"{API}/plants/{ctx.plant_id}", headers=ctx.auth)
+
+
+async def _plants_patch(client: httpx.AsyncClient, ctx: BenchContext, i: int) -> httpx.Response:
+    return await client.patch(f"{API}/plants/{ctx.plant_id}", json={"location": f"shelf-{i % 5}"}, headers=ctx.auth)
+
+
+async def _images_upload(client: httpx.AsyncClient, ctx: BenchContext, i: int) -> httpx.Response:
+    return await client.post(
+        f"{API}/plants/{ctx.plant_id}/images",
+        files={"file": ("leaf.png", PNG_1PX, "image/png")},
+        data={"type": "diary"},
+        headers=ctx.image_auth,
+    )
+
+
+async def _images_list(client: httpx.AsyncClient, ctx: BenchContext, i: int) -> httpx.Response:
+    return await client.get(f"{API}/plants/{ctx.plant_id}/images", params={"limit": 20}, headers=ctx.image_auth)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "auth.login": _login,
+    "dashboard.summary": _dashboard_summary,
+    "plants.create": _plants_create,
+    "plants.get": _plants_get,
+    "plants.patch": _plants_patch,
+    "images.upload": _images_upload,
+    "images.list": _images_list,
+}
+
+
+async def setup(client: httpx.AsyncClient) -> BenchContext:
+    ctx = BenchContext()
+    r = await client.post(
+        f"{API}/auth/register", json={"email": ctx.email, "password": ctx.password, "nickname": "bench"}
+    )
+    r.raise_for_status()
+    ctx.user_id = r.json()["id"]
+    r = await _login(client, ctx, 0)
+    r.raise_for_status()
+    ctx.access_token = r.json()["access_token"]
+    ctx.image_token = create_access_token({"sub": ctx.user_id, "user_id": ctx.user_id})
+    r = await _plants_create(client, ctx, 0)
+    r.raise_for_status()
+    ctx.plant_id = r.json()["id"]
+    r = await _images_upload(client, ctx, 0)
+    r.raise_for_status()
+    return ctx
+
+
+# -----------------------
+# 측정
+# -----------------------
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: BenchContext,
+    scenario: Scenario,
+    *,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    for i in range(warmup):
+        await scenario(client, ctx, i)
+
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            t0 = time.perf_counter()
+            resp = await scenario(client, ctx, i)
+            latencies.append((time.perf_counter() - t0) * 1000.0)
+            if resp.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(requests / wall, 2) if wall else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50), 3),
+        "p95_ms": round(_percentile(latencies, 0.95), 3),
+        "p99_ms": round(_percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+async def run_all(names: List[str], concurrencies: List[int], requests: int, warmup: int) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            ctx = await setup(client)
+            for name in names:
+                results[name] = {}
+                for c in concurrencies:
+                    res = await run_scenario(
+                        client, ctx, SCENARIOS[name], requests=requests, concurrency=c, warmup=warmup
+                    )
+                    results[name][str(c)] = res
+                    print(
+                        f"{name:<20} c={c:<3} {res['throughput_rps']:>9.1f} req/s  "
+                        f"p50={res['p50_ms']:.2f}ms p95={res['p95_ms']:.2f}ms p99={res['p99_ms']:.2f}ms"
+                        + (f"  errors={res['errors']}" if res["errors"] else "")
+                    )
+    return {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "requests": requests,
+        },
+        "results": results,
+    }
+
+
+# -----------------------
+# 기준선 비교
+# -----------------------
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """p95 가 (1 + max_regression) 배를 넘거나 처리량이 (1 - max_regression) 배 미만이면 회귀"""
+    regressions: List[str] = []
+    for name, by_c in current["results"].items():
+        for c, cur in by_c.items():
+            base = baseline.get("results", {}).get(name, {}).get(c)
+            if not base:
+                continue
+            if base["p95_ms"] and cur["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+                regressions.append(f"{name} c={c}: p95 {base['p95_ms']:.2f}ms -> {cur['p95_ms']:.2f}ms")
+            if base["throughput_rps"] and cur["throughput_rps"] < base["throughput_rps"] * (1 - max_regression):
+                regressions.append(
+                    f"{name} c={c}: throughput {base['throughput_rps']:.1f} -> {cur['throughput_rps']:.1f} req/s"
+                )
+    return regressions
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Pland API in-process HTTP benchmark")
+    p.add_argument("--scenarios", default=",".join(SCENARIOS), help="콤마 구분 시나리오 이름")
+    p.add_argument("--concurrency", default="1,8,32", help="콤마 구분 동시성 단계")
+    p.add_argument("--requests", type=int, default=200, help="시나리오/동시성 단계 당 요청 수")
+    p.add_argument("--warmup", type=int, default=10)
+    p.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    p.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    p.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    p.add_argument("--max-regression", type=float, default=None, help="허용 회귀 비율 (예: 0.2)")
+    p.add_argument("--dataset", default=None, help="USERS,PLANTS - 측정 전 인메모리 저장소에 합성 데이터 적재")
+    p.add_argument("--seed", type=int, default=42, help="--dataset 생성 시드")
+    return p.parse_args(argv)
+
+
+def load_dataset(value: str, seed: int) -> Dict[str, int]:
+    """--dataset USERS,PLANTS → benchmarks.dataset.load_memory 로 같은 프로세스의 인메모리 저장소 적재"""
+    from benchmarks.dataset import DatasetSpec, load_memory
+
+    users, plants = (int(x) for x in value.split(","))
+    started = time.perf_counter()
+    counts = load_memory(DatasetSpec(users=users, plants=plants, seed=seed))
+    print(f"dataset loaded in {time.perf_counter() - started:.1f}s: {counts}")
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        print(f"unknown scenarios: {unknown} (available: {list(SCENARIOS)})", file=sys.stderr)
+        return 2
+    concurrencies = [int(c) for c in args.concurrency.split(",") if c.strip()]
+
+    dataset: Optional[Dict[str, int]] = None
+    if args.dataset:
+        try:
+            dataset = load_dataset(args.dataset, args.seed)
+        except ValueError:
+            print(f"--dataset must be USERS,PLANTS (got {args.dataset!r})", file=sys.stderr)
+            return 2
+
+    report = asyncio.run(run_all(names, concurrencies, args.requests, args.warmup))
+    report["meta"]["dataset"] = dataset  # 기준선 비교 시 같은 규모인지 확인용
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"baseline saved: {args.baseline}")
+
+    if args.max_regression is not None:
+        if not args.baseline.exists():
+            print(f"baseline not found: {args.baseline}", file=sys.stderr)
+            return 2
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.max_regression)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nno regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
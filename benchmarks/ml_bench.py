@@ -0,0 +1,538 @@
+# ml/ 추론 경로 마이크로 벤치마크 (모델 버전/런타임 설정 비교용)
+#
+# 사용법 (프로젝트 루트에서):
+#   python -m benchmarks.ml_bench                                        # 설정된 모델로 species/pest/llm 측정
+#   python -m benchmarks.ml_bench --synthetic-models                     # 모델 파일 없이 (시드 고정 npz 헤드)
+#   python -m benchmarks.ml_bench --targets species --batch-sizes 1,8,32 --threads 1,4
+#   python -m benchmarks.ml_bench --images ./corpus --prompts prompts.txt --output reports/v2.json
+#   python -m benchmarks.ml_bench --save-baseline                        # benchmarks/baselines/ml.json
+#   python -m benchmarks.ml_bench --max-regression 0.2                   # 기준선 대비 20% 이상 악화 시 종료 코드 1
+#   python -m benchmarks.ml_bench --profile ml.prof                      # cProfile 결과 저장 (snakeviz 등으로 확인)
+#
+# - 이미지 코퍼스: --images 폴더 (jpg/png, 경로 순) 또는 시드 고정 합성 이미지 (크기/형식 혼합)
+#   파일은 미리 메모리에 읽어 두고 업로드 버퍼와 같은 bytes 에서 측정 (디스크 I/O 제외)
+# - 단계별 지연: decode / preprocess(리사이즈+정규화+배치) / infer / postprocess (배치 단위 p50/p95, 이미지당 평균)
+# - 배치 크기 x 스레드 수 조합마다 처리량(img/s)과 측정 구간의 최대 RSS
+# - 리포트의 meta 에 코퍼스 digest/모델 버전/라이브러리 버전을 남겨 같은 조건끼리만 비교
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import hashlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from backend.app.core.config import settings
+from backend.app.ml import plant_llm
+from backend.app.ml.pest_diagnosis import load_pest_model
+from backend.app.ml.preprocess import PreparedImage, make_batch
+from backend.app.ml.registry import file_version, models_root, registry, rss_bytes
+from backend.app.ml.species_classification import _softmax, load_species_model, rank_labels
+
+try:
+    from PIL import Image
+except Exception:  # pragma: no cover
+    Image = None  # type: ignore
+
+try:
+    from threadpoolctl import threadpool_limits
+except Exception:  # pragma: no cover
+    threadpool_limits = None  # type: ignore
+
+try:
+    import onnxruntime as ort
+except Exception:  # pragma: no cover
+    ort = None  # type: ignore
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "ml.json"
+TARGETS = ("species", "pest", "llm")
+IMAGE_EXTS = {".jpg", ".jpeg", ".png"}
+STAGES = ("decode", "preprocess", "infer", "postprocess")
+
+# 고정 프롬프트 코퍼스 (질문, 참고 자료, 식물 종)
+PROMPTS = [
+    ("잎 끝이 갈색으로 말라요. 물을 더 줘야 하나요?", ["몬스테라 - 햇빛: 밝은 간접광, 물주기: 7일마다"], "몬스테라"),
+    ("겨울에는 물을 얼마나 자주 줘야 하나요?", ["스킨답서스 - 햇빛: 반음지, 물주기: 10일마다"], "스킨답서스"),
+    ("잎 뒷면에 하얀 솜 같은 벌레가 있어요.", ["병해충 3 - 원인: 깍지벌레, 대처: 알코올 솜으로 닦고 격리"], None),
+    ("분갈이는 언제 하는 게 좋나요?", [], "고무나무"),
+    ("햇빛이 부족하면 어떤 증상이 나타나나요?", ["산세베리아 - 햇빛: 양지~반음지, 물주기: 20일마다"], "산세베리아"),
+    ("새 잎이 노랗게 나와요.", ["필로덴드론 - 햇빛: 밝은 간접광, 물주기: 7일마다, 비료: 봄~가을 월 1회"], "필로덴드론"),
+    ("고양이가 잎을 씹었는데 괜찮을까요?", ["몬스테라 - 독성: 반려동물에 독성 있음"], "몬스테라"),
+    ("잎에 검은 반점이 번지고 있어요.", ["병해충 7 - 원인: 탄저병, 대처: 병든 잎 제거 후 살균제"], None),
+]
+
+
+# -----------------------
+# Corpus / models
+# -----------------------
+def synthetic_images(count: int, seed: int) -> List[bytes]:
+    """시드 고정 합성 사진 (그라디언트 + 노이즈, 휴대폰 사진 크기 포함, JPEG/PNG 혼합)"""
+    if Image is None:
+        raise RuntimeError("Pillow is not installed")
+    rng = np.random.default_rng(seed)
+    sizes = [(640, 480), (1280, 960), (4032, 3024), (800, 800)]
+    out: List[bytes] = []
+    for i in range(count):
+        w, h = sizes[i % len(sizes)]
+        y, x = np.mgrid[0:h, 0:w].astype(np.float32)
+        base = np.stack([x / w * 255, y / h * 255, (x + y) / (w + h) * 255], axis=-1)
+        noise = rng.normal(0, 12, size=(h // 8 + 1, w // 8 + 1, 3)).repeat(8, 0).repeat(8, 1)[:h, :w]
+        arr = np.clip(base + noise, 0, 255).astype(np.uint8)
+        buf = io.BytesIO()
+        if i % 5 == 4:
+            Image.fromarray(arr).save(buf, "PNG")
+        else:
+            Image.fromarray(arr).save(buf, "JPEG", quality=90)
+        out.append(buf.getvalue())
+    return out
+
+
+def load_images(folder: Path) -> List[bytes]:
+    paths = sorted(p for p in folder.rglob("*") if p.suffix.lower() in IMAGE_EXTS)
+    return [p.read_bytes() for p in paths]
+
+
+def load_prompts(path: Optional[Path]) -> List[tuple]:
+    if path is None:
+        return PROMPTS
+    return [(ln.strip(), [], None) for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+
+
+def corpus_digest(images: Sequence[bytes], prompts: Sequence[tuple]) -> str:
+    h = hashlib.sha256()
+    for data in images:
+        h.update(hashlib.sha256(data).digest())
+    h.update(json.dumps(prompts, ensure_ascii=False).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def write_synthetic_models(folder: Path, seed: int) -> Dict[str, Path]:
+    """모델 파일이 없는 환경용 NumPy 헤드 (species: 라벨 50개, pest: 클래스 8개)"""
+    rng = np.random.default_rng(seed)
+    s, p = settings.SPECIES_INPUT_SIZE, settings.PEST_INPUT_SIZE
+    species = folder / "species-synthetic.npz"
+    np.savez(
+        species,
+        W=(rng.standard_normal((3 * s * s, 50), dtype=np.float32) * 0.01),
+        b=np.zeros(50, dtype=np.float32),
+        labels=np.array([f"species-{i}" for i in range(50)]),
+    )
+    pest = folder / "pest-synthetic.npz"
+    np.savez(
+        pest,
+        W=(rng.standard_normal((3 * p * p, 8), dtype=np.float32) * 0.01),
+        b=np.zeros(8, dtype=np.float32),
+        pest_ids=np.arange(1, 9),
+    )
+    return {"species": species, "pest": pest}
+
+
+# -----------------------
+# Measurement
+# -----------------------
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+class PeakRss:
+    """측정 구간 동안 RSS 를 주기적으로 읽어 최대값 기록"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.start = self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, rss_bytes())
+
+    def __enter__(self) -> "PeakRss":
+        self.start = self.peak = rss_bytes()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_bytes())
+
+
+@dataclass
+class StageTimes:
+    """배치 단위 단계별 시간(ms)"""
+    items: int = 0
+    batches: int = 0
+    stages: Dict[str, List[float]] = field(default_factory=lambda: {s: [] for s in STAGES})
+    totals: List[float] = field(default_factory=list)
+
+    def add(self, n: int, **ms: float) -> None:
+        self.items += n
+        self.batches += 1
+        for stage, value in ms.items():
+            self.stages[stage].append(value)
+        self.totals.append(sum(ms.values()))
+
+    def summary(self) -> Dict[str, Any]:
+        wall = sum(self.totals)
+        stages: Dict[str, Any] = {}
+        for stage, values in self.stages.items():
+            if not values:
+                continue
+            ordered = sorted(values)
+            stages[stage] = {
+                "per_item_ms": round(sum(values) / self.items, 4),
+                "p50_ms": round(_percentile(ordered, 0.50), 4),
+                "p95_ms": round(_percentile(ordered, 0.95), 4),
+                "share": round(sum(values) / wall, 4) if wall else 0.0,
+            }
+        ordered = sorted(self.totals)
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "throughput_per_s": round(self.items / (wall / 1000.0), 2) if wall else 0.0,
+            "p50_ms": round(_percentile(ordered, 0.50), 4),
+            "p95_ms": round(_percentile(ordered, 0.95), 4),
+            "stages": stages,
+        }
+
+
+def _ms(t0: float) -> float:
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+@contextmanager
+def _threads(n: int) -> Iterator[str]:
+    """추론 스레드 수 적용. onnxruntime 은 세션 옵션(재로드), NumPy BLAS 는 threadpoolctl (설치된 경우)."""
+    prev = settings.ML_INTRA_OP_THREADS
+    settings.ML_INTRA_OP_THREADS = n
+    ctx = threadpool_limits(limits=n) if threadpool_limits is not None and n > 0 else nullcontext()
+    try:
+        with ctx:
+            yield "threadpoolctl" if threadpool_limits is not None else "session-only"
+    finally:
+        settings.ML_INTRA_OP_THREADS = prev
+
+
+def _load(name: str) -> Dict[str, Any]:
+    registry.unload(name)  # 스레드 설정 반영을 위해 매번 새로 로드
+    registry.get(name)
+    info = registry.stats()["models"][name]
+    return {"version": info.get("version"), "load_ms": info.get("load_ms"), "rss_delta_bytes": info.get("rss_delta_bytes")}
+
+
+# -----------------------
+# Targets
+# -----------------------
+def bench_species(images: Sequence[bytes], batch: int, repeat: int, top_k: int = 3) -> StageTimes:
+    model = registry.get("species")
+    size = settings.SPECIES_INPUT_SIZE
+    buffer = np.empty((batch, 3, size, size), dtype=np.float32)
+    times = StageTimes()
+    for _ in range(repeat):
+        for chunk in _chunks(images, batch):
+            t0 = time.perf_counter()
+            prepared = [PreparedImage.decode(data, size) for data in chunk]
+            decode = _ms(t0)
+            t0 = time.perf_counter()
+            x = make_batch(prepared, size, out=buffer)
+            preprocess = _ms(t0)
+            t0 = time.perf_counter()
+            logits = np.asarray(model.runtime(x), dtype=np.float32)
+            infer = _ms(t0)
+            t0 = time.perf_counter()
+            probs = _softmax(logits)
+            for row in probs:
+                rank_labels(row, model.labels, top_k)
+            times.add(len(chunk), decode=decode, preprocess=preprocess, infer=infer, postprocess=_ms(t0))
+    return times
+
+
+def bench_pest(images: Sequence[bytes], batch: int, repeat: int) -> StageTimes:
+    detector = registry.get("pest")
+    size = detector.input_size
+    buffer = np.empty((batch, 3, size, size), dtype=np.float32)
+    times = StageTimes()
+    for _ in range(repeat):
+        for chunk in _chunks(images, batch):
+            t0 = time.perf_counter()
+            prepared = [PreparedImage.decode(data, size) for data in chunk]
+            decode = _ms(t0)
+            t0 = time.perf_counter()
+            x = make_batch(prepared, size, out=buffer)
+            preprocess = _ms(t0)
+            t0 = time.perf_counter()
+            out = detector.forward(x)
+            infer = _ms(t0)
+            t0 = time.perf_counter()
+            for row in out:
+                detector.postprocess(row)
+            times.add(len(chunk), decode=decode, preprocess=preprocess, infer=infer, postprocess=_ms(t0))
+    return times
+
+
+def bench_llm(prompts: Sequence[tuple], repeat: int, max_tokens: int) -> Dict[str, Any]:
+    """프롬프트 1개 = 1배치. preprocess = 프롬프트 조립, infer = 토큰 생성 (첫 토큰 시간/토큰 처리량 별도)."""
+    llm = plant_llm.get_llm()
+    times = StageTimes()
+    ttft: List[float] = []
+    tokens = 0
+    infer_ms = 0.0
+    for _ in range(repeat):
+        for question, context, species in prompts:
+            t0 = time.perf_counter()
+            prompt = plant_llm.build_prompt(question, list(context), species)
+            preprocess = _ms(t0)
+            t0 = time.perf_counter()
+            pieces: List[str] = []
+            for piece in llm.generate(prompt, max_tokens=max_tokens, stop=threading.Event()):
+                if not pieces:
+                    ttft.append(_ms(t0))
+                pieces.append(piece)
+            infer = _ms(t0)
+            t0 = time.perf_counter()
+            "".join(pieces).strip()
+            times.add(1, preprocess=preprocess, infer=infer, postprocess=_ms(t0))
+            tokens += len(pieces)
+            infer_ms += infer
+    ttft.sort()
+    res = times.summary()
+    res["tokens"] = tokens
+    res["tokens_per_s"] = round(tokens / (infer_ms / 1000.0), 2) if infer_ms else 0.0
+    res["ttft_p50_ms"] = round(_percentile(ttft, 0.50), 4)
+    res["ttft_p95_ms"] = round(_percentile(ttft, 0.95), 4)
+    return res
+
+
+# -----------------------
+# Run
+# -----------------------
+def run_all(
+    targets: List[str],
+    images: List[bytes],
+    prompts: List[tuple],
+    batch_sizes: List[int],
+    threads: List[int],
+    repeat: int,
+    warmup: int,
+    llm_max_tokens: int,
+) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+    models: Dict[str, Any] = {}
+    for target in targets:
+        results[target] = {}
+        for t in threads:
+            with _threads(t) as thread_control:
+                if target == "llm":
+                    if settings.LLM_MODEL:
+                        models[target] = _load("llm")
+                    else:
+                        models[target] = {"version": "local-stand-in"}
+                    bench_llm(prompts[:warmup], 1, llm_max_tokens)
+                    with PeakRss() as rss:
+                        res = bench_llm(prompts, repeat, llm_max_tokens)
+                    res["peak_rss_mb"] = round(rss.peak / 2**20, 2)
+                    res["thread_control"] = thread_control
+                    results[target][f"t={t}"] = res
+                    print(
+                        f"{target:<8} t={t:<3}       {res['tokens_per_s']:>9.1f} tok/s  "
+                        f"ttft p50={res['ttft_p50_ms']:.1f}ms  rss={res['peak_rss_mb']:.0f}MB"
+                    )
+                    continue
+
+                models[target] = _load(target)
+                bench = bench_species if target == "species" else bench_pest
+                for b in batch_sizes:
+                    bench(images[: max(warmup, b)], b, 1)
+                    with PeakRss() as rss:
+                        res = bench(images, b, repeat).summary()
+                    res["peak_rss_mb"] = round(rss.peak / 2**20, 2)
+                    res["thread_control"] = thread_control
+                    results[target][f"t={t},b={b}"] = res
+                    st = res["stages"]
+                    print(
+                        f"{target:<8} t={t:<3} b={b:<4} {res['throughput_per_s']:>9.1f} img/s  "
+                        + "  ".join(f"{s}={st[s]['per_item_ms']:.2f}ms" for s in STAGES if s in st)
+                        + f"  rss={res['peak_rss_mb']:.0f}MB"
+                    )
+    return {"models": models, "results": results}
+
+
+def _model_meta(paths: Dict[str, Path]) -> Dict[str, Any]:
+    return {name: {"path": str(path), "version": file_version(path) if path.exists() else None} for name, path in paths.items()}
+
+
+# -----------------------
+# 기준선 비교
+# -----------------------
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """같은 케이스끼리 p95 가 (1 + max_regression) 배를 넘거나 처리량이 (1 - max_regression) 배 미만이면 회귀"""
+    regressions: List[str] = []
+    for target, cases in current["results"].items():
+        for case, cur in cases.items():
+            base = baseline.get("results", {}).get(target, {}).get(case)
+            if not base:
+                continue
+            if base["p95_ms"] and cur["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+                regressions.append(f"{target} {case}: p95 {base['p95_ms']:.2f}ms -> {cur['p95_ms']:.2f}ms")
+            if base["throughput_per_s"] and cur["throughput_per_s"] < base["throughput_per_s"] * (1 - max_regression):
+                regressions.append(
+                    f"{target} {case}: throughput {base['throughput_per_s']:.1f} -> {cur['throughput_per_s']:.1f}/s"
+                )
+    return regressions
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Pland ML inference micro-benchmark")
+    p.add_argument("--targets", default=",".join(TARGETS), help="콤마 구분 (species,pest,llm)")
+    p.add_argument("--images", type=Path, default=None, help="이미지 코퍼스 폴더 (없으면 합성 이미지)")
+    p.add_argument("--synthetic-count", type=int, default=32, help="합성 이미지 수")
+    p.add_argument("--prompts", type=Path, default=None, help="프롬프트 파일 (한 줄에 질문 하나)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--species-model", default=None, help="ML_MODELS_DIR 기준 (기본: SPECIES_MODEL)")
+    p.add_argument("--pest-model", default=None, help="ML_MODELS_DIR 기준 (기본: PEST_MODEL)")
+    p.add_argument("--llm-model", default=None, help="ML_MODELS_DIR 기준 .gguf (기본: LLM_MODEL)")
+    p.add_argument("--synthetic-models", action="store_true", help="시드 고정 npz 헤드로 species/pest 측정")
+    p.add_argument("--batch-sizes", default="1,4,16")
+    p.add_argument("--threads", default="1", help="콤마 구분 추론 스레드 수 (0 = 런타임 기본값)")
+    p.add_argument("--repeat", type=int, default=3, help="코퍼스 반복 횟수")
+    p.add_argument("--warmup", type=int, default=4, help="케이스마다 먼저 버리는 항목 수")
+    p.add_argument("--llm-max-tokens", type=int, default=64)
+    p.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    p.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    p.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    p.add_argument("--max-regression", type=float, default=None, help="허용 회귀 비율 (예: 0.2)")
+    p.add_argument("--profile", type=Path, default=None, help="cProfile 결과(.prof) 저장 경로")
+    return p.parse_args(argv)
+
+
+def _resolve(path: str) -> Path:
+    p = Path(path)
+    return p if p.is_absolute() else models_root() / p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        print(f"unknown targets: {unknown} (available: {list(TARGETS)})", file=sys.stderr)
+        return 2
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",") if b.strip()]
+    threads = [int(t) for t in args.threads.split(",") if t.strip()]
+
+    tmp = tempfile.TemporaryDirectory(prefix="pland-ml-bench-")
+    if args.synthetic_models:
+        paths = write_synthetic_models(Path(tmp.name), args.seed)
+    else:
+        paths = {
+            "species": _resolve(args.species_model or settings.SPECIES_MODEL),
+            "pest": _resolve(args.pest_model or settings.PEST_MODEL),
+        }
+    registry.register("species", load_species_model, paths["species"])
+    registry.register("pest", load_pest_model, paths["pest"])
+    if args.llm_model:
+        settings.LLM_MODEL = args.llm_model
+        plant_llm.register_model()
+    if settings.LLM_MODEL:
+        paths["llm"] = _resolve(settings.LLM_MODEL)
+    missing = [t for t in targets if t in paths and not paths[t].exists()]
+    if missing:
+        print(f"model not found: {[str(paths[t]) for t in missing]} (use --synthetic-models)", file=sys.stderr)
+        return 2
+
+    images = load_images(args.images) if args.images else synthetic_images(args.synthetic_count, args.seed)
+    prompts = load_prompts(args.prompts)
+    if not images and set(targets) & {"species", "pest"}:
+        print(f"no images in {args.images}", file=sys.stderr)
+        return 2
+
+    profiler = cProfile.Profile() if args.profile else None
+    started = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    if profiler is not None:
+        profiler.enable()
+    try:
+        run = run_all(
+            targets, images, prompts, batch_sizes, threads, args.repeat, args.warmup, args.llm_max_tokens
+        )
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(str(args.profile))
+            print(f"profile saved: {args.profile}")
+        tmp.cleanup()
+
+    models_meta = _model_meta(paths)
+    for name, info in run["models"].items():
+        models_meta.setdefault(name, {}).update(info)
+    report = {
+        "meta": {
+            "created_at": started,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "onnxruntime": getattr(ort, "__version__", None),
+            "corpus": {
+                "digest": corpus_digest(images, prompts),
+                "images": len(images),
+                "prompts": len(prompts),
+                "source": str(args.images) if args.images else f"synthetic(seed={args.seed})",
+            },
+            "models": models_meta,
+            "repeat": args.repeat,
+        },
+        "results": run["results"],
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"baseline saved: {args.baseline}")
+
+    if args.max_regression is not None:
+        if not args.baseline.exists():
+            print(f"baseline not found: {args.baseline}", file=sys.stderr)
+            return 2
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("meta", {}).get("corpus", {}).get("digest") != report["meta"]["corpus"]["digest"]:
+            print("warning: corpus differs from baseline, results may not be comparable", file=sys.stderr)
+        regressions = compare(report, baseline, args.max_regression)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nno regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+# S3 호환 저장소 로컬 대역 (MinIO 없이 S3Backend / presigned 직접 업로드 확인용)
+#
+# 사용법 (프로젝트 루트에서):
+#   python -m benchmarks.s3_standin --port 9000                       # http://127.0.0.1:9000 에서 대기
+#   MEDIA_BACKEND=s3 S3_ENDPOINT_URL=http://127.0.0.1:9000 S3_BUCKET=pland \
+#     S3_ACCESS_KEY=minioadmin S3_SECRET_KEY=minioadmin uvicorn backend.app.main:app
+#
+# 프로세스 내에서 쓸 때는 httpx.WSGITransport(app=S3StandIn(...)) 를 S3Backend(transport=...) 에 전달.
+# path-style(/<bucket>/<key>) PUT(복사 포함)/GET(Range)/HEAD/DELETE 만 지원, 객체는 메모리에 보관.
+# 헤더 서명과 presigned URL(쿼리 서명, 만료, 서명된 Content-Length) 을 실제 S3 처럼 검증하므로
+# 서명 계산이 틀리면 여기서 403 으로 드러남.
+# --public-read 면 서명 없는 GET/HEAD 도 허용 (공개 읽기 버킷 → 이미지 메타의 url 을 바로 받는지 확인).
+
+from __future__ import annotations
+
+import argparse
+import hmac
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote
+from xml.sax.saxutils import escape
+
+from backend.app.services.media_backend import UNSIGNED_PAYLOAD, sigv4_signature
+
+_STATUS = {
+    200: "200 OK",
+    204: "204 No Content",
+    206: "206 Partial Content",
+    400: "400 Bad Request",
+    403: "403 Forbidden",
+    404: "404 Not Found",
+    405: "405 Method Not Allowed",
+    416: "416 Range Not Satisfiable",
+}
+
+
+class S3StandIn:
+    def __init__(
+        self,
+        *,
+        access_key: str = "minioadmin",
+        secret_key: str = "minioadmin",
+        region: str = "us-east-1",
+        public_read: bool = False,
+    ):
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.public_read = public_read
+        self.objects: Dict[Tuple[str, str], Tuple[bytes, str]] = {}  # (bucket, key) -> (data, content-type)
+        self.requests: List[Tuple[str, str]] = []  # (method, path) 호출 기록
+
+    # ---- WSGI ----
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO", "")
+        self.requests.append((method, path))
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+
+        anonymous = "HTTP_AUTHORIZATION" not in environ and "X-Amz-Signature" not in environ.get("QUERY_STRING", "")
+        if self.public_read and anonymous and method in ("GET", "HEAD"):
+            error = None
+        else:
+            error = self._authorize(environ, method, path, len(body))
+        if error is not None:
+            return self._error(start_response, 403, *error)
+
+        bucket, _, key = path.lstrip("/").partition("/")
+        if not bucket or not key:
+            return self._error(start_response, 400, "InvalidRequest", "path-style /<bucket>/<key> only")
+        obj = self.objects.get((bucket, key))
+
+        if method == "PUT" and environ.get("HTTP_X_AMZ_COPY_SOURCE"):  # CopyObject
+            src_bucket, _, src_key = unquote(environ["HTTP_X_AMZ_COPY_SOURCE"]).lstrip("/").partition("/")
+            src = self.objects.get((src_bucket, src_key))
+            if src is None:
+                return self._error(start_response, 404, "NoSuchKey", src_key)
+            self.objects[(bucket, key)] = src
+            return self._reply(start_response, 200, b"<CopyObjectResult/>", {"Content-Type": "application/xml"})
+        if method == "PUT":
+            self.objects[(bucket, key)] = (body, environ.get("CONTENT_TYPE") or "application/octet-stream")
+            return self._reply(start_response, 200, b"", {"ETag": f'"{len(body)}"'})
+        if method == "DELETE":
+            self.objects.pop((bucket, key), None)
+            return self._reply(start_response, 204, b"")
+        if method not in ("GET", "HEAD"):
+            return self._error(start_response, 405, "MethodNotAllowed", method)
+        if obj is None:
+            return self._error(start_response, 404, "NoSuchKey", key, head=method == "HEAD")
+        data, content_type = obj
+        headers = {"Content-Type": content_type, "Accept-Ranges": "bytes"}
+        if method == "HEAD":
+            headers["Content-Length"] = str(len(data))
+            start_response(_STATUS[200], list(headers.items()))
+            return [b""]
+        rng = environ.get("HTTP_RANGE")
+        if rng:
+            parsed = self._range(rng, len(data))
+            if parsed is None:
+                return self._error(start_response, 416, "InvalidRange", rng)
+            start, end = parsed
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+            return self._reply(start_response, 206, data[start : end + 1], headers)
+        return self._reply(start_response, 200, data, headers)
+
+    # ---- auth ----
+    def _authorize(self, environ: dict, method: str, path: str, body_len: int) -> Optional[Tuple[str, str]]:
+        query = dict(parse_qsl(environ.get("QUERY_STRING", ""), keep_blank_values=True))
+        headers = {k[5:].replace("_", "-").lower(): v for k, v in environ.items() if k.startswith("HTTP_")}
+        if "CONTENT_TYPE" in environ:
+            headers["content-type"] = environ["CONTENT_TYPE"]
+        if "CONTENT_LENGTH" in environ and environ["CONTENT_LENGTH"] != "":
+            headers["content-length"] = environ["CONTENT_LENGTH"]
+
+        if "X-Amz-Signature" in query:  # presigned URL
+            signature = query.pop("X-Amz-Signature")
+            credential = query.get("X-Amz-Credential", "")
+            amz_date = query.get("X-Amz-Date", "")
+            signed = query.get("X-Amz-SignedHeaders", "").split(";")
+            try:
+                issued = datetime.strptime(amz_date, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc).timestamp()
+                expires = int(query.get("X-Amz-Expires", "0"))
+            except ValueError:
+                return "AuthorizationQueryParametersError", "bad X-Amz-Date/X-Amz-Expires"
+            if time.time() > issued + expires:
+                return "AccessDenied", "Request has expired"
+        else:
+            auth = headers.get("authorization", "")
+            if not auth.startswith("AWS4-HMAC-SHA256 "):
+                return "AccessDenied", "missing signature"
+            fields = dict(part.strip().split("=", 1) for part in auth[len("AWS4-HMAC-SHA256 ") :].split(","))
+            credential = fields.get("Credential", "")
+            signed = fields.get("SignedHeaders", "").split(";")
+            signature = fields.get("Signature", "")
+            amz_date = headers.get("x-amz-date", "")
+
+        if credential.split("/", 1)[0] != self.access_key:
+            return "InvalidAccessKeyId", "unknown access key"
+        if "content-length" in signed and headers.get("content-length") != str(body_len):
+            return "SignatureDoesNotMatch", "content-length mismatch"
+        if any(h not in headers for h in signed):
+            return "SignatureDoesNotMatch", "signed header missing"
+        expected = sigv4_signature(
+            method=method,
+            path=path,
+            query=query,
+            headers=headers,
+            signed_headers=signed,
+            payload_hash=headers.get("x-amz-content-sha256", UNSIGNED_PAYLOAD),
+            amz_date=amz_date,
+            region=self.region,
+            secret_key=self.secret_key,
+        )
+        if not hmac.compare_digest(expected, signature):
+            return "SignatureDoesNotMatch", "signature does not match"
+        return None
+
+    # ---- helpers ----
+    @staticmethod
+    def _range(value: str, size: int) -> Optional[Tuple[int, int]]:
+        if not value.startswith("bytes="):
+            return None
+        first, _, last = value[6:].partition("-")
+        try:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        except ValueError:
+            return None
+        if start >= size or end < start:
+            return None
+        return start, end
+
+    @staticmethod
+    def _reply(start_response: Callable, code: int, body: bytes, headers: Optional[Dict[str, str]] = None) -> List[bytes]:
+        hdrs = dict(headers or {})
+        hdrs["Content-Length"] = str(len(body))
+        start_response(_STATUS[code], list(hdrs.items()))
+        return [body]
+
+    def _error(self, start_response: Callable, code: int, s3_code: str, message: str, *, head: bool = False) -> List[bytes]:
+        body = (
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<Error><Code>{escape(s3_code)}</Code>'
+            f"<Message>{escape(message)}</Message></Error>"
+        ).encode("utf-8")
+        return self._reply(start_response, code, b"" if head else body, {"Content-Type": "application/xml"})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from wsgiref.simple_server import make_server
+
+    parser = argparse.ArgumentParser(description="in-memory S3 compatible stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--access-key", default="minioadmin")
+    parser.add_argument("--secret-key", default="minioadmin")
+    parser.add_argument("--region", default="us-east-1")
+    parser.add_argument("--public-read", action="store_true", help="allow unsigned GET/HEAD")
+    args = parser.parse_args(argv)
+
+    app = S3StandIn(
+        access_key=args.access_key, secret_key=args.secret_key, region=args.region, public_read=args.public_read
+    )
+    with make_server(args.host, args.port, app) as server:
+        print(f"s3 stand-in listening on http://{args.host}:{args.port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())